@@ -0,0 +1,70 @@
+"""
+bench_csv_engines.py: Compare the default and pyarrow CSV engines of load_data on a generated wide CSV.
+
+Usage:
+    python benchmarks/bench_csv_engines.py --rows 200000 --columns 200
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from datacleancraft.ingestion.reader import load_data
+
+
+def generate_wide_csv(path: Path, rows: int, columns: int, seed: int = 0) -> None:
+    """
+    Write a CSV with a mix of integer, float and low-cardinality string columns.
+    """
+    rng = np.random.default_rng(seed)
+    data = {}
+    for i in range(columns):
+        kind = i % 3
+        if kind == 0:
+            data[f"int_{i}"] = rng.integers(0, 1_000_000, size=rows)
+        elif kind == 1:
+            data[f"float_{i}"] = rng.random(rows) * 1000
+        else:
+            data[f"str_{i}"] = rng.choice(["alpha", "beta", "gamma", "delta", "epsilon"], size=rows)
+    pd.DataFrame(data).to_csv(path, index=False)
+
+
+def time_engine(path: Path, engine: str, repeat: int) -> float:
+    """
+    Return the best wall-clock time in seconds over ``repeat`` full reads.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        df = load_data(path, engine=engine)
+        best = min(best, time.perf_counter() - start)
+        del df
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--columns", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "wide.csv"
+        generate_wide_csv(path, args.rows, args.columns)
+        size_mb = path.stat().st_size / 1e6
+        print(f"Generated {args.rows} x {args.columns} CSV ({size_mb:.1f} MB)")
+
+        results = {engine: time_engine(path, engine, args.repeat) for engine in ("c", "pyarrow")}
+
+    for engine, seconds in results.items():
+        print(f"{engine:>8}: {seconds:7.3f}s  {size_mb / seconds:8.1f} MB/s")
+    print(f"speedup: {results['c'] / results['pyarrow']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
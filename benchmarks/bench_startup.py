@@ -0,0 +1,53 @@
+"""
+bench_startup.py: Measure the import time of datacleancraft entry points and the heavy dependencies they load.
+
+Each module is imported in a fresh interpreter, so nothing is cached between runs.
+
+Usage:
+    python benchmarks/bench_startup.py --repeat 5
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+MODULES = ["datacleancraft.cli", "datacleancraft.pipeline", "datacleancraft.api"]
+HEAVY_MODULES = ["torch", "spacy", "openai", "fastapi"]
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+seconds = time.perf_counter() - start
+print(json.dumps({{"seconds": seconds, "heavy": [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+
+def measure_import(module: str) -> dict:
+    """
+    Import ``module`` in a new interpreter and report the elapsed time and heavy modules loaded.
+    """
+    output = subprocess.run(
+        [sys.executable, "-c", PROBE.format(module=module, heavy=HEAVY_MODULES)],
+        check=True, capture_output=True, text=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--modules", nargs="+", default=MODULES)
+    args = parser.parse_args()
+
+    for module in args.modules:
+        runs = [measure_import(module) for _ in range(args.repeat)]
+        seconds = [run["seconds"] for run in runs]
+        heavy = ", ".join(runs[-1]["heavy"]) or "-"
+        print(f"{module:>24}: median {statistics.median(seconds):6.3f}s  min {min(seconds):6.3f}s  loads: {heavy}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+bench_text_cleaner.py: Compare the full spaCy cleaning path with the tokenizer-only lite mode of TextCleaner.
+
+Usage:
+    python benchmarks/bench_text_cleaner.py --rows 20000 --distinct 0.3
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from datacleancraft.preprocessing.cleaner import TextCleaner
+
+SUBJECTS = ["The delivery", "Customer support", "My order #{n}", "The app", "Billing", "The refund", "Our account manager"]
+VERBS = ["was", "has been", "is still", "seemed", "felt", "wasn't"]
+OPINIONS = ["really slow", "fantastic!", "okay, I guess", "confusing...", "way better than expected", "late by {n} days"]
+TAILS = ["", " Thanks.", " Will order again!", " Please call me back at 555-01{n:02d}.", " (ticket {n})", " Not happy :("]
+
+
+def generate_comments(rows: int, distinct: float, seed: int = 0) -> pd.DataFrame:
+    """
+    Build free-text comments shaped like customer feedback, with a share of repeated values.
+    """
+    rng = np.random.default_rng(seed)
+    pool_size = max(1, int(rows * distinct))
+    pool = [
+        " ".join([
+            rng.choice(SUBJECTS).format(n=rng.integers(100, 999)),
+            rng.choice(VERBS),
+            rng.choice(OPINIONS).format(n=rng.integers(1, 30)),
+        ]) + rng.choice(TAILS).format(n=rng.integers(0, 99))
+        for _ in range(pool_size)
+    ]
+    return pd.DataFrame({
+        "comment": rng.choice(pool, size=rows),
+        "id": np.arange(rows),
+    })
+
+
+def time_mode(df: pd.DataFrame, lite: bool, repeat: int, **options) -> tuple:
+    """
+    Return the best wall-clock time over ``repeat`` runs and the cleaned output.
+    """
+    cleaner = TextCleaner(cache_size=options.pop("cache_size", 0), lite=lite)
+    best, cleaned = float("inf"), None
+    for _ in range(repeat):
+        cleaner.cache_clear()
+        start = time.perf_counter()
+        cleaned = cleaner.clean_text_dataframe(df, **options)
+        best = min(best, time.perf_counter() - start)
+    return best, cleaned
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=20_000)
+    parser.add_argument("--distinct", type=float, default=0.3, help="Share of distinct comments.")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    df = generate_comments(args.rows, args.distinct)
+    print(f"Generated {args.rows} comments ({df['comment'].nunique()} distinct)")
+
+    modes = {
+        "full, per cell": dict(lite=False, batch_size=None),
+        "lite, per cell": dict(lite=True, batch_size=None),
+        "lite, batched": dict(lite=True, factorize=False),
+        "lite, batched + unique": dict(lite=True, cache_size=100_000),
+    }
+    results, outputs = {}, {}
+    for name, options in modes.items():
+        options = dict(options)
+        results[name], outputs[name] = time_mode(df, options.pop("lite"), args.repeat, **options)
+
+    baseline = outputs["full, per cell"]
+    for name, seconds in results.items():
+        same = "identical" if outputs[name].equals(baseline) else "DIFFERENT"
+        print(f"{name:>24}: {seconds:7.3f}s  {len(df) / seconds:10.0f} cells/s  "
+              f"{results['full, per cell'] / seconds:6.1f}x  {same}")
+
+
+if __name__ == "__main__":
+    main()
@@ -20,6 +20,7 @@ setup(
     entry_points={
         "console_scripts": [
             "datacleancraft=datacleancraft.cli:cli",
+            "datacleancraft-daemon=datacleancraft.daemon:main",
         ],
     },
     classifiers=[
@@ -3,19 +3,74 @@
 cli.py - Command-line interface for DataCleanCraft pipeline.
 """
 
+import os
+import re
 import click
+from datacleancraft.daemon import DaemonUnavailable, submit_job
 from datacleancraft.pipeline import DataCleaningPipeline
+from datacleancraft.utils.error_handler import PipelineError
 from datacleancraft.utils.logger import default_logger
 
+FILTER_PATTERN = re.compile(r'^\s*(.+?)\s*(==|!=|>=|<=|>|<|=)\s*(.*?)\s*$')
+
+
+def parse_filter(expression: str) -> tuple:
+    """
+    Parse a row filter such as ``age>=18`` or ``country==DE`` into a pyarrow-style predicate.
+
+    Args:
+        expression (str): Filter expression ``<column><op><value>``.
+
+    Returns:
+        tuple: ``(column, op, value)`` with numeric values converted to int or float.
+    """
+    match = FILTER_PATTERN.match(expression)
+    if not match:
+        raise click.BadParameter(f"Invalid filter '{expression}'. Expected <column><op><value>, e.g. age>=18.")
+    column, op, raw_value = match.groups()
+    op = "==" if op == "=" else op
+    value = raw_value.strip("'\"")
+    if value == raw_value:
+        for cast in (int, float):
+            try:
+                value = cast(raw_value)
+                break
+            except ValueError:
+                continue
+    return column, op, value
+
+
 @click.command()
-@click.option('--input-path', type=str, required=True, help='Path to input file (CSV or JSON).')
-@click.option('--output-path', type=str, required=True, help='Path to output cleaned file.')
+@click.option('--input-path', type=str, required=True, help='Input file, directory or glob pattern (e.g. "feed/part-*.csv").')
+@click.option('--output-path', type=str, required=True, help='Path to output cleaned file, or output directory with --per-file-output.')
 @click.option('--export-format', type=click.Choice(['csv', 'json']), default='csv', show_default=True, help='Export format.')
-@click.option('--anomaly-threshold', type=float, default=0.1, show_default=True, help='Threshold for anomaly detection.')
+@click.option('--anomaly-threshold', type=float, default=None, help='Threshold for anomaly detection (defaults to 0.1, or to the 99th percentile training error of a trained model).')
 @click.option('--column-mapping', type=str, default=None, help='Optional column mapping in format old1:new1,old2:new2')
 @click.option('--redact-pii', type=bool, default=True, help='Enable or disable PII redaction.')
 @click.option('--anomaly-detection', type=bool, default=True, help='Enable or disable anomaly detection.')
-def run_pipeline(input_path, output_path, export_format, anomaly_threshold, column_mapping, redact_pii, anomaly_detection):
+@click.option('--chunk-size', type=click.IntRange(min=1), default=None, help='Stream the input in chunks of this many rows to bound memory usage.')
+@click.option('--columns', type=str, default=None, help='Only load these columns, in format col1,col2,col3')
+@click.option('--filter', 'filters', type=str, multiple=True, help='Row filter for Parquet/Feather/Arrow input, e.g. age>=18. Repeat to combine with AND.')
+@click.option('--csv-engine', type=click.Choice(['c', 'pyarrow', 'auto']), default='c', show_default=True, help='CSV parser; pyarrow parses whole files on all cores.')
+@click.option('--optimize-dtypes', is_flag=True, default=False, help='Downcast numerics and store text as categoricals or Arrow strings to reduce memory.')
+@click.option('--workers', type=click.IntRange(min=1), default=None, help='Number of input files read in parallel (defaults to the CPU count).')
+@click.option('--per-file-output', is_flag=True, default=False, help='Write one cleaned file per input file into the --output-path directory.')
+@click.option('--nlp-batch-size', type=click.IntRange(min=1), default=1000, show_default=True, help='Number of texts per spaCy batch during PII redaction and text cleaning.')
+@click.option('--n-process', type=click.IntRange(min=1), default=1, show_default=True, help='Number of processes used by spaCy during PII redaction and text cleaning.')
+@click.option('--dedup-hash-bits', type=click.Choice(['64', '128']), default='64', show_default=True, help='Width of the row hashes used to drop duplicate rows.')
+@click.option('--dedup-memory-limit', type=click.IntRange(min=1), default=5_000_000, show_default=True, help='Row hashes kept in memory before spilling to disk.')
+@click.option('--near-duplicate-threshold', type=click.FloatRange(min=0, max=1, min_open=True), default=None, help='Flag rows whose cleaned text has at least this Jaccard similarity (MinHash/LSH).')
+@click.option('--near-duplicate-action', type=click.Choice(['mark', 'drop']), default='mark', show_default=True, help='Add near-duplicate columns, or keep only the first row of each cluster.')
+@click.option('--near-duplicate-columns', type=str, default=None, help='Text columns compared for near duplicates, in format col1,col2 (defaults to all text columns).')
+@click.option('--near-duplicate-window', type=click.IntRange(min=1), default=None, help='Compare each row with at least this many preceding rows only, bounding the memory of near-duplicate detection.')
+@click.option('--ner-gate', is_flag=True, default=False, help='Skip spaCy NER on values that cannot hold a named entity (codes, numbers, lowercase text); regex detectors still apply.')
+@click.option('--ner-profile-sample', type=click.IntRange(min=1), default=None, help='Sample this many values per column and turn NER off for columns without entities.')
+@click.option('--regex-only-columns', type=str, default=None, help='Columns redacted with the email/phone/SSN regexes only (vectorized, no NER), in format col1,col2')
+@click.option('--train-anomaly-model', is_flag=True, default=False, help='Load the saved autoencoder of the numeric schema, training and saving one first if none exists (on the first chunk or file).')
+@click.option('--drop-new-columns', is_flag=True, default=False, help='With --chunk-size, drop columns that first appear after the first chunk instead of failing.')
+@click.option('--daemon/--no-daemon', 'use_daemon', default=False, show_default=True, help='Send the job to a running datacleancraft-daemon; runs in-process if none is running.')
+@click.option('--daemon-socket', type=str, default=None, help='Socket of the daemon (defaults to $DATACLEANCRAFT_DAEMON_SOCKET or daemon.sock in the cache directory).')
+def run_pipeline(input_path, output_path, export_format, anomaly_threshold, column_mapping, redact_pii, anomaly_detection, chunk_size, columns, filters, csv_engine, optimize_dtypes, workers, per_file_output, nlp_batch_size, n_process, dedup_hash_bits, dedup_memory_limit, near_duplicate_threshold, near_duplicate_action, near_duplicate_columns, near_duplicate_window, ner_gate, ner_profile_sample, regex_only_columns, train_anomaly_model, drop_new_columns, use_daemon, daemon_socket):
     """
     CLI entry point for running the DataCleanCraft cleaning pipeline.
     """
@@ -25,7 +80,12 @@ def run_pipeline(input_path, output_path, export_format, anomaly_threshold, colu
     if column_mapping:
         mapping_dict = dict(item.split(":") for item in column_mapping.split(","))
 
-    pipeline = DataCleaningPipeline(
+    column_list = [col.strip() for col in columns.split(",")] if columns else None
+    filter_list = [parse_filter(expression) for expression in filters] or None
+    regex_only_list = [col.strip() for col in regex_only_columns.split(",")] if regex_only_columns else None
+    near_duplicate_list = [col.strip() for col in near_duplicate_columns.split(",")] if near_duplicate_columns else None
+
+    params = dict(
         input_path=input_path,
         output_path=output_path,
         export_format=export_format,
@@ -33,9 +93,42 @@ def run_pipeline(input_path, output_path, export_format, anomaly_threshold, colu
         anomaly_threshold=anomaly_threshold,
         redact_pii_enabled=redact_pii, 
         anomaly_detection_enabled=anomaly_detection,
-
+        chunk_size=chunk_size,
+        columns=column_list,
+        filters=filter_list,
+        csv_engine=csv_engine,
+        optimize_dtypes=optimize_dtypes,
+        workers=workers,
+        per_file_output=per_file_output,
+        nlp_batch_size=nlp_batch_size,
+        n_process=n_process,
+        dedup_hash_bits=int(dedup_hash_bits),
+        dedup_memory_limit=dedup_memory_limit,
+        near_duplicate_threshold=near_duplicate_threshold,
+        near_duplicate_action=near_duplicate_action,
+        near_duplicate_columns=near_duplicate_list,
+        near_duplicate_window=near_duplicate_window,
+        ner_gate=ner_gate,
+        ner_profile_sample=ner_profile_sample,
+        regex_only_columns=regex_only_list,
+        train_anomaly_model=train_anomaly_model,
+        drop_new_columns=drop_new_columns,
     )
 
+    if use_daemon:
+        # The daemon has its own working directory
+        daemon_params = dict(params, input_path=os.path.abspath(input_path), output_path=os.path.abspath(output_path))
+        try:
+            response = submit_job(daemon_params, socket_path=daemon_socket)
+            default_logger.info(f"✅ Job run by daemon worker {response['pid']} in {response['seconds']:.2f}s.")
+            default_logger.info("🎉 Cleaning completed via CLI successfully!")
+            return
+        except DaemonUnavailable as e:
+            default_logger.warning(f"⚠️ {e}. Running in-process.")
+        except PipelineError as e:
+            raise click.ClickException(str(e))
+
+    pipeline = DataCleaningPipeline(**params)
     pipeline.run()
 
     default_logger.info("🎉 Cleaning completed via CLI successfully!")
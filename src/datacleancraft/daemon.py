@@ -0,0 +1,422 @@
+"""
+daemon.py - Local daemon keeping DataCleanCraft workers warm between CLI calls.
+
+The daemon listens on a Unix domain socket and runs cleaning jobs on a pool of worker
+processes that imported torch and loaded the spaCy models once at start-up, so a job
+only pays for the data it processes.
+
+Protocol: one JSON object per line in each direction.
+
+    {"action": "ping"}                      -> {"status": "ok", "pid": ..., "workers": ...}
+    {"action": "run", "params": {...}}      -> {"status": "ok", "seconds": ..., "pid": ...}
+                                               {"status": "error", "error": "..."}
+    {"action": "shutdown"}                  -> {"status": "ok"}
+
+``params`` are the keyword arguments of ``DataCleaningPipeline``; paths must be absolute.
+"""
+
+import json
+import multiprocessing
+import os
+import socket
+import socketserver
+import threading
+import time
+import click
+from concurrent.futures import CancelledError, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Optional
+from datacleancraft.utils.cache import get_cache_dir
+from datacleancraft.utils.error_handler import PipelineError
+from datacleancraft.utils.logger import default_logger
+
+SOCKET_ENV = "DATACLEANCRAFT_DAEMON_SOCKET"
+
+SHUTTING_DOWN = "Daemon is shutting down."
+
+
+class DaemonUnavailable(PipelineError):
+    """No daemon is listening on the socket."""
+    pass
+
+
+def default_socket_path() -> str:
+    """
+    Return the daemon socket path: ``$DATACLEANCRAFT_DAEMON_SOCKET`` or ``daemon.sock``
+    inside the datacleancraft cache directory.
+    """
+    return os.environ.get(SOCKET_ENV) or str(get_cache_dir() / "daemon.sock")
+
+
+def send_request(request: dict, socket_path: Optional[str] = None, timeout: Optional[float] = None) -> dict:
+    """
+    Send one request to the daemon and wait for its response.
+
+    Args:
+        request (dict): JSON-serializable request with an ``action`` key.
+        socket_path (str, optional): Daemon socket. Defaults to ``default_socket_path()``.
+        timeout (float, optional): Seconds to wait for the response; None waits forever.
+
+    Returns:
+        dict: Decoded response.
+
+    Raises:
+        DaemonUnavailable: If no daemon accepts the connection.
+    """
+    socket_path = socket_path or default_socket_path()
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        try:
+            sock.connect(socket_path)
+        except OSError as e:
+            # Missing or stale socket, refused connection, or a socket we may not use
+            raise DaemonUnavailable(f"No daemon listening on {socket_path}: {e}") from e
+
+        sock.sendall(json.dumps(request).encode("utf-8") + b"\n")
+        with sock.makefile("rb") as stream:
+            line = stream.readline()
+    if not line:
+        raise PipelineError("Daemon closed the connection without a response.")
+    return json.loads(line)
+
+
+def is_running(socket_path: Optional[str] = None) -> bool:
+    """
+    Whether a daemon answers on the socket.
+    """
+    try:
+        return send_request({"action": "ping"}, socket_path, timeout=5).get("status") == "ok"
+    except (DaemonUnavailable, OSError, ValueError):
+        return False
+
+
+def submit_job(params: dict, socket_path: Optional[str] = None, timeout: Optional[float] = None) -> dict:
+    """
+    Run a cleaning job on the daemon.
+
+    Args:
+        params (dict): ``DataCleaningPipeline`` keyword arguments, with absolute paths.
+        socket_path (str, optional): Daemon socket. Defaults to ``default_socket_path()``.
+        timeout (float, optional): Seconds to wait for the job; None waits forever.
+
+    Returns:
+        dict: Response with the job duration (``seconds``) and the worker ``pid``.
+
+    Raises:
+        DaemonUnavailable: If no daemon is running; the caller may run the job in-process.
+        PipelineError: If the job failed on the daemon.
+    """
+    response = send_request({"action": "run", "params": params}, socket_path, timeout)
+    if response.get("status") != "ok":
+        raise PipelineError(f"Daemon job failed: {response.get('error')}")
+    return response
+
+
+def _warm_up(preload: bool) -> None:
+    """
+    Worker initializer: import the pipeline and load the models its stages use.
+    """
+    from datacleancraft import pipeline  # noqa: F401
+
+    if not preload:
+        return
+    from datacleancraft.models.autoencoder_loader import load_autoencoder  # noqa: F401 (imports torch)
+    from datacleancraft.models.spacy_model_loader import SpacyModelLoader
+    from datacleancraft.preprocessing.cleaner import LITE_EXCLUDE
+
+    # Configurations used by PIIRedactor and by TextCleaner(lite=True), kept in the model registry
+    SpacyModelLoader().load_model()
+    SpacyModelLoader(exclude=LITE_EXCLUDE).load_model()
+
+
+def _worker_pid() -> int:
+    return os.getpid()
+
+
+def _run_job(params: dict) -> dict:
+    """
+    Run one pipeline in a worker process.
+    """
+    from datacleancraft.pipeline import DataCleaningPipeline
+
+    params = dict(params)
+    if params.get("filters"):
+        # JSON turns the filter tuples into lists
+        params["filters"] = [tuple(expression) for expression in params["filters"]]
+
+    start = time.perf_counter()
+    DataCleaningPipeline(**params).run()
+    return {"status": "ok", "seconds": time.perf_counter() - start, "pid": os.getpid()}
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """
+    Answer the JSON-line requests of one client connection.
+    """
+
+    def handle(self):
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            try:
+                request = json.loads(line)
+                response = self.server.daemon.handle_request(request)
+            except Exception as e:
+                response = {"status": "error", "error": f"{type(e).__name__}: {e}"}
+            self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+            self.wfile.flush()
+
+
+class _UnixServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+
+class PipelineDaemon:
+    """
+    Serve cleaning jobs from warm worker processes over a Unix domain socket.
+
+    Each worker imports the pipeline, torch and the spaCy models once, in its
+    initializer; jobs then build a ``DataCleaningPipeline`` whose stages take the already
+    loaded models from the process-wide model registry.
+    """
+
+    def __init__(self, socket_path: Optional[str] = None, workers: Optional[int] = None, preload: bool = True):
+        """
+        Args:
+            socket_path (str, optional): Socket to listen on. Defaults to ``default_socket_path()``.
+            workers (int, optional): Number of worker processes. Defaults to the CPU count.
+            preload (bool): Load torch and the spaCy models in every worker at start-up.
+        """
+        self.socket_path = socket_path or default_socket_path()
+        self.workers = workers or os.cpu_count() or 1
+        self.preload = preload
+        self.jobs_done = 0
+        self.jobs_failed = 0
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._server: Optional[_UnixServer] = None
+        self._lock = threading.Lock()
+        self._closing = False
+        # Set while a broken pool is being replaced, so other jobs wait for the same restart
+        self._restart_done: Optional[threading.Event] = None
+
+    def _new_pool(self) -> ProcessPoolExecutor:
+        """
+        Start a pool of warm workers; blocks for the whole warm-up, so call it without the lock.
+        """
+        # spawn: workers must not inherit the server's threads and sockets
+        pool = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_warm_up,
+            initargs=(self.preload,),
+        )
+        # Start all workers now, so the first jobs do not pay for the warm-up
+        for future in [pool.submit(_worker_pid) for _ in range(self.workers)]:
+            future.result()
+        return pool
+
+    def start(self) -> None:
+        """
+        Start the workers and bind the socket.
+
+        Raises:
+            PipelineError: If another daemon already listens on the socket.
+        """
+        if os.path.exists(self.socket_path):
+            if is_running(self.socket_path):
+                raise PipelineError(f"A daemon is already running on {self.socket_path}.")
+            os.unlink(self.socket_path)  # stale socket of a daemon that did not shut down cleanly
+
+        self._closing = False
+        start = time.perf_counter()
+        self._pool = self._new_pool()
+        default_logger.info(f"✅ Started {self.workers} warm workers in {time.perf_counter() - start:.1f}s.")
+
+        Path(self.socket_path).parent.mkdir(parents=True, exist_ok=True)
+        self._server = _UnixServer(self.socket_path, _RequestHandler)
+        self._server.daemon = self
+        default_logger.info(f"✅ Daemon listening on {self.socket_path}.")
+
+    def serve_forever(self) -> None:
+        """
+        Handle requests until ``shutdown`` is called, then release the workers and socket.
+        """
+        try:
+            self._server.serve_forever()
+        finally:
+            self.close()
+
+    def shutdown(self) -> None:
+        """
+        Stop serving; safe to call from a request handler. New jobs are refused from now on.
+        """
+        with self._lock:
+            self._closing = True
+        if self._server is not None:
+            threading.Thread(target=self._server.shutdown, daemon=True).start()
+
+    def close(self) -> None:
+        """
+        Close the socket and stop the workers, after the running jobs finish.
+        """
+        with self._lock:
+            self._closing = True
+        if self._server is not None:
+            self._server.server_close()
+            self._server = None
+            if os.path.exists(self.socket_path):
+                os.unlink(self.socket_path)
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+
+    def handle_request(self, request: dict) -> dict:
+        """
+        Execute one decoded request.
+
+        Args:
+            request (dict): Request with an ``action`` of ``ping``, ``run`` or ``shutdown``.
+
+        Returns:
+            dict: Response to send back.
+        """
+        action = request.get("action")
+        if action == "ping":
+            return {
+                "status": "ok",
+                "pid": os.getpid(),
+                "workers": self.workers,
+                "jobs_done": self.jobs_done,
+                "jobs_failed": self.jobs_failed,
+            }
+        if action == "shutdown":
+            self.shutdown()
+            return {"status": "ok"}
+        if action == "run":
+            return self.run_job(request.get("params") or {})
+        return {"status": "error", "error": f"Unknown action {action!r}."}
+
+    def run_job(self, params: dict) -> dict:
+        """
+        Run a pipeline on the worker pool and wait for it.
+
+        Args:
+            params (dict): ``DataCleaningPipeline`` keyword arguments.
+
+        Returns:
+            dict: ``{"status": "ok", ...}`` or ``{"status": "error", "error": ...}``.
+        """
+        error = None
+        # A job running when its worker dies is retried once on the replacement pool
+        for _ in range(2):
+            with self._lock:
+                pool = None if self._closing else self._pool
+            if pool is None:
+                return self._refuse_job(params)
+            try:
+                future = pool.submit(_run_job, params)
+            except BrokenProcessPool as e:
+                self._replace_pool(pool)
+                error = e
+                continue
+            except RuntimeError:
+                # The pool was shut down between the check and the submission
+                return self._refuse_job(params)
+
+            try:
+                response = future.result()
+                with self._lock:
+                    self.jobs_done += 1
+                default_logger.info(f"✅ Job {params.get('input_path')} done in {response['seconds']:.2f}s.")
+                return response
+            except CancelledError:
+                return self._refuse_job(params)
+            except BrokenProcessPool as e:
+                self._replace_pool(pool)
+                error = e
+            except Exception as e:
+                error = e
+                break
+        with self._lock:
+            self.jobs_failed += 1
+        default_logger.error(f"❗ Job {params.get('input_path')} failed: {error}")
+        return {"status": "error", "error": f"{type(error).__name__}: {error}"}
+
+    def _replace_pool(self, pool: ProcessPoolExecutor) -> None:
+        """
+        Replace a broken pool (e.g. a worker killed for memory), once for all jobs that saw it break.
+
+        The new pool is started outside the lock, so other requests are not held up by the
+        warm-up; jobs that saw the same pool break wait for this restart instead of starting
+        their own.
+        """
+        with self._lock:
+            if self._pool is not pool or self._closing:
+                return
+            restart_done = self._restart_done
+            if restart_done is None:
+                restart_done = self._restart_done = threading.Event()
+                owner = True
+            else:
+                owner = False
+        if not owner:
+            restart_done.wait()
+            return
+
+        new_pool = None
+        try:
+            pool.shutdown(wait=False)
+            new_pool = self._new_pool()
+        except Exception as e:
+            default_logger.error(f"❗ Could not restart the worker pool: {e}")
+        finally:
+            with self._lock:
+                closing = self._closing
+                if new_pool is not None and not closing:
+                    self._pool = new_pool
+                self._restart_done = None
+            restart_done.set()
+        if new_pool is not None and closing:
+            new_pool.shutdown(cancel_futures=True)
+
+    def _refuse_job(self, params: dict) -> dict:
+        with self._lock:
+            self.jobs_failed += 1
+        default_logger.warning(f"⚠️ Job {params.get('input_path')} refused: {SHUTTING_DOWN}")
+        return {"status": "error", "error": SHUTTING_DOWN}
+
+
+@click.command()
+@click.option('--socket-path', type=str, default=None, help=f'Unix socket to listen on (defaults to ${SOCKET_ENV} or daemon.sock in the cache directory).')
+@click.option('--workers', type=click.IntRange(min=1), default=None, help='Number of warm worker processes (defaults to the CPU count).')
+@click.option('--preload/--no-preload', default=True, show_default=True, help='Load torch and the spaCy models in every worker at start-up.')
+@click.option('--stop', is_flag=True, default=False, help='Stop the daemon listening on the socket and exit.')
+def main(socket_path, workers, preload, stop):
+    """
+    Run the DataCleanCraft daemon until it is stopped.
+    """
+    if stop:
+        try:
+            send_request({"action": "shutdown"}, socket_path, timeout=10)
+        except DaemonUnavailable as e:
+            raise click.ClickException(str(e))
+        default_logger.info("✅ Daemon stopped.")
+        return
+
+    daemon = PipelineDaemon(socket_path=socket_path, workers=workers, preload=preload)
+    try:
+        daemon.start()
+    except PipelineError as e:
+        daemon.close()
+        raise click.ClickException(str(e))
+    try:
+        daemon.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    default_logger.info("✅ Daemon shut down.")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,7 +7,7 @@ import pandas as pd
 from pathlib import Path
 from typing import Union
 
-def export_data(df: pd.DataFrame, output_path: Union[str, Path], format: str = "csv") -> None:
+def export_data(df: pd.DataFrame, output_path: Union[str, Path], format: str = "csv", append: bool = False) -> None:
     """
     Export DataFrame to disk.
 
@@ -15,15 +15,19 @@ def export_data(df: pd.DataFrame, output_path: Union[str, Path], format: str = "
         df (pd.DataFrame): Data to save.
         output_path (str or Path): Destination path.
         format (str): Output format (csv, json).
+        append (bool): Append to an existing file instead of overwriting it. Used when
+            exporting chunked output; the CSV header is only written for a new file.
     """
     output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
     format = format.lower()
+    mode = "a" if append else "w"
 
     if format == "csv":
-        df.to_csv(output_path, index=False)
+        write_header = not (append and output_path.exists() and output_path.stat().st_size > 0)
+        df.to_csv(output_path, index=False, mode=mode, header=write_header)
     elif format == "json":
-        df.to_json(output_path, orient='records', lines=True)
+        df.to_json(output_path, orient='records', lines=True, mode=mode)
     else:
         raise ValueError(f"Unsupported export format: {format}")
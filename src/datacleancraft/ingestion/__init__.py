@@ -1,4 +1,18 @@
 from .detector import DataTypeDetector
 from .reader import read_file, load_data
+from .json_stream import iter_json_records, read_json_batches
+from .xml_stream import iter_xml_records, read_xml_batches
+from .columnar import read_columnar
+from .dtype_optimizer import DtypeOptimizer
 
-__all__ = ["DataTypeDetector", "read_file", "load_data"]
\ No newline at end of file
+__all__ = [
+    "DataTypeDetector",
+    "read_file",
+    "load_data",
+    "iter_json_records",
+    "read_json_batches",
+    "iter_xml_records",
+    "read_xml_batches",
+    "read_columnar",
+    "DtypeOptimizer",
+]
@@ -0,0 +1,94 @@
+"""
+columnar.py: Parquet, Feather and Arrow IPC ingestion with column projection and row filters.
+"""
+
+import pandas as pd
+from pathlib import Path
+from typing import Any, Iterator, List, Optional, Sequence, Tuple, Union
+
+# File suffix -> pyarrow dataset format
+COLUMNAR_SUFFIXES = {
+    ".parquet": "parquet",
+    ".pq": "parquet",
+    ".feather": "feather",
+    ".arrow": "arrow",
+    ".ipc": "arrow",
+}
+COLUMNAR_FORMATS = ("parquet", "feather", "arrow")
+
+# A predicate such as ("country", "==", "DE"); a flat list is ANDed and a list of
+# lists is an OR of ANDs, following the pyarrow / pandas ``filters`` convention.
+Predicate = Tuple[str, str, Any]
+Filters = Union[List[Predicate], List[List[Predicate]]]
+
+
+def _import_pyarrow():
+    """
+    Import the pyarrow modules used by the columnar readers.
+    """
+    try:
+        import pyarrow.dataset as ds
+        import pyarrow.fs as pafs
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError(
+            "Reading Parquet, Feather or Arrow files requires pyarrow. Install it with `pip install pyarrow`."
+        ) from e
+    return ds, pafs, pq
+
+
+def read_columnar(
+    file_path: Union[str, Path],
+    format: Optional[str] = None,
+    columns: Optional[Sequence[str]] = None,
+    filters: Optional[Filters] = None,
+    memory_map: bool = True,
+    chunk_size: Optional[int] = None,
+) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
+    """
+    Read a Parquet, Feather or Arrow IPC file.
+
+    Only the requested columns are decoded. Filters are pushed down to the scan, so for
+    Parquet whole row groups are skipped when their statistics cannot match.
+
+    Args:
+        file_path (str or Path): Path to the input file.
+        format (str, optional): 'parquet', 'feather' or 'arrow'. Inferred from the suffix if omitted.
+        columns (Sequence[str], optional): Columns to load, in output order. All columns if omitted.
+        filters (list, optional): Row predicates such as ``[("age", ">=", 18)]``.
+        memory_map (bool): Memory-map the file instead of reading it into buffers.
+        chunk_size (int, optional): If set, return an iterator of DataFrames with at most
+            ``chunk_size`` rows each.
+
+    Returns:
+        pd.DataFrame or Iterator[pd.DataFrame]: Loaded data, or an iterator of chunks in streaming mode.
+    """
+    ds, pafs, pq = _import_pyarrow()
+
+    file_path = Path(file_path)
+    format = (format or COLUMNAR_SUFFIXES.get(file_path.suffix.lower(), "")).lower()
+    if format not in COLUMNAR_FORMATS:
+        raise ValueError(f"Unsupported columnar format: {format or file_path.suffix}")
+
+    dataset = ds.dataset(
+        str(file_path.resolve()),
+        format="parquet" if format == "parquet" else "ipc",
+        filesystem=pafs.LocalFileSystem(use_mmap=memory_map),
+    )
+    scan_options = {
+        "columns": list(columns) if columns is not None else None,
+        "filter": pq.filters_to_expression(filters) if filters else None,
+    }
+
+    if chunk_size is not None:
+        return _iter_batches(dataset.scanner(batch_size=chunk_size, **scan_options))
+    return dataset.to_table(**scan_options).to_pandas()
+
+
+def _iter_batches(scanner) -> Iterator[pd.DataFrame]:
+    """
+    Yield the non-empty record batches of a scanner as DataFrames.
+    """
+    for batch in scanner.to_batches():
+        if batch.num_rows:
+            yield batch.to_pandas()
@@ -0,0 +1,190 @@
+"""
+compression.py: Transparent streaming decompression for compressed inputs.
+"""
+
+import bz2
+import gzip
+import io
+import lzma
+import queue
+import threading
+from pathlib import Path
+from typing import IO, Optional, Union
+
+# Compression suffix -> codec name
+COMPRESSION_SUFFIXES = {
+    ".gz": "gzip",
+    ".gzip": "gzip",
+    ".bz2": "bz2",
+    ".xz": "xz",
+    ".lzma": "xz",
+    ".zst": "zstd",
+    ".zstd": "zstd",
+}
+
+# Leading bytes -> codec name, used when the file name carries no compression suffix
+MAGIC_BYTES = (
+    (b"\x1f\x8b", "gzip"),
+    (b"BZh", "bz2"),
+    (b"\xfd7zXZ\x00", "xz"),
+    (b"\x28\xb5\x2f\xfd", "zstd"),
+)
+
+DEFAULT_BLOCK_SIZE = 1 << 20
+DEFAULT_READ_AHEAD = 4
+
+
+def detect_compression(file_path: Union[str, Path]) -> Optional[str]:
+    """
+    Detect the compression codec of a file from its suffix, then from its magic bytes.
+
+    Args:
+        file_path (str or Path): Path to the input file.
+
+    Returns:
+        str or None: 'gzip', 'bz2', 'xz' or 'zstd', or None for uncompressed files.
+    """
+    file_path = Path(file_path)
+    codec = COMPRESSION_SUFFIXES.get(file_path.suffix.lower())
+    if codec:
+        return codec
+
+    with open(file_path, 'rb') as f:
+        head = f.read(6)
+    for magic, codec in MAGIC_BYTES:
+        if head.startswith(magic):
+            return codec
+    return None
+
+
+def strip_compression_suffix(file_path: Union[str, Path]) -> Path:
+    """
+    Drop a trailing compression suffix so the data format can be read from the name.
+
+    Args:
+        file_path (str or Path): Path such as ``data.csv.gz``.
+
+    Returns:
+        Path: Path without the compression suffix, e.g. ``data.csv``.
+    """
+    file_path = Path(file_path)
+    if file_path.suffix.lower() in COMPRESSION_SUFFIXES:
+        return file_path.with_suffix("")
+    return file_path
+
+
+def _open_decompressor(file_path: Path, codec: str) -> IO[bytes]:
+    """
+    Open a binary stream that decompresses ``file_path`` on the fly.
+    """
+    if codec == "gzip":
+        return gzip.open(file_path, 'rb')
+    if codec == "bz2":
+        return bz2.open(file_path, 'rb')
+    if codec == "xz":
+        return lzma.open(file_path, 'rb')
+    if codec == "zstd":
+        try:
+            import zstandard
+        except ImportError as e:
+            raise ImportError(
+                "Reading .zst files requires zstandard. Install it with `pip install zstandard`."
+            ) from e
+        return zstandard.ZstdDecompressor().stream_reader(open(file_path, 'rb'), read_across_frames=True, closefd=True)
+    raise ValueError(f"Unsupported compression: {codec}")
+
+
+class ThreadedReader(io.RawIOBase):
+    """
+    Read a stream ahead on a background thread.
+
+    The bundled codecs release the GIL while decompressing, so decompression of the next
+    blocks overlaps with parsing of the current one. At most ``read_ahead`` blocks are
+    buffered, which keeps memory bounded.
+    """
+
+    def __init__(self, source: IO[bytes], block_size: int = DEFAULT_BLOCK_SIZE, read_ahead: int = DEFAULT_READ_AHEAD):
+        super().__init__()
+        self._source = source
+        self._block_size = block_size
+        self._queue = queue.Queue(maxsize=read_ahead)
+        self._stop = threading.Event()
+        self._pending = memoryview(b"")
+        self._eof = False
+        self._thread = threading.Thread(target=self._pump, name="datacleancraft-decompress", daemon=True)
+        self._thread.start()
+
+    def _pump(self):
+        try:
+            while not self._stop.is_set():
+                block = self._source.read(self._block_size)
+                self._put(block)
+                if not block:
+                    return
+        except Exception as e:
+            self._put(e)
+
+    def _put(self, item):
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        if self._eof:
+            return 0
+        if not self._pending:
+            item = self._queue.get()
+            if isinstance(item, Exception):
+                self._eof = True
+                raise item
+            if not item:
+                self._eof = True
+                return 0
+            self._pending = memoryview(item)
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
+
+    def close(self):
+        if not self.closed:
+            self._stop.set()
+            self._thread.join()
+            self._source.close()
+        super().close()
+
+
+def open_stream(
+    file_path: Union[str, Path],
+    text: bool = False,
+    encoding: str = "utf-8",
+    threaded: bool = True,
+) -> IO:
+    """
+    Open a file for reading, decompressing it transparently if it is compressed.
+
+    Args:
+        file_path (str or Path): Path to the input file.
+        text (bool): Return a text stream instead of a binary one.
+        encoding (str): Text encoding used when ``text`` is True.
+        threaded (bool): Decompress on a background thread so it overlaps with parsing.
+
+    Returns:
+        IO: Readable stream over the (decompressed) file contents.
+    """
+    file_path = Path(file_path)
+    codec = detect_compression(file_path)
+
+    if codec is None:
+        return open(file_path, 'r', encoding=encoding) if text else open(file_path, 'rb')
+
+    stream = _open_decompressor(file_path, codec)
+    if threaded:
+        stream = io.BufferedReader(ThreadedReader(stream), buffer_size=DEFAULT_BLOCK_SIZE)
+    return io.TextIOWrapper(stream, encoding=encoding) if text else stream
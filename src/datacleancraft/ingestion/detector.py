@@ -2,12 +2,43 @@
 detector.py: Detect data types in raw datasets.
 """
 
+import warnings
 import pandas as pd
 import numpy as np
+from collections import OrderedDict
+from datacleancraft.utils.fingerprint import schema_fingerprint
 
 class DataTypeDetector:
-    def __init__(self):
-        pass
+    """
+    Detect the semantic type of every column from one deterministic sample.
+
+    All textual columns are checked together: the sampled values are stacked into a single
+    long Series, parsed once as numbers and once as datetimes, and the per-column share of
+    matching values is obtained with a groupby. Results are cached by schema fingerprint, so
+    repeated batches of the same feed skip detection.
+    """
+
+    def __init__(
+        self,
+        sample_size: int = 1000,
+        min_match_ratio: float = 0.95,
+        categorical_ratio: float = 0.05,
+        cache_size: int = 128,
+    ):
+        """
+        Args:
+            sample_size (int): Maximum number of rows inspected per frame.
+            min_match_ratio (float): Share of sampled values that must parse as numbers or
+                datetimes for a text column to be detected as such.
+            categorical_ratio (float): A column is categorical when its distinct values make
+                up less than this share of its sampled values.
+            cache_size (int): Number of schema fingerprints whose results are kept.
+        """
+        self.sample_size = sample_size
+        self.min_match_ratio = min_match_ratio
+        self.categorical_ratio = categorical_ratio
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[str, pd.DataFrame]" = OrderedDict()
 
     def detect(self, df: pd.DataFrame) -> pd.DataFrame:
         """
@@ -17,51 +48,112 @@ class DataTypeDetector:
             df (pd.DataFrame): Raw input DataFrame.
 
         Returns:
-            pd.DataFrame: A DataFrame with 'column' and 'detected_type'.
+            pd.DataFrame: A DataFrame with 'column', 'detected_type' and 'confidence', the
+            share of sampled values supporting the detected type.
+        """
+        fingerprint = schema_fingerprint(df)
+        if fingerprint in self._cache:
+            self._cache.move_to_end(fingerprint)
+            return self._cache[fingerprint].copy()
+
+        detection = self._detect(self._sample(df))
+
+        self._cache[fingerprint] = detection
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return detection.copy()
+
+    def clear_cache(self) -> None:
+        """
+        Forget all cached detection results.
+        """
+        self._cache.clear()
+
+    def _sample(self, df: pd.DataFrame) -> pd.DataFrame:
         """
+        Take evenly spaced rows, so every stretch of the frame is represented and the same
+        frame always yields the same sample.
+        """
+        if len(df) <= self.sample_size:
+            return df
+        positions = np.linspace(0, len(df) - 1, self.sample_size).round().astype(np.int64)
+        return df.iloc[np.unique(positions)]
+
+    def _detect(self, sample: pd.DataFrame) -> pd.DataFrame:
+        columns = pd.Index(range(sample.shape[1]))
+        detected_type = pd.Series("Text", index=columns, dtype=object)
+        confidence = pd.Series(1.0, index=columns)
 
-        detection = []
+        dtypes = pd.Series(list(sample.dtypes), index=columns)
+        is_bool = dtypes.map(pd.api.types.is_bool_dtype)
+        is_numeric = dtypes.map(pd.api.types.is_numeric_dtype) & ~is_bool
+        is_datetime = dtypes.map(pd.api.types.is_datetime64_any_dtype)
+        detected_type[is_numeric] = "Numeric"
+        detected_type[is_datetime] = "Datetime"
+        detected_type[is_bool] = "Boolean"
 
-        for col in df.columns:
-            series = df[col]
+        # Stack the sampled values of all remaining columns into one long Series
+        textual = columns[~(is_numeric | is_datetime | is_bool).to_numpy()]
+        values = self._stack(sample, textual)
+        counts = values.groupby(level=0).size().reindex(columns, fill_value=0)
 
-            # Drop NaN to analyze real values
-            non_null_series = series.dropna()
+        if not values.empty:
+            strings = values.astype(str)
+            is_number = pd.to_numeric(strings, errors="coerce").notna()
+            is_date = self._parse_datetimes(strings) & ~is_number
+            is_python_bool = values.map(lambda value: isinstance(value, (bool, np.bool_)))
 
-            if non_null_series.empty:
-                detected_type = "Unknown"
-            elif np.issubdtype(non_null_series.dtype, np.number):
-                detected_type = "Numeric"
-            elif pd.api.types.is_datetime64_any_dtype(non_null_series) or self._looks_like_datetime(non_null_series):
-                detected_type = "Datetime"
-            elif pd.api.types.is_bool_dtype(non_null_series):
-                detected_type = "Boolean"
-            elif self._looks_like_categorical(non_null_series):
-                detected_type = "Categorical"
-            else:
-                detected_type = "Text"
+            fractions = pd.DataFrame({
+                "numeric": is_number,
+                "datetime": is_date,
+                "boolean": is_python_bool,
+            }).groupby(level=0).mean().reindex(textual)
+            unique_ratio = (values.groupby(level=0).nunique() / counts[textual]).reindex(textual)
 
-            detection.append({
-                "column": col,
-                "detected_type": detected_type
-            })
+            numeric, datetime = fractions["numeric"].fillna(0.0), fractions["datetime"].fillna(0.0)
+            conditions = [
+                fractions["boolean"] == 1.0,
+                numeric >= self.min_match_ratio,
+                datetime >= self.min_match_ratio,
+                unique_ratio < self.categorical_ratio,
+            ]
+            detected_type[textual] = np.select(conditions, ["Boolean", "Numeric", "Datetime", "Categorical"], "Text")
+            confidence[textual] = np.select(
+                conditions,
+                [1.0, numeric, datetime, 1.0 - np.maximum(numeric, datetime)],
+                1.0 - np.maximum(numeric, datetime),
+            )
 
-        return pd.DataFrame(detection)
+        empty = pd.Series(sample.notna().sum().to_numpy() == 0, index=columns)
+        detected_type[empty] = "Unknown"
+        confidence[empty] = 0.0
 
-    def _looks_like_datetime(self, series: pd.Series) -> bool:
+        return pd.DataFrame({
+            "column": list(sample.columns),
+            "detected_type": detected_type.to_numpy(),
+            "confidence": confidence.round(4).to_numpy(),
+        })
+
+    @staticmethod
+    def _stack(sample: pd.DataFrame, positions: pd.Index) -> pd.Series:
         """
-        Try parsing a sample of the data to datetime.
+        Return the non-null values of the given columns as one Series indexed by column position.
         """
-        try:
-            pd.to_datetime(series.sample(min(10, len(series))), errors='raise')
-            return True
-        except Exception:
-            return False
+        block = sample.iloc[:, positions.to_numpy()].astype(object).to_numpy().T.ravel()
+        keys = np.repeat(positions.to_numpy(), sample.shape[0])
+        values = pd.Series(block, index=keys, dtype=object)
+        return values[values.notna().to_numpy()]
 
-    def _looks_like_categorical(self, series: pd.Series) -> bool:
+    @staticmethod
+    def _parse_datetimes(strings: pd.Series) -> pd.Series:
         """
-        Heuristic: if few unique values relative to number of records, it's categorical.
+        Flag values that parse as datetimes: ISO 8601 first (vectorized), then any other
+        format for the remaining values that contain a digit.
         """
-        unique_ratio = series.nunique() / max(len(series), 1)
-        return unique_ratio < 0.05  # 5% uniqueness threshold
-
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            parsed = pd.to_datetime(strings, errors="coerce", format="ISO8601", utc=True).notna()
+            retry = ~parsed & strings.str.contains(r"\d", regex=True)
+            if retry.any():
+                parsed[retry.to_numpy()] = pd.to_datetime(strings[retry], errors="coerce", format="mixed", utc=True).notna().to_numpy()
+        return parsed
@@ -0,0 +1,250 @@
+"""
+dtype_optimizer.py: Memory-optimizing dtype plans (downcasting, categoricals, Arrow strings).
+"""
+
+import importlib.util
+import json
+import logging
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from typing import Dict, Optional, Union
+from datacleancraft.utils.cache import get_cache_dir
+from datacleancraft.utils.fingerprint import schema_fingerprint
+
+logger = logging.getLogger(__name__)
+
+INTEGER_CANDIDATES = ("uint8", "int8", "uint16", "int16", "uint32", "int32")
+ARROW_STRING_DTYPE = "string[pyarrow]"
+
+
+def nullable_integer_dtype(dtype: str) -> str:
+    """
+    Name of the pandas nullable integer dtype matching a numpy one, e.g. ``"uint8"`` -> ``"UInt8"``.
+    """
+    return "UInt" + dtype[4:] if dtype.startswith("uint") else "Int" + dtype[3:]
+
+
+class DtypeOptimizer:
+    """
+    Plan and apply compact dtypes for a DataFrame.
+
+    Integers are downcast to the smallest type that holds their range, floats become
+    float32 when that is lossless, low-cardinality text becomes ``category`` and other text
+    uses Arrow-backed strings. Plans are cached by schema fingerprint, in memory and on
+    disk, so later files with the same layout skip inference.
+    """
+
+    def __init__(
+        self,
+        category_max_ratio: float = 0.5,
+        use_arrow_strings: bool = True,
+        plan_dir: Optional[Union[str, Path]] = None,
+    ):
+        """
+        Args:
+            category_max_ratio (float): Maximum ratio of distinct values to rows for a text
+                column to become categorical.
+            use_arrow_strings (bool): Store remaining text columns as Arrow-backed strings
+                (requires pyarrow).
+            plan_dir (str or Path, optional): Directory for persisted plans. Defaults to the
+                ``dtype_plans`` folder of the datacleancraft cache.
+        """
+        self.category_max_ratio = category_max_ratio
+        self.use_arrow_strings = use_arrow_strings and importlib.util.find_spec("pyarrow") is not None
+        self.plan_dir = Path(plan_dir) if plan_dir is not None else None
+        self._plans: Dict[str, Dict[str, str]] = {}
+        self.last_report: Optional[pd.DataFrame] = None
+        self.bytes_saved: Dict[str, int] = {}
+
+    def infer_plan(self, df: pd.DataFrame) -> Dict[str, str]:
+        """
+        Infer target dtypes for the columns that can be stored more compactly.
+
+        Args:
+            df (pd.DataFrame): Input DataFrame.
+
+        Returns:
+            Dict[str, str]: Mapping of column name to target dtype.
+        """
+        plan = {}
+        for col in df.columns:
+            target = self._infer_column(df[col])
+            if target is not None and target != str(df[col].dtype):
+                plan[col] = target
+        return plan
+
+    def _infer_column(self, series: pd.Series) -> Optional[str]:
+        if pd.api.types.is_bool_dtype(series):
+            return None
+        if pd.api.types.is_integer_dtype(series):
+            return self._smallest_integer(series)
+        if pd.api.types.is_float_dtype(series):
+            return "float32" if self._fits_float32(series) else None
+        if pd.api.types.is_object_dtype(series) and pd.api.types.infer_dtype(series, skipna=True) == "string":
+            non_null = series.count()
+            if non_null and series.nunique() / non_null <= self.category_max_ratio:
+                return "category"
+            return ARROW_STRING_DTYPE if self.use_arrow_strings else None
+        return None
+
+    @staticmethod
+    def _smallest_integer(series: pd.Series) -> Optional[str]:
+        if series.count() == 0:
+            return None
+        low, high = series.min(), series.max()
+        for candidate in INTEGER_CANDIDATES:
+            info = np.iinfo(candidate)
+            if info.min <= low and high <= info.max:
+                return candidate
+        return None
+
+    @staticmethod
+    def _fits_float32(series: pd.Series) -> bool:
+        values = series.to_numpy()
+        with np.errstate(over="ignore"):
+            narrowed = values.astype(np.float32).astype(values.dtype)
+        return bool(np.array_equal(values, narrowed, equal_nan=True))
+
+    def apply_plan(self, df: pd.DataFrame, plan: Dict[str, str]) -> pd.DataFrame:
+        """
+        Convert columns according to a plan.
+
+        Numeric targets are re-validated against the data, so a plan inferred on one file
+        never overflows or loses precision on another; such columns keep their dtype.
+        Nullable integer columns are downcast to the nullable dtype of the same width
+        (``Int8``, ``UInt16``, ...), so chunks with missing values convert too.
+
+        Args:
+            df (pd.DataFrame): Input DataFrame.
+            plan (Dict[str, str]): Mapping of column name to target dtype.
+
+        Returns:
+            pd.DataFrame: DataFrame with converted columns.
+        """
+        converted = {}
+        for col, target in plan.items():
+            if col not in df.columns:
+                continue
+            series = df[col]
+            if target in INTEGER_CANDIDATES:
+                if not pd.api.types.is_integer_dtype(series) or self._smallest_integer(series) is None:
+                    continue
+                info = np.iinfo(target)
+                if series.count() == 0 or not (info.min <= series.min() and series.max() <= info.max):
+                    continue
+                if isinstance(series.dtype, pd.api.extensions.ExtensionDtype) or series.hasnans:
+                    # Nullable integers (e.g. Int64 holding NA) keep their missing values
+                    target = nullable_integer_dtype(target)
+            elif target == "float32":
+                if not pd.api.types.is_float_dtype(series) or not self._fits_float32(series):
+                    continue
+            elif not (pd.api.types.is_object_dtype(series) and pd.api.types.infer_dtype(series, skipna=True) in ("string", "empty")):
+                continue
+            converted[col] = series.astype(target)
+
+        if not converted:
+            return df
+        df = df.copy()
+        for col, series in converted.items():
+            df[col] = series
+        return df
+
+    def get_plan(self, df: pd.DataFrame) -> Dict[str, str]:
+        """
+        Return the plan for the layout of ``df``, inferring and persisting it if needed.
+
+        Args:
+            df (pd.DataFrame): Input DataFrame.
+
+        Returns:
+            Dict[str, str]: Mapping of column name to target dtype.
+        """
+        fingerprint = schema_fingerprint(df)
+        plan = self._plans.get(fingerprint)
+        if plan is None:
+            plan = self.load_plan(fingerprint)
+        if plan is None:
+            plan = self.infer_plan(df)
+            self.save_plan(fingerprint, plan)
+        self._plans[fingerprint] = plan
+        return plan
+
+    def optimize(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Apply the cached or inferred plan and record the bytes saved per column.
+
+        Args:
+            df (pd.DataFrame): Input DataFrame.
+
+        Returns:
+            pd.DataFrame: DataFrame with compact dtypes. ``last_report`` holds the per-column
+            report and ``bytes_saved`` the running totals across calls.
+        """
+        plan = self.get_plan(df)
+        optimized = self.apply_plan(df, plan)
+        self.last_report = self.memory_report(df, optimized)
+        for col, saved in zip(self.last_report["column"], self.last_report["bytes_saved"]):
+            self.bytes_saved[col] = self.bytes_saved.get(col, 0) + int(saved)
+        return optimized
+
+    @staticmethod
+    def memory_report(before: pd.DataFrame, after: pd.DataFrame) -> pd.DataFrame:
+        """
+        Compare the memory footprint of two versions of a DataFrame column by column.
+
+        Args:
+            before (pd.DataFrame): Original DataFrame.
+            after (pd.DataFrame): Optimized DataFrame.
+
+        Returns:
+            pd.DataFrame: Columns 'column', 'dtype_before', 'dtype_after', 'bytes_before',
+            'bytes_after' and 'bytes_saved'.
+        """
+        bytes_before = before.memory_usage(index=False, deep=True)
+        bytes_after = after.memory_usage(index=False, deep=True)
+        return pd.DataFrame({
+            "column": before.columns,
+            "dtype_before": [str(dtype) for dtype in before.dtypes],
+            "dtype_after": [str(dtype) for dtype in after.dtypes],
+            "bytes_before": bytes_before.values,
+            "bytes_after": bytes_after.values,
+            "bytes_saved": (bytes_before - bytes_after).values,
+        })
+
+    def _plan_path(self, fingerprint: str) -> Path:
+        plan_dir = self.plan_dir or get_cache_dir("dtype_plans")
+        return plan_dir / f"{fingerprint}.json"
+
+    def load_plan(self, fingerprint: str) -> Optional[Dict[str, str]]:
+        """
+        Load a persisted plan for a schema fingerprint.
+
+        Args:
+            fingerprint (str): Schema fingerprint of the input layout.
+
+        Returns:
+            Dict[str, str] or None: The plan, or None if none was saved.
+        """
+        path = self._plan_path(fingerprint)
+        if not path.exists():
+            return None
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"[DtypeOptimizer] Ignoring unreadable dtype plan {path}: {e}")
+            return None
+
+    def save_plan(self, fingerprint: str, plan: Dict[str, str]) -> None:
+        """
+        Persist a plan for a schema fingerprint.
+
+        Args:
+            fingerprint (str): Schema fingerprint of the input layout.
+            plan (Dict[str, str]): Mapping of column name to target dtype.
+        """
+        path = self._plan_path(fingerprint)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(plan, f, indent=2, sort_keys=True)
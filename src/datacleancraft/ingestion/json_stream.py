@@ -0,0 +1,173 @@
+"""
+json_stream.py: Incremental JSON / NDJSON parsing for large files.
+"""
+
+import json
+import pandas as pd
+from pathlib import Path
+from typing import Any, IO, Iterable, Iterator, List, Union
+from datacleancraft.ingestion.compression import open_stream
+
+DEFAULT_BLOCK_SIZE = 1 << 16
+DEFAULT_BATCH_SIZE = 10000
+
+_DECODER = json.JSONDecoder()
+_WHITESPACE = " \t\n\r"
+
+
+class _Buffer:
+    """
+    Sliding text window over a stream that only keeps the unparsed tail in memory.
+    """
+
+    def __init__(self, fp: IO[str], block_size: int):
+        self.fp = fp
+        self.block_size = block_size
+        self.text = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self) -> bool:
+        """
+        Read another block, growing the read size with the pending data so a single
+        oversized record is still parsed in linear time. Returns False at end of stream.
+        """
+        if self.eof:
+            return False
+        pending = self.text[self.pos:]
+        block = self.fp.read(max(self.block_size, len(pending)))
+        if not block:
+            self.eof = True
+            return False
+        self.text = pending + block
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """
+        Skip whitespace and return the next character, or '' at end of stream.
+        """
+        while True:
+            while self.pos < len(self.text) and self.text[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.text):
+                return self.text[self.pos]
+            if not self.fill():
+                return ""
+
+    def decode(self) -> Any:
+        """
+        Decode the JSON value starting at the current position.
+        """
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self.text, self.pos)
+            except json.JSONDecodeError:
+                if self.fill():
+                    continue
+                raise
+            # A number that ends exactly at the block boundary may continue in the next block
+            if end == len(self.text) and not self.eof and self.fill():
+                continue
+            self.pos = end
+            return value
+
+
+def iter_json_records(fp: IO[str], block_size: int = DEFAULT_BLOCK_SIZE) -> Iterator[Any]:
+    """
+    Incrementally parse records from a JSON text stream.
+
+    A top-level array yields one record per element; NDJSON (or any sequence of
+    whitespace-separated JSON values) yields one record per value, which also covers a
+    single top-level object. Only the current record and one read block are kept in memory.
+
+    Args:
+        fp (IO[str]): Text stream to read from.
+        block_size (int): Number of characters to read at a time.
+
+    Yields:
+        Any: Parsed JSON records.
+    """
+    buffer = _Buffer(fp, block_size)
+
+    if buffer.peek() != "[":
+        while buffer.peek():
+            yield buffer.decode()
+        return
+
+    buffer.pos += 1  # consume '['
+    first = True
+    while True:
+        char = buffer.peek()
+        if char == "]":
+            buffer.pos += 1
+            break
+        if not char:
+            raise ValueError("Unexpected end of JSON input: unterminated top-level array.")
+        if not first:
+            if char != ",":
+                raise ValueError(f"Expected ',' between array elements, got {char!r}.")
+            buffer.pos += 1
+            buffer.peek()
+        yield buffer.decode()
+        first = False
+
+    if buffer.peek():
+        raise ValueError("Unexpected data after the top-level JSON array.")
+
+
+def normalize_batches(records: Iterable[Any], batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[pd.DataFrame]:
+    """
+    Group records into batches and flatten each batch with ``pd.json_normalize``.
+
+    Every batch carries all columns seen so far in first-seen order, matching the layout
+    ``pd.json_normalize`` produces for the whole record list.
+
+    Args:
+        records (Iterable[Any]): Records to flatten, typically dictionaries.
+        batch_size (int): Maximum number of records per batch.
+
+    Yields:
+        pd.DataFrame: Flattened batch of records.
+    """
+    if batch_size <= 0:
+        raise ValueError(f"batch_size must be a positive integer, got {batch_size}.")
+
+    columns: List[str] = []
+    seen = set()
+
+    def _normalize(batch_records: List[Any]) -> pd.DataFrame:
+        batch = pd.json_normalize(batch_records)
+        new_columns = [col for col in batch.columns if col not in seen]
+        columns.extend(new_columns)
+        seen.update(new_columns)
+        if len(batch.columns) == len(columns):
+            return batch[columns]
+        return batch.reindex(columns=columns)
+
+    batch_records = []
+    for record in records:
+        batch_records.append(record)
+        if len(batch_records) >= batch_size:
+            yield _normalize(batch_records)
+            batch_records = []
+    if batch_records:
+        yield _normalize(batch_records)
+
+
+def read_json_batches(
+    file_path: Union[str, Path],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> Iterator[pd.DataFrame]:
+    """
+    Stream a JSON array or NDJSON file, optionally compressed, as flattened DataFrame batches.
+
+    Args:
+        file_path (str or Path): Path to the JSON or NDJSON file.
+        batch_size (int): Maximum number of records per batch.
+
+    Yields:
+        pd.DataFrame: Flattened batch of records, see ``normalize_batches``.
+    """
+    with open_stream(file_path, text=True) as f:
+        yield from normalize_batches(iter_json_records(f), batch_size)
@@ -3,74 +3,492 @@
 Reader module for loading different data formats.
 """
 
+import glob
+import importlib.util
+import logging
+import os
+import warnings
 import pandas as pd
-import json
-import xmltodict
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import chain
 from pathlib import Path
-from typing import Union
+from typing import Iterator, List, Optional, Sequence, Tuple, Union
+from datacleancraft.ingestion.compression import detect_compression, open_stream, strip_compression_suffix
+from datacleancraft.ingestion.columnar import COLUMNAR_FORMATS, COLUMNAR_SUFFIXES, Filters, read_columnar
+from datacleancraft.ingestion.dtype_optimizer import DtypeOptimizer
+from datacleancraft.ingestion.json_stream import DEFAULT_BATCH_SIZE, read_json_batches
+from datacleancraft.ingestion.xml_stream import read_xml_batches
 
-def read_file(file_path: Union[str, Path]) -> pd.DataFrame:
+logger = logging.getLogger(__name__)
+
+JSON_SUFFIXES = (".json", ".jsonl", ".ndjson")
+CSV_ENGINES = ("c", "pyarrow", "auto")
+EXECUTORS = ("thread", "process")
+GLOB_CHARACTERS = ("*", "?", "[")
+
+InputPath = Union[str, Path, Sequence[Union[str, Path]]]
+
+# File suffix -> reader format name
+SUFFIX_FORMATS = {
+    ".csv": "csv",
+    **{suffix: "json" for suffix in JSON_SUFFIXES},
+    ".xml": "xml",
+    ".txt": "text",
+    ".text": "text",
+    **COLUMNAR_SUFFIXES,
+}
+
+
+def read_file(
+    file_path: Union[str, Path],
+    chunk_size: Optional[int] = None,
+    record_tag: Optional[str] = None,
+    columns: Optional[Sequence[str]] = None,
+    filters: Optional[Filters] = None,
+    engine: str = "c",
+) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
     """
     Detect file format and load into a pandas DataFrame.
-    
+
+    JSON files (top-level arrays and NDJSON) are parsed incrementally, record by record,
+    and nested fields are flattened the same way ``pd.json_normalize`` does. XML files are
+    streamed with one row per repeated record element. Parquet, Feather and Arrow IPC files
+    are scanned with column projection and row filters pushed down to the reader.
+    Text formats may be compressed (``.gz``, ``.bz2``, ``.xz``, ``.zst``); they are
+    decompressed as a stream while parsing.
+
     Args:
         file_path (str or Path): Path to the input data file.
+        chunk_size (int, optional): If set, return an iterator of DataFrames with at most
+            ``chunk_size`` rows each.
+        record_tag (str, optional): XML record element name. Auto-detected if omitted.
+        columns (Sequence[str], optional): Columns to load. All columns if omitted.
+        filters (list, optional): Row predicates such as ``[("age", ">=", 18)]``
+            (Parquet, Feather and Arrow only).
+        engine (str): CSV parser, see ``load_data``.
 
     Returns:
-        pd.DataFrame: Loaded data.
+        pd.DataFrame or Iterator[pd.DataFrame]: Loaded data, or an iterator of chunks in streaming mode.
     """
     file_path = Path(file_path)
     if not file_path.exists():
         raise FileNotFoundError(f"File {file_path} does not exist.")
 
-    suffix = file_path.suffix.lower()
-
-    if suffix == ".json":
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        return pd.json_normalize(data)
-    
-    elif suffix == ".csv":
-        return pd.read_csv(file_path)
-    
-    elif suffix == ".xml":
-        with open(file_path, 'r', encoding='utf-8') as f:
-            xml_data = xmltodict.parse(f.read())
-        return pd.json_normalize(xml_data)
-    
-    elif suffix in (".txt", ".text"):
-        with open(file_path, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-        return pd.DataFrame({'text': [line.strip() for line in lines]})
-    
-    else:
+    suffix = strip_compression_suffix(file_path).suffix.lower()
+    if suffix not in SUFFIX_FORMATS:
         raise ValueError(f"Unsupported file format: {suffix}")
+
+    return _read(file_path, SUFFIX_FORMATS[suffix], chunk_size, record_tag, columns, filters, engine)
 """
 reader.py - Module for reading structured data from various formats (CSV, JSON).
 """
 
 
-def load_data(input_path: Union[str, Path], format: str = "csv") -> pd.DataFrame:
+def load_data(
+    input_path: InputPath,
+    format: Optional[str] = None,
+    chunk_size: Optional[int] = None,
+    record_tag: Optional[str] = None,
+    columns: Optional[Sequence[str]] = None,
+    filters: Optional[Filters] = None,
+    engine: str = "c",
+    dtype_optimizer: Optional[DtypeOptimizer] = None,
+    workers: Optional[int] = None,
+    executor: str = "thread",
+) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
     """
     Load data into a DataFrame from disk.
 
+    ``input_path`` may be a file, a directory, a glob pattern such as ``feed/part-*.csv``
+    or a list of those. Multiple files are read in parallel and concatenated; columns
+    that appear in only some files are unified into one schema, missing values being NaN.
+
     Args:
-        input_path (str or Path): Path to the input file.
-        format (str): Format to read ('csv' or 'json').
+        input_path (str, Path or list): Input file, directory, glob pattern, or a list of them.
+        format (str, optional): Format to read ('csv', 'json', 'xml', 'text', 'parquet',
+            'feather' or 'arrow'). Inferred from each file suffix when omitted, defaulting
+            to CSV. Compression suffixes such as ``.csv.gz`` are skipped. JSON input may be a
+            top-level array or NDJSON and is parsed incrementally; XML yields one row per
+            record element.
+        chunk_size (int, optional): If set, stream the file and return an iterator of
+            DataFrames with at most ``chunk_size`` rows each instead of a single DataFrame.
+            Multiple files are streamed one after another, every chunk carrying the
+            columns of all files (see ``scan_columns``).
+        record_tag (str, optional): XML record element name. Auto-detected if omitted.
+        columns (Sequence[str], optional): Columns to load. All columns if omitted.
+        filters (list, optional): Row predicates such as ``[("age", ">=", 18)]``, pushed
+            down to row groups for Parquet (Parquet, Feather and Arrow only).
+        engine (str): CSV parser: 'c' (pandas default), 'pyarrow' (multithreaded) or 'auto'
+            (pyarrow when installed). Falls back to 'c' when pyarrow is unavailable and for
+            chunked reads, since pyarrow's streaming CSV reader is single-threaded.
+        dtype_optimizer (DtypeOptimizer, optional): If set, convert the loaded data (or each
+            chunk) to compact dtypes using the optimizer's cached plan for this layout.
+        workers (int, optional): Number of files read concurrently. Defaults to the number
+            of CPUs, capped by the number of files.
+        executor (str): 'thread' or 'process' pool for multi-file reads.
 
     Returns:
-        pd.DataFrame: Loaded DataFrame.
+        pd.DataFrame or Iterator[pd.DataFrame]: Loaded DataFrame, or an iterator of chunks in streaming mode.
+    """
+    paths = resolve_inputs(input_path)
+    if len(paths) == 1:
+        data = _read(paths[0], _resolve_format(paths[0], format), chunk_size, record_tag, columns, filters, engine)
+    elif chunk_size is not None:
+        _check_chunk_size(chunk_size)
+        schema = list(columns) if columns is not None else scan_columns(paths, format, chunk_size, record_tag, engine)
+        chunks = chain.from_iterable(
+            _read(path, _resolve_format(path, format), chunk_size, record_tag, columns, filters, engine)
+            for path in paths
+        )
+        data = (chunk if chunk.columns.equals(schema) else chunk.reindex(columns=schema) for chunk in chunks)
+    else:
+        frames = iter_files(paths, format, record_tag, columns, filters, engine, workers=workers, executor=executor)
+        data = _concat_chunks(frame for _, frame in frames)
+
+    if dtype_optimizer is None:
+        return data
+    if isinstance(data, pd.DataFrame):
+        return dtype_optimizer.optimize(data)
+    return (dtype_optimizer.optimize(chunk) for chunk in data)
+
+
+def resolve_inputs(input_path: InputPath) -> List[Path]:
+    """
+    Expand an input specification into the list of files to read.
+
+    Args:
+        input_path (str, Path or list): A file, a directory (all supported files directly
+            inside it), a glob pattern (``**`` matches sub-directories), or a list of them.
+
+    Returns:
+        List[Path]: Files in a stable, sorted order per entry.
+    """
+    if isinstance(input_path, (list, tuple)):
+        return [path for entry in input_path for path in resolve_inputs(entry)]
+
+    path = Path(input_path)
+    if path.is_dir():
+        paths = sorted(
+            child for child in path.iterdir()
+            if child.is_file() and not child.name.startswith(".")
+            and strip_compression_suffix(child).suffix.lower() in SUFFIX_FORMATS
+        )
+        if not paths:
+            raise FileNotFoundError(f"Input directory {path} contains no supported files.")
+        return paths
+    if path.exists():
+        return [path]
+    if any(character in str(input_path) for character in GLOB_CHARACTERS):
+        paths = sorted(Path(match) for match in glob.glob(str(input_path), recursive=True) if os.path.isfile(match))
+        if not paths:
+            raise FileNotFoundError(f"No input files match {input_path}.")
+        return paths
+    raise FileNotFoundError(f"Input file {path} does not exist.")
+
+
+def scan_columns(
+    paths: Sequence[Path],
+    format: Optional[str] = None,
+    chunk_size: int = DEFAULT_BATCH_SIZE,
+    record_tag: Optional[str] = None,
+    engine: str = "c",
+) -> pd.Index:
+    """
+    Collect the columns of several files before streaming them, in first-seen order.
+
+    Only the header, or the first chunk of records, of every file is read, so chunked
+    multi-file reads can give every chunk the same unified schema as a whole-file read.
+    Columns that appear only after the first chunk of a JSON or XML file are not seen.
+
+    Args:
+        paths (Sequence[Path]): Files to scan.
+        format (str, optional): Format for all files. Inferred per file when omitted.
+        chunk_size (int): Rows or records read from every file.
+        record_tag, engine: See ``load_data``.
+
+    Returns:
+        pd.Index: Union of the column names.
+    """
+    names: dict = {}
+    for path in paths:
+        path = Path(path)
+        path_format = _resolve_format(path, format)
+        if path_format == "csv":
+            header = _read_csv_header(path, engine)
+        else:
+            chunks = _read(path, path_format, chunk_size, record_tag, None, None, engine)
+            first = next(chunks, None)
+            chunks.close()
+            header = first.columns if first is not None else []
+        names.update(dict.fromkeys(header))
+    return pd.Index(list(names))
+
+
+def _read_csv_header(path: Path, engine: str) -> pd.Index:
+    """
+    Read the column names of a CSV file without its rows.
+    """
+    if not detect_compression(path):
+        return pd.read_csv(path, nrows=0).columns
+    with open_stream(path) as stream:
+        return pd.read_csv(stream, nrows=0).columns
+
+
+def iter_files(
+    paths: Sequence[Path],
+    format: Optional[str] = None,
+    record_tag: Optional[str] = None,
+    columns: Optional[Sequence[str]] = None,
+    filters: Optional[Filters] = None,
+    engine: str = "c",
+    workers: Optional[int] = None,
+    executor: str = "thread",
+) -> Iterator[Tuple[Path, pd.DataFrame]]:
+    """
+    Read files in parallel and yield them in input order as ``(path, DataFrame)`` pairs.
+
+    At most ``workers`` files are read ahead of the consumer, so memory stays bounded by a
+    few files even for long lists.
+
+    Args:
+        paths (Sequence[Path]): Files to read, e.g. from ``resolve_inputs``.
+        format (str, optional): Format for all files. Inferred per file when omitted.
+        record_tag, columns, filters, engine: See ``load_data``.
+        workers (int, optional): Number of concurrent reads. Defaults to the number of CPUs.
+        executor (str): 'thread' (good for pyarrow and compressed input, which release the
+            GIL) or 'process' (for pure-Python parsers such as JSON and XML).
+
+    Returns:
+        Iterator[Tuple[Path, pd.DataFrame]]: Each file and its contents.
+    """
+    if executor not in EXECUTORS:
+        raise ValueError(f"Unsupported executor: {executor}. Expected one of {', '.join(EXECUTORS)}.")
+    if workers is not None and workers <= 0:
+        raise ValueError(f"workers must be a positive integer, got {workers}.")
+
+    paths = [Path(path) for path in paths]
+    workers = min(workers or os.cpu_count() or 1, max(len(paths), 1))
+    if workers == 1:
+        for path in paths:
+            yield path, _read_one(path, format, record_tag, columns, filters, engine)
+        return
+
+    pool_class = ThreadPoolExecutor if executor == "thread" else ProcessPoolExecutor
+    with pool_class(max_workers=workers) as pool:
+        pending = deque()
+        remaining = iter(paths)
+        for path in remaining:
+            pending.append((path, pool.submit(_read_one, path, format, record_tag, columns, filters, engine)))
+            if len(pending) >= workers:
+                break
+        while pending:
+            path, future = pending.popleft()
+            frame = future.result()
+            next_path = next(remaining, None)
+            if next_path is not None:
+                pending.append((next_path, pool.submit(_read_one, next_path, format, record_tag, columns, filters, engine)))
+            yield path, frame
+
+
+def _read_one(
+    path: Path,
+    format: Optional[str],
+    record_tag: Optional[str],
+    columns: Optional[Sequence[str]],
+    filters: Optional[Filters],
+    engine: str,
+) -> pd.DataFrame:
+    """
+    Read one whole file; module-level so process pools can pickle it.
+    """
+    return _read(path, _resolve_format(path, format), None, record_tag, columns, filters, engine)
+
+
+def _resolve_format(path: Path, format: Optional[str]) -> str:
     """
-    input_path = Path(input_path)
+    Validate an explicit format or infer it from the file suffix.
+    """
+    format = (format or infer_format(path)).lower()
+    if format not in set(SUFFIX_FORMATS.values()):
+        raise ValueError(f"Unsupported input format: {format}")
+    return format
 
-    if not input_path.exists():
-        raise FileNotFoundError(f"Input file {input_path} does not exist.")
 
-    format = format.lower()
+def _read(
+    path: Path,
+    format: str,
+    chunk_size: Optional[int],
+    record_tag: Optional[str],
+    columns: Optional[Sequence[str]],
+    filters: Optional[Filters],
+    engine: str = "c",
+) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
+    """
+    Dispatch to the reader for ``format``, shared by ``read_file`` and ``load_data``.
+    """
+    _check_chunk_size(chunk_size)
+    if engine not in CSV_ENGINES:
+        raise ValueError(f"Unsupported CSV engine: {engine}. Expected one of {', '.join(CSV_ENGINES)}.")
+
+    if format in COLUMNAR_FORMATS:
+        if detect_compression(path):
+            raise ValueError(f"Compressed {format} files are not supported; use the format's internal compression.")
+        return read_columnar(path, format=format, columns=columns, filters=filters, chunk_size=chunk_size)
+    if filters:
+        raise ValueError("Row filters are only supported for Parquet, Feather and Arrow input.")
 
     if format == "csv":
-        return pd.read_csv(input_path)
+        data = _read_csv(path, columns, chunk_size, engine)
     elif format == "json":
-        return pd.read_json(input_path, orient='records', lines=True)
+        batches = read_json_batches(path, batch_size=chunk_size or DEFAULT_BATCH_SIZE)
+        data = batches if chunk_size is not None else _concat_batches(batches)
+    elif format == "xml":
+        batches = read_xml_batches(path, record_tag=record_tag, batch_size=chunk_size or DEFAULT_BATCH_SIZE)
+        data = batches if chunk_size is not None else _concat_batches(batches)
     else:
-        raise ValueError(f"Unsupported input format: {format}")
+        if chunk_size is not None:
+            data = _iter_text_chunks(path, chunk_size)
+        else:
+            with open_stream(path, text=True) as f:
+                lines = f.readlines()
+            data = pd.DataFrame({'text': [line.strip() for line in lines]})
+
+    return _select_columns(data, columns)
+
+
+def _read_csv(
+    path: Path,
+    columns: Optional[Sequence[str]],
+    chunk_size: Optional[int],
+    engine: str,
+) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
+    """
+    Read a CSV file with the requested parser engine, falling back to the C parser.
+    Compressed files are read through a decompressing stream.
+    """
+    usecols = list(columns) if columns is not None else None
+    read_options = {"usecols": usecols}
+
+    if engine != "c" and chunk_size is None:
+        if _pyarrow_available():
+            read_options["engine"] = "pyarrow"
+        elif engine == "pyarrow":
+            logger.warning("pyarrow is not installed; falling back to the default CSV parser.")
+    elif engine == "pyarrow":
+        logger.info("Chunked CSV reads use the default parser; the pyarrow engine only applies to whole-file reads.")
+
+    if not detect_compression(path):
+        if chunk_size is not None:
+            return _iter_chunks(pd.read_csv(path, chunksize=chunk_size, **read_options))
+        return pd.read_csv(path, **read_options)
+
+    stream = open_stream(path)
+    if chunk_size is not None:
+        return _iter_chunks(pd.read_csv(stream, chunksize=chunk_size, **read_options), stream)
+    with stream:
+        return pd.read_csv(stream, **read_options)
+
+
+def _pyarrow_available() -> bool:
+    """
+    Check whether pyarrow can be imported without importing it.
+    """
+    return importlib.util.find_spec("pyarrow") is not None
+
+
+def _iter_chunks(reader, stream=None) -> Iterator[pd.DataFrame]:
+    """
+    Yield chunks from a pandas chunked reader and close the underlying file when done.
+    """
+    try:
+        with reader:
+            for chunk in reader:
+                yield chunk
+    finally:
+        if stream is not None:
+            stream.close()
+
+
+def _iter_text_chunks(file_path: Path, chunk_size: int) -> Iterator[pd.DataFrame]:
+    """
+    Yield a text file as DataFrames of at most ``chunk_size`` stripped lines.
+    """
+    with open_stream(file_path, text=True) as f:
+        lines: List[str] = []
+        for line in f:
+            lines.append(line.strip())
+            if len(lines) >= chunk_size:
+                yield pd.DataFrame({'text': lines})
+                lines = []
+        if lines:
+            yield pd.DataFrame({'text': lines})
+
+
+def _concat_chunks(chunks: Iterator[pd.DataFrame]) -> pd.DataFrame:
+    """
+    Concatenate streamed chunks into a single DataFrame.
+    """
+    frames = list(chunks)
+    if not frames:
+        return pd.DataFrame()
+    return pd.concat(frames, ignore_index=True)
+
+
+def _concat_batches(batches: Iterator[pd.DataFrame]) -> pd.DataFrame:
+    """
+    Concatenate the record batches of one file into the frame a whole-file read gives.
+
+    A column that is entirely missing in one batch is ``object`` there, and concatenating
+    it with a numeric batch makes the whole column ``object``. Such columns get their dtype
+    inferred again from all values, as ``pd.json_normalize`` over the whole file would.
+    """
+    frames = list(batches)
+    if not frames:
+        return pd.DataFrame()
+    with warnings.catch_warnings():
+        # All-missing batches are reconciled below, whichever way pandas treats them
+        warnings.filterwarnings("ignore", message=".*empty or all-NA entries", category=FutureWarning)
+        data = pd.concat(frames, ignore_index=True)
+
+    typed = {col for frame in frames for col, dtype in frame.dtypes.items() if dtype != object}
+    mixed = [col for col in data.columns if col in typed and data[col].dtype == object]
+    if mixed:
+        data[mixed] = data[mixed].infer_objects()
+    return data
+
+
+def _check_chunk_size(chunk_size: Optional[int]) -> None:
+    """
+    Validate the optional chunk size shared by the readers.
+    """
+    if chunk_size is not None and chunk_size <= 0:
+        raise ValueError(f"chunk_size must be a positive integer, got {chunk_size}.")
+
+
+def _select_columns(
+    data: Union[pd.DataFrame, Iterator[pd.DataFrame]],
+    columns: Optional[Sequence[str]],
+) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
+    """
+    Project a DataFrame or a stream of chunks onto ``columns`` in the requested order.
+    """
+    if columns is None:
+        return data
+    columns = list(columns)
+    if isinstance(data, pd.DataFrame):
+        return data.reindex(columns=columns)
+    return (chunk.reindex(columns=columns) for chunk in data)
+
+
+def infer_format(input_path: Union[str, Path]) -> str:
+    """
+    Infer the ``load_data`` format name from a file suffix.
+
+    Args:
+        input_path (str or Path): Path to the input file.
+
+    Returns:
+        str: Format name for known suffixes, otherwise 'csv'.
+    """
+    return SUFFIX_FORMATS.get(strip_compression_suffix(input_path).suffix.lower(), "csv")
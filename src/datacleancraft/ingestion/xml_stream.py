@@ -0,0 +1,173 @@
+"""
+xml_stream.py: Record-level streaming XML ingestion.
+"""
+
+import xml.etree.ElementTree as ET
+import pandas as pd
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Union
+from datacleancraft.ingestion.compression import open_stream
+from datacleancraft.ingestion.json_stream import DEFAULT_BATCH_SIZE, normalize_batches
+
+# Number of elements inspected when auto-detecting the record element
+DETECT_SAMPLE_ELEMENTS = 10000
+
+
+def _local_name(tag: str) -> str:
+    """
+    Strip the ``{namespace}`` prefix ElementTree adds to qualified tags.
+    """
+    return tag.rsplit("}", 1)[-1] if tag.startswith("{") else tag
+
+
+def element_to_record(elem: ET.Element) -> Any:
+    """
+    Convert an element into a dictionary using xmltodict conventions.
+
+    Attributes become ``@name`` keys, repeated children become lists and text that sits
+    next to attributes or children is stored under ``#text``. Leaf elements without
+    attributes map to their text.
+
+    Args:
+        elem (ET.Element): Element to convert.
+
+    Returns:
+        Any: Dictionary for structured elements, text (or None) for plain leaves.
+    """
+    record: Dict[str, Any] = {f"@{_local_name(key)}": value for key, value in elem.attrib.items()}
+
+    for child in elem:
+        key = _local_name(child.tag)
+        value = element_to_record(child)
+        if key in record:
+            if not isinstance(record[key], list):
+                record[key] = [record[key]]
+            record[key].append(value)
+        else:
+            record[key] = value
+
+    text = elem.text.strip() if elem.text else ""
+    if not record:
+        return text or None
+    if text:
+        record["#text"] = text
+    return record
+
+
+def detect_record_tag(file_path: Union[str, Path], max_elements: int = DETECT_SAMPLE_ELEMENTS) -> str:
+    """
+    Auto-detect the repeated record element of an XML document.
+
+    Scans at most ``max_elements`` elements and picks the most frequent tag among the
+    shallowest siblings that repeat under a common parent. Falls back to the first child
+    of the root, or the root itself for documents without children.
+
+    Args:
+        file_path (str or Path): Path to the XML file.
+        max_elements (int): Number of elements to inspect before deciding.
+
+    Returns:
+        str: Local name of the record element.
+    """
+    # (depth, tag) -> highest number of occurrences under a single parent
+    repeats: Dict[tuple, int] = {}
+    child_counts = [Counter()]
+    root_tag = None
+    first_child_tag = None
+    seen = 0
+
+    with open_stream(file_path) as f:
+        for event, elem in ET.iterparse(f, events=("start", "end")):
+            if event == "start":
+                tag = _local_name(elem.tag)
+                depth = len(child_counts) - 1
+                if root_tag is None:
+                    root_tag = tag
+                elif depth == 1 and first_child_tag is None:
+                    first_child_tag = tag
+                counts = child_counts[-1]
+                counts[tag] += 1
+                if counts[tag] > 1:
+                    key = (depth, tag)
+                    repeats[key] = max(repeats.get(key, 0), counts[tag])
+                child_counts.append(Counter())
+                seen += 1
+                if seen >= max_elements:
+                    break
+            else:
+                child_counts.pop()
+                elem.clear()
+
+    if repeats:
+        min_depth = min(depth for depth, _ in repeats)
+        candidates = {tag: count for (depth, tag), count in repeats.items() if depth == min_depth}
+        return max(candidates, key=candidates.get)
+    if first_child_tag is not None:
+        return first_child_tag
+    if root_tag is None:
+        raise ValueError(f"No XML elements found in {file_path}.")
+    return root_tag
+
+
+def iter_xml_records(file_path: Union[str, Path], record_tag: Optional[str] = None) -> Iterator[Any]:
+    """
+    Stream one record per repeated element using ``iterparse``.
+
+    Processed elements are cleared and detached from their parents so memory stays
+    constant regardless of the document size.
+
+    Args:
+        file_path (str or Path): Path to the XML file.
+        record_tag (str, optional): Local name of the record element. Auto-detected if omitted.
+
+    Yields:
+        Any: Record dictionaries, see ``element_to_record``.
+    """
+    if record_tag is None:
+        record_tag = detect_record_tag(file_path)
+
+    stack = []
+    record_depth = None
+
+    with open_stream(file_path) as f:
+        for event, elem in ET.iterparse(f, events=("start", "end")):
+            if event == "start":
+                if record_depth is None and _local_name(elem.tag) == record_tag:
+                    record_depth = len(stack)
+                stack.append(elem)
+                continue
+
+            stack.pop()
+            depth = len(stack)
+            if record_depth is not None and depth > record_depth:
+                continue  # still building the current record
+
+            if depth == record_depth:
+                record = element_to_record(elem)
+                yield record if isinstance(record, dict) else {record_tag: record}
+                record_depth = None
+
+            # Drop finished elements so the tree never grows
+            elem.clear()
+            if stack:
+                stack[-1].remove(elem)
+
+
+def read_xml_batches(
+    file_path: Union[str, Path],
+    record_tag: Optional[str] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> Iterator[pd.DataFrame]:
+    """
+    Stream an XML file as flattened DataFrame batches with one row per record element.
+
+    Args:
+        file_path (str or Path): Path to the XML file.
+        record_tag (str, optional): Local name of the record element. Auto-detected if omitted.
+        batch_size (int): Maximum number of records per batch.
+
+    Yields:
+        pd.DataFrame: Flattened batch of records.
+    """
+    yield from normalize_batches(iter_xml_records(file_path, record_tag), batch_size)
@@ -1,10 +1,28 @@
-from .autoencoder_loader import load_autoencoder, SimpleAutoencoder
-from .gpt_integration import gpt_parse
-from .spacy_model_loader import SpacyModelLoader
-
-__all__ = [
-    "load_autoencoder",
-    "SimpleAutoencoder",
-    "gpt_parse",
-    "SpacyModelLoader",    
-]
\ No newline at end of file
+# Submodules pull in torch, spaCy and openai, so names are resolved on first access (PEP 562)
+import importlib
+
+_EXPORTS = {
+    "load_autoencoder": ".autoencoder_loader",
+    "SimpleAutoencoder": ".autoencoder_loader",
+    "train_autoencoder": ".autoencoder_trainer",
+    "FeatureScaler": ".autoencoder_trainer",
+    "AutoencoderRegistry": ".autoencoder_registry",
+    "gpt_parse": ".gpt_integration",
+    "SpacyModelLoader": ".spacy_model_loader",
+    "SpacyModelRegistry": ".model_registry",
+    "model_registry": ".model_registry",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -5,9 +5,18 @@ autoencoder_loader.py: Utility for loading and preparing Autoencoder models for
 import torch
 import torch.nn as nn
 import logging
+from typing import Optional
 
 logger = logging.getLogger(__name__)
 
+# Versions of the SimpleAutoencoder layers. Version 1, the original, ends the encoder with
+# a ReLU; untrained models keep it so their scores do not change. Version 2 keeps the code
+# layer linear (a ReLU there can switch off the whole bottleneck during training, leaving
+# a model that only predicts the mean) and is used for trained models.
+ORIGINAL_ARCHITECTURE = 1
+LINEAR_CODE_ARCHITECTURE = 2
+ARCHITECTURES = (ORIGINAL_ARCHITECTURE, LINEAR_CODE_ARCHITECTURE)
+
 class SimpleAutoencoder(nn.Module):
     """
     Basic Autoencoder architecture for structured numeric data.
@@ -15,21 +24,28 @@ class SimpleAutoencoder(nn.Module):
     Encoder compresses input; Decoder reconstructs it.
     """
 
-    def __init__(self, input_dim: int):
+    def __init__(self, input_dim: int, architecture: int = ORIGINAL_ARCHITECTURE):
         """
         Initialize the Autoencoder layers.
 
         Args:
             input_dim (int): Number of features in the input data.
+            architecture (int): Layer version, ``ORIGINAL_ARCHITECTURE`` or
+                ``LINEAR_CODE_ARCHITECTURE``. Both have the same parameters.
         """
         super(SimpleAutoencoder, self).__init__()
+        if architecture not in ARCHITECTURES:
+            raise ValueError(f"Unknown autoencoder architecture {architecture!r}; expected one of {ARCHITECTURES}.")
+        self.architecture = architecture
 
-        self.encoder = nn.Sequential(
+        encoder_layers = [
             nn.Linear(input_dim, input_dim // 2),
             nn.ReLU(),
             nn.Linear(input_dim // 2, input_dim // 4),
-            nn.ReLU(),
-        )
+        ]
+        if architecture == ORIGINAL_ARCHITECTURE:
+            encoder_layers.append(nn.ReLU())
+        self.encoder = nn.Sequential(*encoder_layers)
 
         self.decoder = nn.Sequential(
             nn.Linear(input_dim // 4, input_dim // 2),
@@ -51,21 +67,27 @@ class SimpleAutoencoder(nn.Module):
         decoded = self.decoder(encoded)
         return decoded
 
-def load_autoencoder(input_dim: int) -> nn.Module:
+def load_autoencoder(
+    input_dim: int,
+    weights_path: Optional[str] = None,
+    architecture: int = ORIGINAL_ARCHITECTURE,
+) -> nn.Module:
     """
-    Load a simple untrained Autoencoder model.
+    Load a simple Autoencoder model, untrained unless weights are given.
 
     Args:
         input_dim (int): Number of features in the input data.
+        weights_path (str, optional): File with a saved ``state_dict`` to load.
+        architecture (int): Layer version the weights were trained with.
 
     Returns:
         nn.Module: SimpleAutoencoder instance.
     """
     try:
-        model = SimpleAutoencoder(input_dim)
+        model = SimpleAutoencoder(input_dim, architecture)
+        if weights_path is not None:
+            model.load_state_dict(torch.load(weights_path, map_location="cpu", weights_only=True))
         logger.info(f"[AutoencoderLoader] Loaded autoencoder with input dimension {input_dim}")
-        # Load pre-trained weights if necessary
-        #model.load_state_dict(torch.load("path_to_model_weights.pth"))
         return model
     except Exception as e:
         logger.error(f"[AutoencoderLoader] Failed to load autoencoder: {e}", exc_info=True)
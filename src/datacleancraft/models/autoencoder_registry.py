@@ -0,0 +1,134 @@
+"""
+autoencoder_registry.py: Local store of trained autoencoders and their scalers, keyed by schema fingerprint.
+"""
+
+import logging
+import os
+import threading
+import torch
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from datacleancraft.models.autoencoder_loader import LINEAR_CODE_ARCHITECTURE, SimpleAutoencoder, load_autoencoder
+from datacleancraft.models.autoencoder_trainer import FeatureScaler
+from datacleancraft.utils.cache import get_cache_dir
+
+logger = logging.getLogger(__name__)
+
+# Trained model, its input scaler and the training metadata
+RegistryEntry = Tuple[SimpleAutoencoder, FeatureScaler, dict]
+
+
+class AutoencoderRegistry:
+    """
+    Save and load trained autoencoders, one file per schema fingerprint.
+
+    Each entry holds the model weights, the input dimension, the layer version
+    (``architecture``), the scaler statistics and the training metadata in a single ``<fingerprint>.pt`` file, written atomically.
+    Loaded entries are kept in memory (until the file changes), so repeated lookups in
+    one process do not touch the disk.
+    """
+
+    def __init__(self, root: Optional[str] = None):
+        """
+        Args:
+            root (str, optional): Directory of the registry. Defaults to ``autoencoders``
+                inside the datacleancraft cache directory.
+        """
+        self.root = Path(root) if root is not None else get_cache_dir("autoencoders")
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._loaded: Dict[str, Tuple[int, RegistryEntry]] = {}
+        self._lock = threading.Lock()
+
+    def path(self, fingerprint: str) -> Path:
+        """
+        File holding the entry of a fingerprint.
+        """
+        return self.root / f"{fingerprint}.pt"
+
+    def __contains__(self, fingerprint: str) -> bool:
+        return self.path(fingerprint).exists()
+
+    def fingerprints(self) -> List[str]:
+        """
+        Fingerprints with a saved model.
+        """
+        return sorted(path.stem for path in self.root.glob("*.pt"))
+
+    def save(self, fingerprint: str, model: SimpleAutoencoder, scaler: FeatureScaler, metadata: Optional[dict] = None) -> Path:
+        """
+        Store a trained model and its scaler under ``fingerprint``, replacing any previous one.
+
+        Args:
+            fingerprint (str): Schema fingerprint of the training data.
+            model (SimpleAutoencoder): Trained model.
+            scaler (FeatureScaler): Scaler fitted on the training data.
+            metadata (dict, optional): Training details stored with the model.
+
+        Returns:
+            Path: File written.
+        """
+        path = self.path(fingerprint)
+        payload = {
+            "input_dim": int(model.encoder[0].in_features),
+            "architecture": int(model.architecture),
+            "state_dict": model.state_dict(),
+            "mean": torch.from_numpy(scaler.mean),
+            "scale": torch.from_numpy(scaler.scale),
+            "metadata": dict(metadata or {}),
+        }
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        torch.save(payload, tmp_path)
+        os.replace(tmp_path, path)
+        with self._lock:
+            self._loaded.pop(fingerprint, None)
+        logger.info(f"[AutoencoderRegistry] Saved model {fingerprint} to {path}")
+        return path
+
+    def load(self, fingerprint: str) -> Optional[RegistryEntry]:
+        """
+        Load the model, scaler and metadata saved under ``fingerprint``.
+
+        Args:
+            fingerprint (str): Schema fingerprint of the data to score.
+
+        Returns:
+            RegistryEntry: ``(model, scaler, metadata)`` with the model in evaluation mode,
+            or None if no model is saved for the fingerprint.
+        """
+        path = self.path(fingerprint)
+        try:
+            mtime = path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+        with self._lock:
+            cached = self._loaded.get(fingerprint)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        payload = torch.load(path, map_location="cpu", weights_only=True)
+        # Entries written before the version was stored were all trained with a linear code layer
+        architecture = int(payload.get("architecture", LINEAR_CODE_ARCHITECTURE))
+        model = load_autoencoder(payload["input_dim"], architecture=architecture)
+        model.load_state_dict(payload["state_dict"])
+        model.eval()
+        scaler = FeatureScaler(payload["mean"].numpy(), payload["scale"].numpy())
+        entry = (model, scaler, payload["metadata"])
+        with self._lock:
+            self._loaded[fingerprint] = (mtime, entry)
+        return entry
+
+    def delete(self, fingerprint: str) -> bool:
+        """
+        Remove the entry of a fingerprint.
+
+        Returns:
+            bool: True if an entry was removed.
+        """
+        with self._lock:
+            self._loaded.pop(fingerprint, None)
+        try:
+            self.path(fingerprint).unlink()
+            return True
+        except FileNotFoundError:
+            return False
@@ -0,0 +1,152 @@
+"""
+autoencoder_trainer.py: CPU training of SimpleAutoencoder models with mini-batches and early stopping.
+"""
+
+import logging
+import time
+import numpy as np
+import torch
+from typing import Optional, Tuple
+from datacleancraft.models.autoencoder_loader import LINEAR_CODE_ARCHITECTURE, SimpleAutoencoder
+
+logger = logging.getLogger(__name__)
+
+
+class FeatureScaler:
+    """
+    Standardize features to zero mean and unit variance, as seen by the autoencoder.
+    """
+
+    def __init__(self, mean: np.ndarray, scale: np.ndarray):
+        """
+        Args:
+            mean (np.ndarray): Per-feature mean.
+            scale (np.ndarray): Per-feature standard deviation (1 for constant features).
+        """
+        self.mean = np.asarray(mean, dtype=np.float32)
+        self.scale = np.asarray(scale, dtype=np.float32)
+
+    @classmethod
+    def fit(cls, values: np.ndarray) -> "FeatureScaler":
+        """
+        Compute the mean and standard deviation of every column of ``values``.
+        """
+        values = np.asarray(values, dtype=np.float64)
+        scale = values.std(axis=0)
+        scale[scale == 0] = 1.0
+        return cls(values.mean(axis=0), scale)
+
+    def transform(self, values: np.ndarray) -> np.ndarray:
+        """
+        Scale ``values`` with the fitted statistics.
+        """
+        return ((np.asarray(values, dtype=np.float32) - self.mean) / self.scale).astype(np.float32)
+
+
+def reconstruction_errors(model: torch.nn.Module, inputs: torch.Tensor, batch_size: int = 4096) -> np.ndarray:
+    """
+    Mean squared reconstruction error of every row of ``inputs``.
+    """
+    model.eval()
+    errors = []
+    with torch.no_grad():
+        for start in range(0, len(inputs), batch_size):
+            batch = inputs[start:start + batch_size]
+            errors.append(torch.mean((model(batch) - batch) ** 2, dim=1))
+    return torch.cat(errors).numpy() if errors else np.empty(0, dtype=np.float32)
+
+
+def train_autoencoder(
+    values: np.ndarray,
+    epochs: int = 100,
+    batch_size: int = 256,
+    learning_rate: float = 1e-3,
+    validation_split: float = 0.1,
+    patience: int = 5,
+    min_delta: float = 1e-4,
+    seed: Optional[int] = 0,
+    architecture: int = LINEAR_CODE_ARCHITECTURE,
+) -> Tuple[SimpleAutoencoder, FeatureScaler, dict]:
+    """
+    Train an autoencoder on the rows of a numeric matrix.
+
+    Features are standardized, then the model is trained with Adam on shuffled
+    mini-batches. After every epoch the loss on a held-out validation split (the training
+    loss if there are too few rows to split) is checked: training stops once it has not
+    improved by ``min_delta`` for ``patience`` epochs, and the best weights are restored.
+
+    Args:
+        values (np.ndarray): Training rows, one column per feature, no missing values.
+        epochs (int): Maximum number of passes over the training rows.
+        batch_size (int): Rows per optimizer step.
+        learning_rate (float): Adam learning rate.
+        validation_split (float): Fraction of rows held out for early stopping.
+        patience (int): Epochs without improvement before stopping.
+        min_delta (float): Smallest loss decrease counted as an improvement.
+        seed (int, optional): Seed for weight initialization, shuffling and the split.
+        architecture (int): SimpleAutoencoder layer version. Defaults to the linear code
+            layer, which trains reliably; the original version is kept for untrained models.
+
+    Returns:
+        Tuple[SimpleAutoencoder, FeatureScaler, dict]: Trained model in evaluation mode,
+        fitted scaler and training metadata (``rows``, ``epochs``, ``best_loss``,
+        ``train_error_p99``, ``seconds`` and ``architecture``).
+    """
+    values = np.asarray(values, dtype=np.float32)
+    if values.ndim != 2 or len(values) < 2:
+        raise ValueError("Training needs a 2-D array with at least two rows.")
+
+    start = time.perf_counter()
+    generator = torch.Generator()
+    if seed is not None:
+        torch.manual_seed(seed)
+        generator.manual_seed(seed)
+
+    scaler = FeatureScaler.fit(values)
+    inputs = torch.from_numpy(scaler.transform(values))
+    order = torch.randperm(len(inputs), generator=generator)
+    n_validation = int(len(inputs) * validation_split)
+    if n_validation > 0 and len(inputs) - n_validation > 0:
+        train_inputs, validation_inputs = inputs[order[n_validation:]], inputs[order[:n_validation]]
+    else:
+        train_inputs, validation_inputs = inputs, inputs
+
+    model = SimpleAutoencoder(values.shape[1], architecture)
+    optimizer = torch.optim.Adam(model.parameters(), lr=learning_rate)
+    loss_fn = torch.nn.MSELoss()
+
+    best_loss = float("inf")
+    best_state = {name: tensor.clone() for name, tensor in model.state_dict().items()}
+    stale_epochs = 0
+    epoch = 0
+    for epoch in range(1, epochs + 1):
+        model.train()
+        for batch_index in torch.randperm(len(train_inputs), generator=generator).split(batch_size):
+            batch = train_inputs[batch_index]
+            optimizer.zero_grad()
+            loss = loss_fn(model(batch), batch)
+            loss.backward()
+            optimizer.step()
+
+        validation_loss = float(reconstruction_errors(model, validation_inputs).mean())
+        if validation_loss < best_loss - min_delta:
+            best_loss = validation_loss
+            best_state = {name: tensor.clone() for name, tensor in model.state_dict().items()}
+            stale_epochs = 0
+        else:
+            stale_epochs += 1
+            if stale_epochs >= patience:
+                break
+
+    model.load_state_dict(best_state)
+    model.eval()
+    metadata = {
+        "rows": len(values),
+        "epochs": epoch,
+        "best_loss": best_loss,
+        "train_error_p99": float(np.quantile(reconstruction_errors(model, inputs), 0.99)),
+        "seconds": time.perf_counter() - start,
+        "architecture": architecture,
+    }
+    logger.info(f"[AutoencoderTrainer] Trained on {len(values)} rows in {epoch} epochs, best loss {best_loss:.4f}")
+    return model, scaler, metadata
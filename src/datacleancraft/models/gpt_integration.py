@@ -3,7 +3,6 @@ Optional GPT-3.5/4 integration for advanced data parsing.
 """
 
 import os
-import openai
 import pandas as pd
 from typing import Optional
 
@@ -23,6 +22,8 @@ def gpt_parse(text: str, prompt_template: Optional[str] = None) -> str:
     if not OPENAI_API_KEY:
         raise EnvironmentError("OpenAI API Key not found. Set OPENAI_API_KEY environment variable.")
 
+    import openai
+
     openai.api_key = OPENAI_API_KEY
 
     try:
@@ -0,0 +1,187 @@
+"""
+model_registry.py: Process-wide, thread-safe registry of loaded spaCy pipelines.
+"""
+
+import logging
+import threading
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    import spacy
+
+logger = logging.getLogger(__name__)
+
+# (model name, disabled components, excluded components)
+ModelKey = Tuple[str, Tuple[str, ...], Tuple[str, ...]]
+
+
+def model_key(name: str, disable: Optional[Iterable[str]] = None, exclude: Optional[Iterable[str]] = None) -> ModelKey:
+    """
+    Build the registry key of a model configuration; component order does not matter.
+    """
+    return (name, tuple(sorted(set(disable or ()))), tuple(sorted(set(exclude or ()))))
+
+
+@lru_cache(maxsize=None)
+def ensure_package(name: str) -> bool:
+    """
+    Check once per process that a model package is installed, downloading it if not.
+
+    Args:
+        name (str): Model package name, e.g. ``"en_core_web_sm"``.
+
+    Returns:
+        bool: True if the package is installed (or ``name`` is a model directory). A failed
+        download is remembered too, so it is not retried on every load.
+    """
+    from spacy.util import is_package
+
+    if is_package(name) or Path(name).exists():
+        return True
+    logger.info(f"Model '{name}' not found locally. Trying to download...")
+    try:
+        from spacy.cli import download
+        download(name)
+    except (Exception, SystemExit) as e:
+        logger.warning(f"Could not download model '{name}': {e}")
+        return False
+    return True
+
+
+class SpacyModelRegistry:
+    """
+    Hand out one shared ``Language`` instance per model name and component selection.
+
+    Loads are serialized per key, so concurrent callers asking for the same model wait for
+    a single ``spacy.load`` instead of loading it several times. Pipelines are shared:
+    callers must not add or remove components on them.
+    """
+
+    def __init__(self):
+        self._models: Dict[ModelKey, "spacy.language.Language"] = {}
+        self._key_locks: Dict[ModelKey, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self._load_seconds: Dict[ModelKey, float] = {}
+        self._total_load_seconds = 0.0
+        self._loads = 0
+        self._hits = 0
+        self._evictions = 0
+
+    def get(
+        self,
+        name: str,
+        disable: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+    ) -> "spacy.language.Language":
+        """
+        Return the shared pipeline for a configuration, loading it on first use.
+
+        Args:
+            name (str): Model package name or path.
+            disable (Iterable[str], optional): Components loaded but disabled.
+            exclude (Iterable[str], optional): Components not loaded at all.
+
+        Returns:
+            spacy.language.Language: Loaded pipeline.
+        """
+        key = model_key(name, disable, exclude)
+        with self._lock:
+            nlp = self._models.get(key)
+            if nlp is not None:
+                self._hits += 1
+                return nlp
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            with self._lock:
+                nlp = self._models.get(key)
+                if nlp is not None:
+                    self._hits += 1
+                    return nlp
+
+            import spacy
+
+            ensure_package(name)
+            start = time.perf_counter()
+            nlp = spacy.load(name, disable=list(key[1]), exclude=list(key[2]))
+            elapsed = time.perf_counter() - start
+
+            with self._lock:
+                self._models[key] = nlp
+                self._load_seconds[key] = elapsed
+                self._total_load_seconds += elapsed
+                self._loads += 1
+            logger.info(f"Loaded spaCy model {key} in {elapsed:.2f}s")
+            return nlp
+
+    def preload(
+        self,
+        name: str,
+        disable: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+    ) -> "spacy.language.Language":
+        """
+        Load a configuration ahead of time (e.g. at service start-up); same as ``get``.
+        """
+        return self.get(name, disable=disable, exclude=exclude)
+
+    def evict(
+        self,
+        name: Optional[str] = None,
+        disable: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+    ) -> int:
+        """
+        Drop loaded pipelines so their memory can be reclaimed.
+
+        Args:
+            name (str, optional): Model to evict. All models if omitted.
+            disable, exclude (Iterable[str], optional): Evict only this configuration of
+                ``name``; every configuration of ``name`` if both are omitted.
+
+        Returns:
+            int: Number of evicted pipelines.
+        """
+        with self._lock:
+            if name is None:
+                keys = list(self._models)
+            elif disable is None and exclude is None:
+                keys = [key for key in self._models if key[0] == name]
+            else:
+                keys = [key for key in [model_key(name, disable, exclude)] if key in self._models]
+            for key in keys:
+                del self._models[key]
+                self._load_seconds.pop(key, None)
+            self._evictions += len(keys)
+        return len(keys)
+
+    def loaded(self) -> List[ModelKey]:
+        """
+        Keys of the pipelines currently held.
+        """
+        with self._lock:
+            return list(self._models)
+
+    def metrics(self) -> dict:
+        """
+        Report loads, cache hits, evictions and load times of the held pipelines.
+
+        Returns:
+            dict: ``loads``, ``hits``, ``evictions``, ``load_seconds`` (total over all
+            loads) and ``models`` mapping each held key to its load time in seconds.
+        """
+        with self._lock:
+            return {
+                "loads": self._loads,
+                "hits": self._hits,
+                "evictions": self._evictions,
+                "load_seconds": self._total_load_seconds,
+                "models": dict(self._load_seconds),
+            }
+
+
+# Registry shared by every loader in the process
+model_registry = SpacyModelRegistry()
@@ -2,40 +2,62 @@
 spacy_model_loader.py: Module to load pre-trained SpaCy models.
 """
 
-import spacy
-from spacy.util import is_package
-from typing import Optional
+from typing import TYPE_CHECKING, List, Optional
+from datacleancraft.models.model_registry import ensure_package, model_registry
+
+if TYPE_CHECKING:
+    import spacy
 
 class SpacyModelLoader:
     """
     Class to load and manage SpaCy NLP models.
     """
 
-    def __init__(self, model_name: str = "en_core_web_sm"):
+    def __init__(
+        self,
+        model_name: str = "en_core_web_sm",
+        exclude: Optional[List[str]] = None,
+        disable: Optional[List[str]] = None,
+        shared: bool = True,
+    ):
+        """
+        Args:
+            model_name (str): Name of the spaCy model package.
+            exclude (List[str], optional): Pipeline components not to load at all, e.g.
+                ``["parser", "ner"]``. Names missing from the model are ignored.
+            disable (List[str], optional): Pipeline components loaded but disabled.
+            shared (bool): Take the model from the process-wide ``model_registry``, so every
+                loader with the same configuration gets the same instance. False loads a
+                private copy that may be modified.
+        """
         self.model_name = model_name
+        self.exclude = list(exclude) if exclude else []
+        self.disable = list(disable) if disable else []
+        self.shared = shared
         self.model = None
 
-    def load_model(self) -> Optional[spacy.language.Language]:
+    def load_model(self) -> Optional["spacy.language.Language"]:
         """
-        Loads the specified SpaCy model. Downloads if not available.
+        Loads the specified SpaCy model. Downloads if not available (checked once per process).
 
         Returns:
             spacy.language.Language: Loaded SpaCy model instance.
         """
         try:
-            if not is_package(self.model_name):
-                print(f"Model '{self.model_name}' not found locally. Trying to download...")
-                from spacy.cli import download
-                download(self.model_name)
+            if self.shared:
+                self.model = model_registry.get(self.model_name, disable=self.disable, exclude=self.exclude)
+            else:
+                import spacy
 
-            self.model = spacy.load(self.model_name)
+                ensure_package(self.model_name)
+                self.model = spacy.load(self.model_name, disable=self.disable, exclude=self.exclude)
             return self.model
 
         except Exception as e:
             print(f"❗ Failed to load SpaCy model '{self.model_name}': {str(e)}")
             return None
 
-    def process_text(self, text: str) -> Optional[spacy.tokens.Doc]:
+    def process_text(self, text: str) -> Optional["spacy.tokens.Doc"]:
         """
         Processes text using the loaded SpaCy model.
 
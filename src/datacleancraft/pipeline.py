@@ -2,19 +2,67 @@
 pipeline.py - Main Data Cleaning Pipeline for DataCleanCraft.
 """
 
+import os
+import shutil
+import tempfile
 import pandas as pd
 import numpy as np
+from collections import Counter
 from datacleancraft.utils.logger import default_logger
-from datacleancraft.ingestion.reader import load_data
+from datacleancraft.ingestion.reader import iter_files, load_data, resolve_inputs
+from datacleancraft.ingestion.compression import strip_compression_suffix
+from datacleancraft.ingestion.dtype_optimizer import DtypeOptimizer
 from datacleancraft.preprocessing.cleaner import TextCleaner
+from datacleancraft.preprocessing.deduplicator import HashDeduplicator
+from datacleancraft.preprocessing.fused_nlp import FusedRedactCleaner
+from datacleancraft.preprocessing.near_duplicates import NearDuplicateDetector
 from datacleancraft.preprocessing.pii_redactor import PIIRedactor
 from datacleancraft.validation.quality_checker import DataQualityChecker
 from datacleancraft.validation.anomaly_detector import AnomalyDetector
 from datacleancraft.structuring.standardizer import Standardizer
 from datacleancraft.structuring.mapper import FieldMapper
 from datacleancraft.export.writer import export_data
+from datacleancraft.utils.error_handler import PipelineError
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional
+
+
+def per_file_output_paths(paths: List[Path], output_dir: Path, export_format: str) -> Dict[Path, Path]:
+    """
+    Choose one distinct output file per input for ``per_file_output``.
+
+    Outputs mirror the input layout below the inputs' common directory, so ``a/part.csv``
+    and ``b/part.csv`` become ``a/part.<format>`` and ``b/part.<format>``. Inputs whose
+    names differ only by suffix (``data.csv`` and ``data.json``) keep it in the output
+    name: ``data.csv.<format>`` and ``data.json.<format>``.
+
+    Args:
+        paths (List[Path]): Input files.
+        output_dir (Path): Output directory.
+        export_format (str): Export format, used as the output suffix.
+
+    Returns:
+        Dict[Path, Path]: Output file of every input.
+
+    Raises:
+        PipelineError: If two inputs would still be written to the same file.
+    """
+    paths = [Path(path) for path in paths]
+    root = Path(os.path.commonpath([path.parent for path in paths])) if paths else Path()
+    relative = {path: strip_compression_suffix(path).relative_to(root) for path in paths}
+    stems = Counter(name.with_suffix("") for name in relative.values())
+
+    targets = {}
+    for path, name in relative.items():
+        if stems[name.with_suffix("")] > 1:
+            targets[path] = output_dir / name.parent / f"{name.name}.{export_format}"
+        else:
+            targets[path] = output_dir / name.with_suffix(f".{export_format}")
+
+    clashes = [target for target, count in Counter(targets.values()).items() if count > 1]
+    if clashes:
+        raise PipelineError(f"Several inputs would be written to the same output file: {clashes}")
+    return targets
 
 
 class DataCleaningPipeline:
@@ -28,9 +76,29 @@ class DataCleaningPipeline:
         output_path: str,
         export_format: str = "csv",
         column_mapping: Optional[dict] = None,
-        anomaly_threshold: float = 0.1,
+        anomaly_threshold: Optional[float] = None,
         redact_pii_enabled: bool = True,
         anomaly_detection_enabled: bool = True,
+        chunk_size: Optional[int] = None,
+        columns: Optional[List[str]] = None,
+        filters: Optional[list] = None,
+        csv_engine: str = "c",
+        optimize_dtypes: bool = False,
+        workers: Optional[int] = None,
+        per_file_output: bool = False,
+        nlp_batch_size: int = 1000,
+        n_process: int = 1,
+        dedup_hash_bits: int = 64,
+        dedup_memory_limit: int = 5_000_000,
+        near_duplicate_threshold: Optional[float] = None,
+        near_duplicate_action: str = "mark",
+        near_duplicate_columns: Optional[List[str]] = None,
+        near_duplicate_window: Optional[int] = None,
+        ner_gate: bool = False,
+        ner_profile_sample: Optional[int] = None,
+        regex_only_columns: Optional[List[str]] = None,
+        train_anomaly_model: bool = False,
+        drop_new_columns: bool = False,
     ):
         self.input_path = input_path
         self.output_path = output_path
@@ -40,56 +108,348 @@ class DataCleaningPipeline:
         self.logger = default_logger
         self.redact_pii_enabled = redact_pii_enabled
         self.anomaly_detection_enabled = anomaly_detection_enabled
+        self.chunk_size = chunk_size
+        self.columns = columns
+        self.filters = filters
+        self.csv_engine = csv_engine
+        self.optimize_dtypes = optimize_dtypes
+        self.workers = workers
+        self.per_file_output = per_file_output
+        self.nlp_batch_size = nlp_batch_size
+        self.n_process = n_process
+        self.dedup_hash_bits = dedup_hash_bits
+        self.dedup_memory_limit = dedup_memory_limit
+        self.near_duplicate_threshold = near_duplicate_threshold
+        self.near_duplicate_action = near_duplicate_action
+        self.near_duplicate_columns = near_duplicate_columns
+        self.near_duplicate_window = near_duplicate_window
+        self.ner_gate = ner_gate
+        self.ner_profile_sample = ner_profile_sample
+        self.regex_only_columns = regex_only_columns
+        self.train_anomaly_model = train_anomaly_model
+        self.drop_new_columns = drop_new_columns
 
     def run(self):
         """
         Execute the data cleaning pipeline.
+
+        ``input_path`` may be a file, a directory or a glob pattern; multiple files are read
+        in parallel with ``workers`` threads and cleaned as one dataset. With
+        ``per_file_output`` each input is cleaned into its own file inside the
+        ``output_path`` directory instead. The stages (and their models) are created once
+        and shared by all files.
+
+        When ``chunk_size`` is set the input is streamed: every stage runs on one chunk
+        at a time and each cleaned chunk is appended to the output file, so peak memory
+        depends on the chunk size rather than the file size. The input columns of the first
+        chunk fix the layout: a later chunk missing some of them gets empty values, and a
+        chunk with new input columns raises PipelineError unless ``drop_new_columns`` is
+        set, in which case they are dropped with a warning. Columns added by the pipeline
+        (such as the anomaly scores) are present in every chunk.
+
+        Duplicate rows are dropped across all chunks and files of an output, using row
+        hashes kept in memory up to ``dedup_memory_limit`` and spilled to disk beyond it.
+        With ``near_duplicate_threshold`` set, rows whose cleaned text is similar are also
+        marked (``near_duplicate_action="mark"``) or dropped (``"drop"``). Their index holds
+        every row unless ``near_duplicate_window`` limits it to the most recent rows.
+
+        With ``train_anomaly_model`` a streamed input is cleaned in a first pass that
+        samples its numeric rows across all chunks; the cleaned chunks are kept in a
+        temporary directory until the model is trained on the sample, then scored and
+        written.
         """
         self.logger.info("🚀 Starting DataCleanCraft Pipeline.")
 
         # Step 1: Load Data
-        df = load_data(self.input_path)
-        self.logger.info(f"✅ Loaded data with {df.shape[0]} rows and {df.shape[1]} columns.")
+        dtype_optimizer = DtypeOptimizer() if self.optimize_dtypes else None
+        load_options = dict(
+            chunk_size=self.chunk_size,
+            columns=self.columns,
+            filters=self.filters,
+            engine=self.csv_engine,
+            dtype_optimizer=dtype_optimizer,
+        )
+        paths = resolve_inputs(self.input_path)
+        if len(paths) > 1:
+            self.logger.info(f"✅ Found {len(paths)} input files.")
+
+        self._setup_stages()
+
+        try:
+            if self.per_file_output:
+                total_rows = self._run_per_file(paths, load_options)
+            else:
+                data = load_data(paths, workers=self.workers, **load_options)
+                total_rows = self._process_and_export(data, self.output_path)
+        finally:
+            self.deduplicator.close()
+
+        if self.pii_redactor is not None and (self.ner_gate or self.ner_profile_sample):
+            stats = self.pii_redactor.stats
+            skipped = stats["skipped_by_gate"] + stats["skipped_by_profile"]
+            disabled = [col for col, use_ner in self.pii_redactor.column_profiles.items() if not use_ner]
+            self.logger.info(f"✅ NER skipped {skipped} of {stats['values']} redacted values: {stats}; NER off for columns {disabled}")
+
+        if dtype_optimizer is not None:
+            saved = {col: size for col, size in dtype_optimizer.bytes_saved.items() if size}
+            self.logger.info(f"✅ Optimized dtypes saved {sum(saved.values())} bytes: {saved}")
+
+        self.logger.info(f"✅ Exported {total_rows} cleaned rows to {self.output_path} in {self.export_format.upper()} format.")
+
+        self.logger.info("🎉 DataCleanCraft Pipeline completed successfully.")
+
+    def _run_per_file(self, paths: List[Path], load_options: dict) -> int:
+        """
+        Clean every input into its own file inside ``output_path`` (see ``per_file_output_paths``).
+        """
+        output_dir = Path(self.output_path)
+        # Checked before any processing, so a name clash cannot overwrite a finished output
+        targets = per_file_output_paths(paths, output_dir, self.export_format)
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        if self.chunk_size is None:
+            dtype_optimizer = load_options["dtype_optimizer"]
+            files = iter_files(
+                paths,
+                columns=self.columns,
+                filters=self.filters,
+                engine=self.csv_engine,
+                workers=self.workers,
+            )
+            if dtype_optimizer is not None:
+                files = ((path, dtype_optimizer.optimize(df)) for path, df in files)
+        else:
+            files = ((path, load_data(path, **load_options)) for path in paths)
+
+        total_rows = 0
+        for path, data in files:
+            output_path = targets[Path(path)]
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            self.logger.info(f"✅ Cleaning {path} into {output_path}.")
+            # Each output file is deduplicated on its own
+            self.deduplicator.close()
+            if self.near_duplicate_detector is not None:
+                self.near_duplicate_detector.reset()
+            total_rows += self._process_and_export(data, output_path)
+        return total_rows
+
+    def _process_and_export(self, data, output_path) -> int:
+        """
+        Clean a DataFrame or a stream of chunks and write it to ``output_path``.
+
+        Returns:
+            int: Number of exported rows.
+        """
+        if isinstance(data, pd.DataFrame):
+            self.logger.info(f"✅ Loaded data with {data.shape[0]} rows and {data.shape[1]} columns.")
+            chunks = [data]
+        else:
+            self.logger.info(f"✅ Streaming data in chunks of {self.chunk_size} rows.")
+            chunks = data
+
+        # Training on a streamed input waits for a sample of every chunk, so the cleaned
+        # chunks are kept on disk until the model is ready
+        spool_dir = None
+        if not isinstance(data, pd.DataFrame) and self.anomaly_detection_enabled and self.train_anomaly_model:
+            spool_dir = Path(tempfile.mkdtemp(prefix="datacleancraft-chunks-"))
+        try:
+            return self._clean_and_export(chunks, output_path, spool_dir)
+        finally:
+            if spool_dir is not None:
+                shutil.rmtree(spool_dir, ignore_errors=True)
+
+    def _clean_and_export(self, chunks, output_path, spool_dir: Optional[Path]) -> int:
+        """
+        Clean and write the chunks of one output; with ``spool_dir``, train the anomaly
+        model on a sample of all chunks before scoring any of them.
+        """
+        total_rows = 0
+        input_columns = None
+        output_columns = None
+        spooled = []
+        for chunk_index, df in enumerate(chunks):
+            if self.chunk_size is not None:
+                self.logger.info(f"✅ Processing chunk {chunk_index + 1} with {df.shape[0]} rows.")
+
+            # Line every chunk up with the input columns of the first one, so the cleaned
+            # chunks share the header written with the first chunk
+            if input_columns is None:
+                input_columns = df.columns
+            elif not df.columns.equals(input_columns):
+                new_columns = [col for col in df.columns if col not in input_columns]
+                if new_columns and not self.drop_new_columns:
+                    raise PipelineError(
+                        f"Chunk {chunk_index + 1} of {output_path} has columns not present in the first chunk: "
+                        f"{new_columns}. Enable drop_new_columns to write it without them."
+                    )
+                if new_columns:
+                    self.logger.warning(f"⚠️ Dropping columns not present in the first chunk: {new_columns}")
+                df = df.reindex(columns=input_columns)
+
+            if spool_dir is None:
+                df = self.process(df)
+            else:
+                df = self.clean(df)
+                self.anomaly_detector.observe(df)
+                spool_path = spool_dir / f"chunk-{chunk_index:06d}.pkl"
+                df.to_pickle(spool_path)
+                spooled.append(spool_path)
+                continue
+
+            output_columns = self._export_chunk(df, output_path, chunk_index, output_columns)
+            total_rows += df.shape[0]
+
+        if spooled:
+            self.logger.info(f"✅ Training anomaly models on rows sampled from {len(spooled)} chunks.")
+            self.anomaly_detector.train_from_samples()
+        for chunk_index, spool_path in enumerate(spooled):
+            df = self.detect(pd.read_pickle(spool_path))
+            spool_path.unlink()
+            output_columns = self._export_chunk(df, output_path, chunk_index, output_columns)
+            total_rows += df.shape[0]
+        return total_rows
+
+    def _export_chunk(self, df: pd.DataFrame, output_path, chunk_index: int, output_columns: Optional[pd.Index]) -> pd.Index:
+        """
+        Write one cleaned chunk in the column order of the first one.
+
+        Returns:
+            pd.Index: Output columns of the file.
+        """
+        if output_columns is None:
+            output_columns = df.columns
+        elif not df.columns.equals(output_columns):
+            if set(df.columns) != set(output_columns):
+                raise PipelineError(
+                    f"Cleaning chunk {chunk_index + 1} of {output_path} produced columns {list(df.columns)} "
+                    f"instead of {list(output_columns)}."
+                )
+            df = df[output_columns]
+
+        # Step 8: Export Cleaned Data
+        export_data(df, output_path, format=self.export_format, append=chunk_index > 0)
+        return output_columns
+
+    def _setup_stages(self):
+        """
+        Create the stage objects once per run so models are not reloaded for every chunk.
+        """
+        self.quality_checker = DataQualityChecker()
+        self.deduplicator = HashDeduplicator(bits=self.dedup_hash_bits, max_memory_hashes=self.dedup_memory_limit)
+        self.standardizer = Standardizer()
+        self.pii_redactor = (
+            PIIRedactor(gate_ner=self.ner_gate, profile_sample_size=self.ner_profile_sample)
+            if self.redact_pii_enabled else None
+        )
+        if self.pii_redactor is not None:
+            # Redaction and cleaning share one model and one parse per value
+            self.text_cleaner = TextCleaner(lite=True, nlp=self.pii_redactor.nlp)
+            self.fused_nlp = FusedRedactCleaner(self.pii_redactor, self.text_cleaner)
+        else:
+            self.text_cleaner = TextCleaner(lite=True)
+            self.fused_nlp = None
+        self.field_mapper = FieldMapper(self.column_mapping) if self.column_mapping else None
+        self.anomaly_detector = (
+            AnomalyDetector(threshold=self.anomaly_threshold, train_if_missing=self.train_anomaly_model)
+            if self.anomaly_detection_enabled else None
+        )
+        self.near_duplicate_detector = (
+            NearDuplicateDetector(threshold=self.near_duplicate_threshold, max_documents=self.near_duplicate_window)
+            if self.near_duplicate_threshold is not None else None
+        )
+        if self.near_duplicate_detector is not None and self.chunk_size is not None and self.near_duplicate_window is None:
+            self.logger.warning(
+                "⚠️ Near-duplicate detection keeps a signature for every row, so memory grows with the "
+                "input despite chunking; set near_duplicate_window to bound it."
+            )
+
+    def process(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Run the cleaning stages (steps 2-7) on a single DataFrame or chunk.
 
+        Args:
+            df (pd.DataFrame): Loaded data or one chunk of it.
+
+        Returns:
+            pd.DataFrame: Cleaned data ready for export.
+        """
+        return self.detect(self.clean(df))
+
+    def clean(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Run the cleaning stages before anomaly detection (steps 2-6).
+
+        Args:
+            df (pd.DataFrame): Loaded data or one chunk of it.
+
+        Returns:
+            pd.DataFrame: Cleaned data, not yet scored.
+        """
         # Step 2: Data Quality Checks
-        dataQualityChecker = DataQualityChecker()
-        issues = dataQualityChecker.validate(df)
+        hashes = self.deduplicator.hash_rows(df)
+        issues = self.quality_checker.validate(df, row_hashes=hashes)
         if issues:
             self.logger.warning(f"⚠️ Data quality issues detected: {issues}")
 
+        # Drop rows already seen in this chunk or in earlier chunks, reusing the hashes
+        rows_before = len(df)
+        df = self.deduplicator.drop_duplicates(df, hashes)
+        self.logger.info(f"✅ Removed {rows_before - len(df)} duplicate rows.")
+
         # Step 3: Standardize Data
-        df = Standardizer().standardize(df)
+        df = self.standardizer.standardize(df)
         self.logger.info(f"✅ Standardized column names and formats.")
-    
-        # Step 4: Redact PII
-        if self.redact_pii_enabled:
+
+        # Steps 4-5: Redact PII and Clean Data
+        if self.fused_nlp is not None:
             self.logger.info("✅ PII Redaction started.")
-            piiRedactor = PIIRedactor()
-            df = piiRedactor.redact_dataframe(df)
+            df = self.fused_nlp.process_dataframe(
+                df, batch_size=self.nlp_batch_size, n_process=self.n_process, regex_only_columns=self.regex_only_columns
+            )
             self.logger.info("✅ Redacted PII information.")
-
-        # Step 5: Clean Data
-        textCleaner = TextCleaner()
-        df = textCleaner.clean_text_dataframe(df)
+        else:
+            df = self.text_cleaner.clean_text_dataframe(
+                df, batch_size=self.nlp_batch_size, n_process=self.n_process, deduplicate=False
+            )
         self.logger.info("✅ Performed basic data cleaning (null handling, trimming, etc.).")
 
         # Step 6: Map Columns
-        if self.column_mapping:
-            fieldMapper = FieldMapper(self.column_mapping)
-            df = fieldMapper.map_columns(df)
+        if self.field_mapper is not None:
+            df = self.field_mapper.map_columns(df)
             self.logger.info("✅ Applied column mapping as per provided configuration.")
 
+        return df
+
+    def detect(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Score anomalies (step 7) and mark or drop near-duplicates in cleaned data.
+
+        Args:
+            df (pd.DataFrame): Output of ``clean``.
+
+        Returns:
+            pd.DataFrame: Cleaned data ready for export.
+        """
         # Step 7: Detect Anomalies
-        if self.anomaly_detection_enabled:
+        if self.anomaly_detector is not None:
             self.logger.info("✅ Anomaly detection started.")
-            anomaly_detector = AnomalyDetector(threshold=self.anomaly_threshold)
-            df_anomaly = anomaly_detector.detect_anomalies(df)
+            df_anomaly = self.anomaly_detector.detect_anomalies(df)
             if(df_anomaly is not None):
                 df = pd.concat([df, df_anomaly], axis=1)
+            else:
+                # Nothing to score (e.g. no complete numeric row in this chunk): keep the
+                # columns so every chunk has the same layout
+                df = df.assign(anomaly_score=np.nan, is_anomaly=False)
             self.logger.info("✅ Anomaly detection completed and results appended.")
 
-        # Step 8: Export Cleaned Data
-        export_data(df, self.output_path, format=self.export_format)
-        self.logger.info(f"✅ Exported cleaned data to {self.output_path} in {self.export_format.upper()} format.")
+        # Near-duplicate detection runs last so its cluster ids are not scored as features
+        if self.near_duplicate_detector is not None:
+            if self.near_duplicate_action == "drop":
+                rows_before = len(df)
+                df = self.near_duplicate_detector.drop(df, self.near_duplicate_columns)
+                self.logger.info(f"✅ Removed {rows_before - len(df)} near-duplicate rows.")
+            else:
+                df = self.near_duplicate_detector.mark(df, self.near_duplicate_columns)
+                self.logger.info(f"✅ Marked {int(df['is_near_duplicate'].sum())} near-duplicate rows.")
 
-        self.logger.info("🎉 DataCleanCraft Pipeline completed successfully.")
\ No newline at end of file
+        return df
@@ -1,3 +1,4 @@
 from .cleaner import TextCleaner
 from .pii_redactor import PIIRedactor
-__all__ = ["TextCleaner", "PIIRedactor"]
\ No newline at end of file
+from .deduplicator import HashDeduplicator, row_hashes
+__all__ = ["TextCleaner", "PIIRedactor", "HashDeduplicator", "row_hashes"]
\ No newline at end of file
@@ -2,19 +2,62 @@
 cleaner.py: Advanced text preprocessing, Text cleaning functions like deduplication, tokenization using spaCy and text correction. 
 """
 
-import string
 import pandas as pd
 import re
 from typing import Optional , List
 from datacleancraft.models.spacy_model_loader import SpacyModelLoader
-from textblob import Word
+from datacleancraft.preprocessing.deduplicator import duplicated_hashes, row_hashes
+from datacleancraft.preprocessing.unique import map_unique_strings
+from datacleancraft.preprocessing.normalization import normalize_text, normalize_text_series, normalize_texts
+from datacleancraft.utils.cache import CacheInfo, LRUCache
+from datacleancraft.preprocessing.spelling import DEFAULT_MAX_EDIT_DISTANCE, SpellingCorrector
+
+_MISSING = object()
+
+# Components skipped in lite mode: cleaning only reads token.text and token.is_punct,
+# which come from the tokenizer alone
+LITE_EXCLUDE = ["tok2vec", "tagger", "morphologizer", "parser", "senter", "attribute_ruler", "lemmatizer", "ner"]
 
 class TextCleaner:
     
-    def __init__(self):
-        spacymodelloader = SpacyModelLoader()
-        self.nlp = spacymodelloader.load_model()
+    def __init__(
+        self,
+        cache_size: Optional[int] = 100000,
+        lite: bool = False,
+        max_edit_distance: int = DEFAULT_MAX_EDIT_DISTANCE,
+        nlp=None,
+    ):
+        """
+        Args:
+            cache_size (int, optional): Number of cleaned values memoized per option set.
+                ``0`` disables the cache and ``None`` makes it unbounded.
+            lite (bool): Load only the tokenizer and tokenize with ``nlp.make_doc``. Output of
+                ``clean_text`` is unchanged, but ``tokenize_and_lemmatize`` is unavailable.
+            max_edit_distance (int): Largest edit distance considered by spelling correction.
+            nlp (spacy.language.Language, optional): Already loaded pipeline to share (e.g.
+                ``PIIRedactor.nlp``) instead of loading another copy of the model.
+        """
+        self.lite = lite
+        self.max_edit_distance = max_edit_distance
+        self._spelling = None
+        if nlp is None:
+            spacymodelloader = SpacyModelLoader(exclude=LITE_EXCLUDE if lite else None)
+            nlp = spacymodelloader.load_model()
+        self.nlp = nlp
         self.stopwords = set(self.nlp.Defaults.stop_words)
+        self._cache = LRUCache(cache_size)
+
+    def cache_info(self) -> CacheInfo:
+        """
+        Report hits, misses and size of the cleaned-text cache.
+        """
+        return self._cache.cache_info()
+
+    def cache_clear(self) -> None:
+        """
+        Empty the cleaned-text cache and reset its counters.
+        """
+        self._cache.clear()
 
     def tokenize_and_lemmatize(self, texts: List[str]) -> List[List[str]]:
         """
@@ -26,6 +69,9 @@ class TextCleaner:
         Returns:
             List[List[str]]: List of lists containing lemmas.
         """
+        if self.lite:
+            raise ValueError("tokenize_and_lemmatize needs the tagger and lemmatizer; use TextCleaner(lite=False).")
+
         cleaned_texts = []
         for doc in self.nlp.pipe(texts, disable=["ner", "parser"]):
             lemmas = [token.lemma_.lower() for token in doc if not token.is_stop and not token.is_punct]
@@ -34,7 +80,11 @@ class TextCleaner:
 
     def correct_spelling(self, text: str) -> str:
         """
-        Correct common spelling mistakes using TextBlob (slow, use optionally).
+        Correct common spelling mistakes word by word.
+
+        Uses a symmetric-delete index over TextBlob's word frequencies, built once and
+        cached on disk, with corrections memoized per word. Results match
+        ``textblob.Word.correct``.
 
         Args:
             text (str): Input text.
@@ -42,8 +92,9 @@ class TextCleaner:
         Returns:
             str: Text with corrected spelling.
         """
-        corrected = " ".join([Word(word).correct() for word in text.split()])
-        return corrected
+        if self._spelling is None:
+            self._spelling = SpellingCorrector(max_edit_distance=self.max_edit_distance)
+        return self._spelling.correct(text)
 
 
 
@@ -85,54 +136,182 @@ class TextCleaner:
     ) -> Optional[str]:
         if not isinstance(text, str):
             return text
+
+        key = (text, lowercase, remove_stopwords_punct, spell_correct)
+        cleaned = self._cache.get(key, _MISSING)
+        if cleaned is not _MISSING:
+            return cleaned
         
         if remove_stopwords_punct:
             #Process text through spaCy pipeline for stopword removal and punctuation removal
-            doc = self.nlp(text)
-            text = " ".join(token.text for token in doc if not token.is_punct and token.text not in self.stopwords)
+            doc = self.nlp.make_doc(text) if self.lite else self.nlp(text)
+            text = self._join_tokens(doc)
 
+        cleaned = self._normalize(text, lowercase=lowercase, spell_correct=spell_correct)
+        self._cache.put(key, cleaned)
+        return cleaned
+
+    def _join_tokens(self, doc) -> str:
+        """
+        Join the tokens of a parsed text, dropping punctuation and stopwords.
+        """
+        return " ".join(token.text for token in doc if self._keep_token(token))
+
+    def _keep_token(self, token) -> bool:
+        """
+        Whether a token survives stopword and punctuation removal.
+        """
+        return not token.is_punct and token.text not in self.stopwords
+
+    def _normalize(self, text: str, lowercase: bool = True, spell_correct: bool = False) -> str:
+        """
+        Character-level cleanup shared by ``clean_text`` and the batched DataFrame path.
+        """
         if lowercase:
             text = text.lower()
 
         if spell_correct:
             text = self.correct_spelling(text)
 
-        # Keep only printable, alphanumeric and space characters
-        text = "".join(c for c in text if c in string.printable and (c.isalnum() or c.isspace()))
-
-        text = re.sub(r'[^a-zA-Z0-9\s]', '', text)
-
-        # Remove extra spaces
-        return " ".join(text.split())
+        # Keep only ASCII alphanumeric and whitespace characters, then collapse extra spaces
+        return normalize_text(text, lowercase=False)
 
     def clean_text_dataframe(self,
         df: pd.DataFrame,
         text_columns: Optional[List[str]] = None,
         lowercase: bool = True,
         remove_stopwords_punct: bool = True,
-        spell_correct: bool = False
+        spell_correct: bool = False,
+        batch_size: Optional[int] = 1000,
+        n_process: int = 1,
+        factorize: bool = True,
+        normalize_only_columns: Optional[List[str]] = None,
+        deduplicate: bool = True
     ) -> pd.DataFrame:
-        cleaned_df = self.remove_duplicates(df.copy())
+        """
+        Clean the text columns of a DataFrame, after dropping duplicate rows unless
+        ``deduplicate`` is False (e.g. when a ``HashDeduplicator`` already ran upstream).
+
+        Each column is streamed through ``nlp.pipe`` in batches with every pipeline component
+        disabled: stopword and punctuation removal only need the tokenizer, so the output is
+        identical to calling ``clean_text`` on every cell. Columns that skip NLP (all columns
+        when ``remove_stopwords_punct`` and ``spell_correct`` are off, or those listed in
+        ``normalize_only_columns``) are only normalized with ``normalize_text_series``.
+
+        Args:
+            df (pd.DataFrame): Input DataFrame.
+            text_columns (List[str], optional): Columns to clean. Defaults to all text columns.
+            lowercase (bool): Lowercase the text.
+            remove_stopwords_punct (bool): Drop stopwords and punctuation tokens.
+            spell_correct (bool): Correct spelling with TextBlob (slow).
+            batch_size (int, optional): Number of texts per ``nlp.pipe`` batch. ``None``
+                cleans cell by cell with ``clean_text``.
+            n_process (int): Number of processes used by ``nlp.pipe``.
+            factorize (bool): Clean each distinct value of a column once and map the
+                results back to the rows (batched path only).
+            normalize_only_columns (List[str], optional): Columns that skip spaCy and spelling
+                correction and only get lowercasing, non-alphanumeric removal and
+                whitespace collapsing.
+            deduplicate (bool): Drop duplicate rows before cleaning.
+
+        Returns:
+            pd.DataFrame: Cleaned DataFrame.
+        """
+        cleaned_df = self.remove_duplicates(df.copy()) if deduplicate else df.copy()
 
         if text_columns is None:
-            text_columns = cleaned_df.select_dtypes(include=["object", "string"]).columns.tolist()
+            text_columns = cleaned_df.select_dtypes(include=["object", "string", "category"]).columns.tolist()
 
         for col in text_columns:
-            cleaned_df[col] = cleaned_df[col].apply(
-                lambda x: self.clean_text(
-                    x,
+            if normalize_only_columns is not None and col in normalize_only_columns:
+                cleaned_df[col] = normalize_text_series(cleaned_df[col], lowercase=lowercase, factorize=factorize)
+            elif batch_size is None:
+                cleaned_df[col] = cleaned_df[col].apply(
+                    lambda x: self.clean_text(
+                        x,
+                        lowercase=lowercase,
+                        remove_stopwords_punct=remove_stopwords_punct,
+                        spell_correct=spell_correct
+                    )
+                )
+            else:
+                cleaned_df[col] = self.clean_text_series(
+                    cleaned_df[col],
                     lowercase=lowercase,
                     remove_stopwords_punct=remove_stopwords_punct,
-                    spell_correct=spell_correct
+                    spell_correct=spell_correct,
+                    batch_size=batch_size,
+                    n_process=n_process,
+                    factorize=factorize
                 )
-            )
 
         return cleaned_df
 
+    def clean_text_series(self,
+        series: pd.Series,
+        lowercase: bool = True,
+        remove_stopwords_punct: bool = True,
+        spell_correct: bool = False,
+        batch_size: int = 1000,
+        n_process: int = 1,
+        factorize: bool = True
+    ) -> pd.Series:
+        """
+        Clean a text column in batches with ``nlp.pipe``; non-string values are kept as is.
+
+        Values already in the cache are not parsed again; only the misses go through spaCy.
+
+        Args:
+            series (pd.Series): Text column. Categorical columns are cleaned per category.
+            lowercase, remove_stopwords_punct, spell_correct: See ``clean_text``.
+            batch_size (int): Number of texts per ``nlp.pipe`` batch.
+            n_process (int): Number of processes used by ``nlp.pipe``.
+            factorize (bool): Clean each distinct value once and map the results back by code.
+
+        Returns:
+            pd.Series: Cleaned column, matching ``series.apply(self.clean_text)``.
+        """
+        if not remove_stopwords_punct and not spell_correct:
+            return normalize_text_series(series, lowercase=lowercase, factorize=factorize)
+
+        options = (lowercase, remove_stopwords_punct, spell_correct)
+        return map_unique_strings(
+            series,
+            lambda texts: self._clean_batch(texts, options, batch_size, n_process),
+            factorize=factorize
+        )
+
+    def _clean_batch(self, texts: List[str], options: tuple, batch_size: int, n_process: int) -> List[str]:
+        """
+        Clean a list of strings, serving cached values and parsing the misses with ``nlp.pipe``.
+        """
+        lowercase, remove_stopwords_punct, spell_correct = options
+        keys = [(text,) + options for text in texts]
+        results = [self._cache.get(key, _MISSING) for key in keys]
+        missing = [i for i, result in enumerate(results) if result is _MISSING]
+
+        pending = (texts[i] for i in missing)
+        if remove_stopwords_punct:
+            docs = self.nlp.pipe(pending, batch_size=batch_size, n_process=n_process, disable=self.nlp.pipe_names)
+            pending = (self._join_tokens(doc) for doc in docs)
+
+        if spell_correct:
+            cleaned = [self._normalize(text, lowercase=lowercase, spell_correct=True) for text in pending]
+        else:
+            cleaned = normalize_texts(list(pending), lowercase=lowercase)
+
+        for i, text in zip(missing, cleaned):
+            results[i] = text
+            self._cache.put(keys[i], text)
+        return results
+
     def remove_duplicates(self, df: pd.DataFrame, subset: List[str] = None) -> pd.DataFrame:
             """
             Remove duplicate rows from a DataFrame.
 
+            Rows are compared by 64-bit row hashes; for deduplication across chunks or
+            files use ``HashDeduplicator``.
+
             Args:
                 df (pd.DataFrame): Input DataFrame.
                 subset (List[str], optional): Columns to consider for identifying duplicates.
@@ -140,4 +319,5 @@ class TextCleaner:
             Returns:
                 pd.DataFrame: De-duplicated DataFrame.
             """
-            return df.drop_duplicates(subset=subset).reset_index(drop=True)
\ No newline at end of file
+            keep = ~duplicated_hashes(row_hashes(df, subset=subset))
+            return df[keep].reset_index(drop=True)
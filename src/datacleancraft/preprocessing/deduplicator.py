@@ -0,0 +1,337 @@
+"""
+deduplicator.py: Exact row deduplication on 64/128-bit row hashes with bounded memory.
+"""
+
+import logging
+import shutil
+import tempfile
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from typing import List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+HASH_BITS = (64, 128)
+
+# Key pandas uses by default, for the lower half of every hash
+_DEFAULT_HASH_KEY = "0123456789123456"
+
+# Second hash key used for the upper half of 128-bit hashes (16 characters, as pandas requires)
+_SECOND_HASH_KEY = "datacleancraft01"
+
+
+# Hashes read per step when merging spilled runs
+_MERGE_BLOCK = 1 << 20
+
+# Hash shared by missing values of every dtype (the one pandas gives them in text columns)
+_NULL_HASH = np.uint64(np.iinfo(np.uint64).max)
+
+# Integral floats below this magnitude hash like the equal int64
+_INT64_LIMIT = 2.0 ** 63
+
+
+def _column_hashes(series: pd.Series, hash_key: str) -> np.ndarray:
+    """
+    Hash the values of a column independently of its dtype.
+
+    A value hashes the same whether its column is int64, float64, float32, nullable or
+    categorical, and all missing values (None, NaN, NA, NaT) share one hash, so a row
+    repeated in chunks or files read with different dtypes is still recognized.
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        series = pd.Series(np.asarray(series.array))
+    dtype = series.dtype
+
+    if pd.api.types.is_object_dtype(dtype) or pd.api.types.is_string_dtype(dtype):
+        # Text is factorized before hashing, which already gives every missing value _NULL_HASH
+        return pd.util.hash_array(series.to_numpy(dtype=object), hash_key=hash_key)
+
+    if pd.api.types.is_bool_dtype(dtype):
+        hashes = pd.util.hash_array(series.to_numpy(dtype=bool, na_value=False), hash_key=hash_key)
+    elif pd.api.types.is_integer_dtype(dtype):
+        target = np.uint64 if pd.api.types.is_unsigned_integer_dtype(dtype) and dtype.itemsize == 8 else np.int64
+        hashes = pd.util.hash_array(series.to_numpy(dtype=target, na_value=0), hash_key=hash_key)
+    elif pd.api.types.is_float_dtype(dtype):
+        values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+        with np.errstate(invalid="ignore"):
+            integral = (np.floor(values) == values) & (np.abs(values) < _INT64_LIMIT)
+        hashes = pd.util.hash_array(values, hash_key=hash_key)
+        if integral.any():
+            hashes[integral] = pd.util.hash_array(values[integral].astype(np.int64), hash_key=hash_key)
+    else:
+        hashes = pd.util.hash_pandas_object(series, index=False, hash_key=hash_key).to_numpy()
+
+    hashes = np.array(hashes, dtype=np.uint64)
+    hashes[series.isna().to_numpy()] = _NULL_HASH
+    return hashes
+
+
+def _frame_hashes(data: pd.DataFrame, hash_key: str) -> np.ndarray:
+    """
+    Combine the column hashes of every row (with the mixing pandas uses for DataFrames).
+    """
+    out = np.full(len(data), 0x345678, dtype=np.uint64)
+    multiplier = np.uint64(1000003)
+    for i in range(data.shape[1]):
+        out ^= _column_hashes(data.iloc[:, i], hash_key)
+        out *= multiplier
+        inverse = data.shape[1] - i
+        multiplier += np.uint64(82520 + inverse + inverse)
+    out += np.uint64(97531)
+    return out
+
+
+def row_hashes(df: pd.DataFrame, subset: Optional[List[str]] = None, bits: int = 64) -> np.ndarray:
+    """
+    Hash every row of a DataFrame, ignoring the index.
+
+    Values are hashed independently of the column dtypes (see ``_column_hashes``), so the
+    same row gets the same hash in every chunk and file.
+
+    Args:
+        df (pd.DataFrame): Input DataFrame.
+        subset (List[str], optional): Columns identifying a row. All columns if omitted.
+        bits (int): 64 for ``uint64`` hashes, or 128 for 16-byte ``S16`` hashes that make
+            collisions negligible even across billions of rows.
+
+    Returns:
+        np.ndarray: One hash per row.
+    """
+    if bits not in HASH_BITS:
+        raise ValueError(f"bits must be 64 or 128, got {bits}.")
+    data = df if subset is None else df[subset]
+    low = _frame_hashes(data, _DEFAULT_HASH_KEY)
+    if bits == 64:
+        return low
+    high = _frame_hashes(data, _SECOND_HASH_KEY)
+    return np.ascontiguousarray(np.stack([high, low], axis=1).astype(">u8")).view("S16").ravel()
+
+
+def duplicated_hashes(hashes: np.ndarray) -> np.ndarray:
+    """
+    Flag every hash that already occurred earlier in the array.
+
+    Args:
+        hashes (np.ndarray): Row hashes from ``row_hashes``.
+
+    Returns:
+        np.ndarray: Boolean mask, True for repeated rows.
+    """
+    return pd.Series(hashes).duplicated().to_numpy()
+
+
+class HashDeduplicator:
+    """
+    Drop rows already seen in this chunk, in earlier chunks or in earlier files.
+
+    Hashes of kept rows are held in memory up to ``max_memory_hashes``; beyond that they
+    are spilled into hash partitions on disk. Every spill writes one new sorted ``.npy``
+    run per partition, and lookups binary-search the memory-mapped runs. Once
+    ``merge_factor`` runs of the same level pile up in a partition they are merged, block
+    by block, into one run of the next level, so each hash is rewritten only a
+    logarithmic number of times, the number of runs stays small, and memory stays bounded
+    by ``max_memory_hashes`` however large the input is.
+    """
+
+    def __init__(
+        self,
+        subset: Optional[List[str]] = None,
+        bits: int = 64,
+        max_memory_hashes: int = 5_000_000,
+        spill_dir: Optional[Union[str, Path]] = None,
+        partitions: int = 16,
+        merge_factor: int = 4,
+    ):
+        """
+        Args:
+            subset (List[str], optional): Columns identifying a row. All columns if omitted.
+            bits (int): Hash width, 64 or 128.
+            max_memory_hashes (int): Hashes kept in memory before spilling to disk.
+            spill_dir (str or Path, optional): Directory for spilled partitions. A temporary
+                directory, removed by ``close``, is used if omitted.
+            partitions (int): Number of on-disk hash partitions.
+            merge_factor (int): Runs of the same level merged together in a partition.
+        """
+        if bits not in HASH_BITS:
+            raise ValueError(f"bits must be 64 or 128, got {bits}.")
+        self.subset = subset
+        self.bits = bits
+        self.max_memory_hashes = max_memory_hashes
+        self.partitions = partitions
+        self.merge_factor = max(2, merge_factor)
+        self._spill_root = Path(spill_dir) if spill_dir is not None else None
+        self._spill_dir: Optional[Path] = None
+        self._owns_spill_dir = spill_dir is None
+        self._memory = set()
+        # (level, path) of the sorted runs of every partition
+        self._runs: List[List[Tuple[int, Path]]] = [[] for _ in range(partitions)]
+        self._next_run = 0
+        self.rows_seen = 0
+        self.duplicates_dropped = 0
+        self.spilled_hashes = 0
+
+    def hash_rows(self, df: pd.DataFrame) -> np.ndarray:
+        """
+        Hash the rows of ``df`` with this deduplicator's subset and width.
+        """
+        return row_hashes(df, subset=self.subset, bits=self.bits)
+
+    def first_occurrences(self, hashes: np.ndarray) -> np.ndarray:
+        """
+        Mark the rows whose hash has not been seen before and remember them.
+
+        Args:
+            hashes (np.ndarray): Row hashes from ``hash_rows``.
+
+        Returns:
+            np.ndarray: Boolean mask, True for rows to keep.
+        """
+        keep = ~duplicated_hashes(hashes)
+        candidates = np.flatnonzero(keep)
+        keys = hashes[candidates].tolist()
+        in_memory = np.fromiter((key in self._memory for key in keys), dtype=bool, count=len(keys))
+        keep[candidates[in_memory]] = False
+
+        candidates = candidates[~in_memory]
+        if candidates.size and any(self._runs):
+            keep[candidates[self._on_disk(hashes[candidates])]] = False
+
+        new_hashes = hashes[keep]
+        self._memory.update(new_hashes.tolist())
+        self.rows_seen += len(hashes)
+        self.duplicates_dropped += int(len(hashes) - keep.sum())
+        if len(self._memory) > self.max_memory_hashes:
+            self._spill()
+        return keep
+
+    def drop_duplicates(self, df: pd.DataFrame, hashes: Optional[np.ndarray] = None) -> pd.DataFrame:
+        """
+        Drop rows seen before, keeping first occurrences.
+
+        Args:
+            df (pd.DataFrame): Input DataFrame or chunk.
+            hashes (np.ndarray, optional): Precomputed ``hash_rows(df)``, to avoid hashing twice.
+
+        Returns:
+            pd.DataFrame: De-duplicated DataFrame with a fresh index.
+        """
+        if hashes is None:
+            hashes = self.hash_rows(df)
+        keep = self.first_occurrences(hashes)
+        return df[keep].reset_index(drop=True)
+
+    def close(self) -> None:
+        """
+        Forget all hashes and remove the temporary spill directory.
+        """
+        self._memory.clear()
+        if self._spill_dir is not None:
+            if self._owns_spill_dir:
+                shutil.rmtree(self._spill_dir, ignore_errors=True)
+            else:
+                for runs in self._runs:
+                    for _, path in runs:
+                        path.unlink(missing_ok=True)
+        self._spill_dir = None
+        self._runs = [[] for _ in range(self.partitions)]
+
+    def __enter__(self) -> "HashDeduplicator":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _partition_ids(self, hashes: np.ndarray) -> np.ndarray:
+        if self.bits == 64:
+            prefix = hashes
+        else:
+            prefix = np.frombuffer(np.ascontiguousarray(hashes).tobytes(), dtype=">u8")[::2]
+        return (prefix % np.uint64(self.partitions)).astype(np.int64)
+
+    def _new_run_path(self, partition: int) -> Path:
+        self._next_run += 1
+        return self._spill_dir / f"hashes-{partition:04d}-{self._next_run:06d}.npy"
+
+    def _as_array(self, keys) -> np.ndarray:
+        return np.array(keys, dtype=np.uint64 if self.bits == 64 else "S16")
+
+    def _on_disk(self, hashes: np.ndarray) -> np.ndarray:
+        """
+        Check which hashes are present in the spilled runs.
+        """
+        found = np.zeros(len(hashes), dtype=bool)
+        partition_ids = self._partition_ids(hashes)
+        for partition in np.unique(partition_ids):
+            if not self._runs[partition]:
+                continue
+            positions = np.flatnonzero(partition_ids == partition)
+            wanted = hashes[positions]
+            for _, path in self._runs[partition]:
+                stored = np.load(path, mmap_mode="r")
+                index = np.searchsorted(stored, wanted)
+                index[index == len(stored)] = 0
+                found[positions] |= stored[index] == wanted
+        return found
+
+    def _spill(self) -> None:
+        """
+        Write the in-memory hashes as one new sorted run per partition.
+        """
+        if self._spill_dir is None:
+            if self._spill_root is not None:
+                self._spill_root.mkdir(parents=True, exist_ok=True)
+                self._spill_dir = self._spill_root
+            else:
+                self._spill_dir = Path(tempfile.mkdtemp(prefix="datacleancraft-dedup-"))
+
+        hashes = self._as_array(list(self._memory))
+        partition_ids = self._partition_ids(hashes)
+        for partition in np.unique(partition_ids):
+            path = self._new_run_path(partition)
+            np.save(path, np.sort(hashes[partition_ids == partition]))
+            self._runs[partition].append((0, path))
+            self._compact(partition)
+
+        self.spilled_hashes += len(hashes)
+        logger.info(f"Spilled {len(hashes)} row hashes to {self._spill_dir}.")
+        self._memory.clear()
+
+    def _compact(self, partition: int) -> None:
+        """
+        Merge the runs of a partition level by level while a level holds ``merge_factor`` runs.
+        """
+        runs = self._runs[partition]
+        level = 0
+        while True:
+            paths = [path for run_level, path in runs if run_level == level]
+            if len(paths) < self.merge_factor:
+                break
+            merged = self._merge_runs(partition, paths)
+            runs = [run for run in runs if run[0] != level] + [(level + 1, merged)]
+            level += 1
+        self._runs[partition] = runs
+
+    def _merge_runs(self, partition: int, paths: List[Path]) -> Path:
+        """
+        Merge disjoint sorted runs into a new run, reading ``_MERGE_BLOCK`` hashes at a time.
+
+        Every hash goes to its index in its own run plus the number of smaller hashes in the
+        other runs, so the output is written directly into a memory-mapped file.
+        """
+        runs = [np.load(path, mmap_mode="r") for path in paths]
+        path = self._new_run_path(partition)
+        merged = np.lib.format.open_memmap(path, mode="w+", dtype=runs[0].dtype, shape=(sum(len(run) for run in runs),))
+        for i, run in enumerate(runs):
+            for start in range(0, len(run), _MERGE_BLOCK):
+                block = np.asarray(run[start:start + _MERGE_BLOCK])
+                positions = np.arange(start, start + len(block))
+                for j, other in enumerate(runs):
+                    if j != i:
+                        positions += np.searchsorted(other, block)
+                merged[positions] = block
+        merged.flush()
+        del merged, runs
+        for old_path in paths:
+            old_path.unlink()
+        return path
@@ -0,0 +1,215 @@
+"""
+fused_nlp.py: PII redaction and text cleaning from a single spaCy parse per value.
+"""
+
+import pandas as pd
+from typing import List, Optional
+from datacleancraft.preprocessing.cleaner import TextCleaner
+from datacleancraft.preprocessing.ner_gate import needs_ner
+from datacleancraft.preprocessing.pii_redactor import PIIRedactor
+from datacleancraft.preprocessing.redaction import mask_spans, merge_spans
+from datacleancraft.preprocessing.unique import map_unique_strings
+from datacleancraft.utils.cache import CacheInfo, LRUCache
+
+_MISSING = object()
+
+
+class FusedRedactCleaner:
+    """
+    Redact PII and clean text with one parse of every value.
+
+    Running ``PIIRedactor.redact_dataframe`` and then ``TextCleaner.clean_text_dataframe``
+    tokenizes every value twice: once for NER and once more after redaction. Here the
+    redaction spans come from the NER ``Doc`` and the cleaning tokens from the same
+    ``Doc``, with every token inside a redacted span replaced by the tokens of the mask.
+
+    spaCy tokenizes each whitespace-separated chunk on its own, so when every span starts
+    and ends at whitespace the result equals cleaning the redacted text. Otherwise the
+    redacted text is re-tokenized (tokenizer only), so the output is always identical to
+    the two stages run one after the other.
+    """
+
+    def __init__(self, redactor: PIIRedactor, cleaner: TextCleaner, cache_size: Optional[int] = 100000):
+        """
+        Args:
+            redactor (PIIRedactor): Redaction settings, model, patterns and statistics.
+            cleaner (TextCleaner): Cleaning settings (stopwords, normalization, spelling).
+            cache_size (int, optional): Number of processed values memoized per option set.
+        """
+        from spacy.attrs import IDX, IS_PUNCT, LENGTH
+
+        self.redactor = redactor
+        self.cleaner = cleaner
+        self.nlp = redactor.nlp
+        # Token attributes read by the cleaning step: start offset, length and punctuation flag
+        self._token_attrs = [IDX, LENGTH, IS_PUNCT]
+        self._cache = LRUCache(cache_size)
+        self._mask_tokens = {}
+
+    def cache_info(self) -> CacheInfo:
+        """
+        Report hits, misses and size of the result cache.
+        """
+        return self._cache.cache_info()
+
+    def cache_clear(self) -> None:
+        """
+        Empty the result cache and reset its counters.
+        """
+        self._cache.clear()
+
+    def process_dataframe(self,
+        df: pd.DataFrame,
+        columns: Optional[List[str]] = None,
+        lowercase: bool = True,
+        remove_stopwords_punct: bool = True,
+        spell_correct: bool = False,
+        batch_size: int = 1000,
+        n_process: int = 1,
+        factorize: bool = True,
+        regex_only_columns: Optional[List[str]] = None
+    ) -> pd.DataFrame:
+        """
+        Redact and clean the text columns of a DataFrame.
+
+        Equivalent to ``redactor.redact_dataframe`` followed by
+        ``cleaner.clean_text_dataframe(deduplicate=False)`` with the same options; NER
+        gating and column profiling of the redactor apply as usual.
+
+        Args:
+            df (pd.DataFrame): Input DataFrame.
+            columns (List[str], optional): Columns to process. Defaults to all text columns.
+            lowercase, remove_stopwords_punct, spell_correct: See ``TextCleaner.clean_text``.
+            batch_size (int): Number of texts per ``nlp.pipe`` batch.
+            n_process (int): Number of processes used by ``nlp.pipe``.
+            factorize (bool): Process each distinct value once and map the results back by code.
+            regex_only_columns (List[str], optional): Columns redacted with the regex
+                detectors only and then cleaned, without NER.
+
+        Returns:
+            pd.DataFrame: Redacted and cleaned DataFrame.
+        """
+        processed_df = df.copy()
+        if columns is None:
+            columns = processed_df.select_dtypes(include=["object", "string", "category"]).columns.tolist()
+
+        options = (lowercase, remove_stopwords_punct, spell_correct)
+        for col in columns:
+            if col not in processed_df.columns:
+                continue
+            if regex_only_columns and col in regex_only_columns:
+                redacted = self.redactor.redact_regex_series(processed_df[col], factorize=factorize)
+                processed_df[col] = self.cleaner.clean_text_series(
+                    redacted, *options, batch_size=batch_size, n_process=n_process, factorize=factorize
+                )
+                continue
+
+            use_ner = True
+            if self.redactor.profile_sample_size is not None:
+                if col not in self.redactor.column_profiles:
+                    self.redactor.column_profiles[col] = self.redactor.profile_column(processed_df[col], batch_size, n_process)
+                use_ner = self.redactor.column_profiles[col]
+
+            processed_df[col] = map_unique_strings(
+                processed_df[col],
+                lambda texts: self._process_batch(texts, options, batch_size, n_process, use_ner),
+                factorize=factorize
+            )
+        return processed_df
+
+    def _process_batch(self, texts: List[str], options: tuple, batch_size: int, n_process: int, use_ner: bool) -> List[str]:
+        """
+        Redact and clean a list of strings, parsing each cache miss once.
+        """
+        redactor = self.redactor
+        if use_ner and redactor.gate_ner:
+            ner_mask = needs_ner(texts).tolist()
+        else:
+            ner_mask = [use_ner] * len(texts)
+
+        keys = [(text, redactor.mask_token, ner) + options for text, ner in zip(texts, ner_mask)]
+        results = [self._cache.get(key, _MISSING) for key in keys]
+        missing = [i for i, result in enumerate(results) if result is _MISSING]
+        if not missing:
+            return results
+
+        ner_missing = [i for i in missing if ner_mask[i]]
+        regex_missing = [i for i in missing if not ner_mask[i]]
+        redactor.stats["values"] += len(missing)
+        redactor.stats["ner_values"] += len(ner_missing)
+        redactor.stats["skipped_by_gate" if use_ner else "skipped_by_profile"] += len(regex_missing)
+
+        docs = {}
+        if ner_missing:
+            parsed = self.nlp.pipe(
+                (texts[i] for i in ner_missing), batch_size=batch_size, n_process=n_process, disable=redactor._ner_disabled()
+            )
+            docs.update(zip(ner_missing, parsed))
+
+        for i in missing:
+            doc = docs.get(i)
+            results[i] = self._redact_and_clean(texts[i], doc, options)
+            self._cache.put(keys[i], results[i])
+        return results
+
+    def _redact_and_clean(self, text: str, doc, options: tuple) -> str:
+        """
+        Redact ``text`` using the entities of ``doc`` (None for regex only), then clean it
+        reusing the tokens of ``doc`` where the redaction spans allow it.
+        """
+        lowercase, remove_stopwords_punct, spell_correct = options
+        engine = self.redactor.engine
+        spans = engine.regex_spans(text)
+        if doc is not None:
+            spans.extend(engine.entity_spans(doc))
+        spans = merge_spans(spans)
+
+        if not remove_stopwords_punct:
+            redacted = mask_spans(text, spans, self.redactor.mask_token)
+            return self.cleaner._normalize(redacted, lowercase=lowercase, spell_correct=spell_correct)
+
+        if doc is None:
+            doc = self.nlp.make_doc(text)
+        if all(_on_whitespace(text, start, end) for start, end in spans):
+            joined = self._join_redacted_tokens(text, doc, spans)
+        else:
+            redacted = mask_spans(text, spans, self.redactor.mask_token)
+            joined = self.cleaner._join_tokens(self.nlp.make_doc(redacted))
+        return self.cleaner._normalize(joined, lowercase=lowercase, spell_correct=spell_correct)
+
+    def _join_redacted_tokens(self, text: str, doc, spans: List[tuple]) -> str:
+        """
+        Join the kept tokens of ``doc``, emitting the mask's kept tokens once per span.
+
+        Token offsets and punctuation flags are read with ``Doc.to_array``, and token texts
+        are sliced from ``text``, so no ``Token`` objects are created.
+        """
+        mask = self.redactor.mask_token
+        if mask not in self._mask_tokens:
+            self._mask_tokens[mask] = [token.text for token in self.nlp.make_doc(mask) if self.cleaner._keep_token(token)]
+        mask_tokens = self._mask_tokens[mask]
+        stopwords = self.cleaner.stopwords
+
+        words = []
+        span_index = 0
+        for start, length, is_punct in doc.to_array(self._token_attrs).tolist():
+            while span_index < len(spans) and spans[span_index][1] <= start:
+                span_index += 1
+            if span_index < len(spans) and spans[span_index][0] <= start:
+                if spans[span_index][0] == start:
+                    words.extend(mask_tokens)
+                continue
+            word = text[start:start + length]
+            if not is_punct and word not in stopwords:
+                words.append(word)
+        return " ".join(words)
+
+
+def _on_whitespace(text: str, start: int, end: int) -> bool:
+    """
+    Whether a span covers whole whitespace-separated chunks of ``text``.
+    """
+    return (
+        (start == 0 or text[start - 1].isspace()) and not text[start].isspace()
+        and (end == len(text) or text[end].isspace()) and not text[end - 1].isspace()
+    )
@@ -0,0 +1,322 @@
+"""
+near_duplicates.py: Near-duplicate detection for text columns with MinHash signatures and LSH banding.
+"""
+
+import os
+import pickle
+import numpy as np
+import pandas as pd
+from itertools import chain
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+from datacleancraft.preprocessing.unique import string_mask
+
+CLUSTER_COLUMN = "near_duplicate_cluster"
+DUPLICATE_COLUMN = "is_near_duplicate"
+
+# Documents whose MinHash signatures are computed in one numpy block
+_BLOCK_SIZE = 2048
+
+
+def optimal_bands(threshold: float, num_perm: int) -> Tuple[int, int]:
+    """
+    Pick the LSH banding whose S-curve is steepest around ``threshold``.
+
+    Two documents with Jaccard similarity ``s`` share at least one of ``b`` bands of ``r``
+    rows with probability ``1 - (1 - s**r)**b``, which crosses 1/2 near ``(1/b)**(1/r)``.
+
+    Args:
+        threshold (float): Jaccard similarity from which documents are near duplicates.
+        num_perm (int): Number of MinHash permutations.
+
+    Returns:
+        Tuple[int, int]: Number of bands and rows per band, with ``bands * rows <= num_perm``.
+    """
+    best = None
+    for rows in range(1, num_perm + 1):
+        bands = num_perm // rows
+        error = abs((1 / bands) ** (1 / rows) - threshold)
+        if best is None or error < best[0]:
+            best = (error, bands, rows)
+    return best[1], best[2]
+
+
+def shingles(text: str, ngram: int = 1) -> List[str]:
+    """
+    Split cleaned text into word n-grams.
+
+    ``TextCleaner`` output is lowercased, stripped of punctuation and joined by single
+    spaces, so its tokens are recovered with ``str.split``.
+
+    Args:
+        text (str): Cleaned text.
+        ngram (int): Words per shingle. Texts shorter than ``ngram`` form a single shingle.
+
+    Returns:
+        List[str]: Shingles of the text (empty for blank text).
+    """
+    tokens = text.split()
+    if ngram <= 1 or len(tokens) <= ngram:
+        return tokens if ngram <= 1 or not tokens else [" ".join(tokens)]
+    return [" ".join(tokens[i:i + ngram]) for i in range(len(tokens) - ngram + 1)]
+
+
+class NearDuplicateDetector:
+    """
+    Cluster rows whose text is similar, in roughly linear time.
+
+    Every row gets a MinHash signature of its word shingles. Signatures are cut into LSH
+    bands, so only rows sharing a band bucket become candidate pairs. Candidates whose
+    estimated Jaccard similarity reaches ``threshold`` are merged with union-find, and the
+    first row of each cluster is kept as its representative.
+
+    The index persists across calls, so chunks and files can be processed one after the
+    other, and it can be pickled with ``save`` and restored with ``load``. It holds a
+    ``num_perm * 4`` byte signature and ``bands`` bucket entries per row, so without
+    ``max_documents`` its memory grows with the total number of rows indexed.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.8,
+        num_perm: int = 128,
+        ngram: int = 1,
+        seed: int = 1,
+        max_documents: Optional[int] = None,
+    ):
+        """
+        Args:
+            threshold (float): Estimated Jaccard similarity from which rows are near duplicates.
+            num_perm (int): Number of MinHash permutations (signature length).
+            ngram (int): Words per shingle.
+            seed (int): Seed of the MinHash permutations.
+            max_documents (int, optional): Sliding window bounding memory. Every row is
+                compared with at least the ``max_documents`` rows indexed before it; once
+                ``2 * max_documents`` rows are held, the oldest are evicted down to
+                ``max_documents``. Unbounded if None.
+        """
+        if not 0 < threshold <= 1:
+            raise ValueError(f"threshold must be in (0, 1], got {threshold}.")
+        if max_documents is not None and max_documents < 1:
+            raise ValueError(f"max_documents must be positive, got {max_documents}.")
+        self.threshold = threshold
+        self.max_documents = max_documents
+        self.num_perm = num_perm
+        self.ngram = ngram
+        self.bands, self.rows = optimal_bands(threshold, num_perm)
+
+        # Multiply-shift hashing: odd 64-bit multipliers, keeping the upper 32 bits
+        rng = np.random.default_rng(seed)
+        self._multipliers = rng.integers(1, 2**64, num_perm, dtype=np.uint64) | np.uint64(1)
+        self._offsets = rng.integers(0, 2**64, num_perm, dtype=np.uint64)
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Forget every indexed row.
+        """
+        self._tables = [{} for _ in range(self.bands)]
+        self._signatures = np.empty((0, self.num_perm), dtype=np.uint32)
+        # Union-find parents of the held rows, plus evicted cluster roots they still point to
+        self._parent: Dict[int, int] = {}
+        # Running number of the oldest held row; row ``d`` has signature ``d - _offset``
+        self._offset = 0
+        self.documents = 0
+
+    def signatures(self, texts: Sequence[str]) -> np.ndarray:
+        """
+        Compute the MinHash signatures of cleaned texts.
+
+        Args:
+            texts (Sequence[str]): Cleaned texts.
+
+        Returns:
+            np.ndarray: ``uint32`` array of shape ``(len(texts), num_perm)``. Blank texts get
+            the maximum value everywhere.
+        """
+        signatures = np.full((len(texts), self.num_perm), np.iinfo(np.uint32).max, dtype=np.uint32)
+        for start in range(0, len(texts), _BLOCK_SIZE):
+            tokens = [shingles(text, self.ngram) for text in texts[start:start + _BLOCK_SIZE]]
+            lengths = np.fromiter(map(len, tokens), dtype=np.int64, count=len(tokens))
+            if not lengths.any():
+                continue
+            hashes = pd.util.hash_array(np.array(list(chain.from_iterable(tokens)), dtype=object))
+            with np.errstate(over="ignore"):
+                values = ((hashes[:, None] * self._multipliers + self._offsets) >> np.uint64(32)).astype(np.uint32)
+            filled = np.flatnonzero(lengths)
+            boundaries = np.concatenate([[0], np.cumsum(lengths)[:-1]])[filled]
+            signatures[start + filled] = np.minimum.reduceat(values, boundaries, axis=0)
+        return signatures
+
+    def add(self, texts: Sequence[str]) -> np.ndarray:
+        """
+        Index cleaned texts and return the cluster of each one.
+
+        Args:
+            texts (Sequence[str]): Cleaned texts, one per row.
+
+        Returns:
+            np.ndarray: Cluster id of every text: the running row number of the first
+            indexed row of its cluster, or its own number for blank texts. Clusters of rows
+            returned by earlier calls are not revisited.
+        """
+        signatures = self.signatures(texts)
+        start = self.documents
+        offset = self._offset
+        self._reserve(start - offset + len(texts))
+        self._signatures[start - offset:start - offset + len(texts)] = signatures
+        self._parent.update((document, document) for document in range(start, start + len(texts)))
+        self.documents += len(texts)
+
+        blank = np.fromiter((not text.split() for text in texts), dtype=bool, count=len(texts))
+        band_keys = [
+            pd.util.hash_pandas_object(
+                pd.DataFrame(signatures[:, band * self.rows:(band + 1) * self.rows]), index=False
+            ).tolist()
+            for band in range(self.bands)
+        ]
+
+        for position in np.flatnonzero(~blank).tolist():
+            document = start + position
+            buckets = [table.get(keys[position]) for table, keys in zip(self._tables, band_keys)]
+            candidates = set(chain.from_iterable(bucket for bucket in buckets if bucket))
+
+            matches = set()
+            if candidates:
+                candidates = np.fromiter(candidates, dtype=np.int64, count=len(candidates))
+                similarity = (self._signatures[candidates - offset] == signatures[position]).mean(axis=1)
+                matches = set(candidates[similarity >= self.threshold].tolist())
+                for match in matches:
+                    self._union(document, match)
+
+            # Buckets only need one member per cluster, which keeps them small for exact repeats
+            for table, keys, bucket in zip(self._tables, band_keys, buckets):
+                if bucket is None:
+                    table[keys[position]] = [document]
+                elif matches.isdisjoint(bucket):
+                    bucket.append(document)
+
+        clusters = np.array([self._find(document) for document in range(start, start + len(texts))], dtype=np.int64)
+        if self.max_documents is not None and self.documents - self._offset >= 2 * self.max_documents:
+            self._evict(self.documents - self.max_documents)
+        return clusters
+
+    def _evict(self, offset: int) -> None:
+        """
+        Drop every row numbered below ``offset`` from the signatures, buckets and union-find.
+
+        Held rows keep pointing at their cluster root even if it is evicted, so cluster ids
+        stay stable; evicted rows just stop being candidates.
+        """
+        held = range(offset, self.documents)
+        roots = {document: self._find(document) for document in held}
+        self._parent = dict(roots)
+        self._parent.update((root, root) for root in roots.values() if root < offset)
+
+        for table in self._tables:
+            for key in list(table):
+                bucket = [document for document in table[key] if document >= offset]
+                if bucket:
+                    table[key] = bucket
+                else:
+                    del table[key]
+
+        self._signatures = self._signatures[offset - self._offset:self.documents - self._offset].copy()
+        self._offset = offset
+
+    def mark(self, df: pd.DataFrame, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Add ``near_duplicate_cluster`` and ``is_near_duplicate`` columns to a DataFrame or chunk.
+
+        Args:
+            df (pd.DataFrame): Cleaned data.
+            columns (List[str], optional): Text columns compared, concatenated per row.
+                Defaults to all text columns.
+
+        Returns:
+            pd.DataFrame: Copy of ``df``; ``is_near_duplicate`` is True for every row except
+            the first of its cluster.
+        """
+        clusters = self.add(self._row_texts(df, columns))
+        rows = np.arange(self.documents - len(df), self.documents)
+        marked = df.copy()
+        marked[CLUSTER_COLUMN] = clusters
+        marked[DUPLICATE_COLUMN] = clusters != rows
+        return marked
+
+    def drop(self, df: pd.DataFrame, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Keep only the first row of every near-duplicate cluster.
+
+        Args:
+            df (pd.DataFrame): Cleaned data.
+            columns (List[str], optional): Text columns compared. Defaults to all text columns.
+
+        Returns:
+            pd.DataFrame: Filtered DataFrame with a fresh index.
+        """
+        clusters = self.add(self._row_texts(df, columns))
+        rows = np.arange(self.documents - len(df), self.documents)
+        return df[clusters == rows].reset_index(drop=True)
+
+    def save(self, path: Union[str, Path]) -> None:
+        """
+        Pickle the detector and its index to ``path``, writing atomically.
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_suffix(path.suffix + f".{os.getpid()}.tmp")
+        with open(temp_path, "wb") as f:
+            pickle.dump(self, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, path)
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "NearDuplicateDetector":
+        """
+        Load a detector written by ``save``.
+        """
+        with open(path, "rb") as f:
+            return pickle.load(f)
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        state["_signatures"] = self._signatures[:self.documents - self._offset]
+        return state
+
+    def _reserve(self, size: int) -> None:
+        """
+        Grow the signature store (``size`` held rows) geometrically so appending chunks stays linear.
+        """
+        if size > len(self._signatures):
+            held = self.documents - self._offset
+            grown = np.empty((max(size, 2 * len(self._signatures)), self.num_perm), dtype=np.uint32)
+            grown[:held] = self._signatures[:held]
+            self._signatures = grown
+
+    @staticmethod
+    def _row_texts(df: pd.DataFrame, columns: Optional[List[str]] = None) -> List[str]:
+        """
+        Join the string cells of ``columns`` per row; other values count as blank.
+        """
+        if columns is None:
+            columns = df.select_dtypes(include=["object", "string", "category"]).columns
+        texts = pd.Series("", index=df.index, dtype=object)
+        for column in columns:
+            series = df[column].astype(object)
+            texts = texts + " " + series.where(string_mask(series), "")
+        return texts.tolist()
+
+    def _find(self, document: int) -> int:
+        parent = self._parent
+        root = document
+        while parent[root] != root:
+            root = parent[root]
+        while parent[document] != root:
+            parent[document], document = root, parent[document]
+        return root
+
+    def _union(self, a: int, b: int) -> None:
+        root_a, root_b = self._find(a), self._find(b)
+        if root_a != root_b:
+            # The earliest row stays the representative
+            self._parent[max(root_a, root_b)] = min(root_a, root_b)
@@ -0,0 +1,79 @@
+"""
+ner_gate.py: Cheap vectorized checks deciding which text values are worth sending to spaCy NER.
+"""
+
+import numpy as np
+import pandas as pd
+from typing import Sequence
+
+# Values shaped like identifiers rather than text: upper-case enums and acronyms
+# ("ACTIVE", "PENDING_REVIEW"), SKU and order codes ("SKU-1042", "INV2024"), UUIDs, and
+# numbers, numeric IDs and phone-like strings made of digits and separators only
+IDENTIFIER_PATTERN = (
+    r"[A-Z][A-Z0-9_]*"
+    r"|[A-Z]{2,}[-_/]?\d+(?:[-_/][A-Z0-9]+)*"
+    r"|[0-9A-Fa-f]{8}-[0-9A-Fa-f]{4}-[0-9A-Fa-f]{4}-[0-9A-Fa-f]{4}-[0-9A-Fa-f]{12}"
+    r"|[\d\s\-_./:,+#()]*\d[\d\s\-_./:,+#()]*"
+)
+
+# Dates, times and years, which spaCy tags as DATE or TIME even without letters
+# (RE2 syntax, so no lookarounds)
+DATE_TIME_PATTERN = (
+    r"(?:^|\D)\d{1,4}[-/.]\d{1,2}[-/.]\d{1,4}(?:\D|$)"
+    r"|(?:^|\D)\d{1,2}:\d{2}(?:\D|$)"
+    r"|^\s*(?:1[89]|20)\d{2}\s*$"
+)
+
+
+def needs_ner(
+    texts: Sequence[str],
+    min_length: int = 2,
+    require_capital_or_digit: bool = True,
+    skip_identifiers: bool = True,
+) -> np.ndarray:
+    """
+    Flag the texts that may contain a named entity, cheapest check first.
+
+    A text is skipped when it is shorter than ``min_length`` once stripped, when it has
+    neither a letter nor a digit (punctuation, symbols) or, with
+    ``require_capital_or_digit``, when it has neither a capital letter nor a digit. Names,
+    places and organisations are capitalized, and dates, times and amounts carry digits
+    (``"2020-01-05"``, ``"10:30"``, ``"$1,200"``), so texts with a digit pass this check.
+
+    With ``skip_identifiers``, values shaped like identifiers (``IDENTIFIER_PATTERN``:
+    upper-case enums, SKU and order codes, UUIDs, numbers and numeric IDs) are skipped too,
+    unless they look like a date, a time or a year (``DATE_TIME_PATTERN``). Skipped texts
+    rarely hold an entity, and regex detectors (emails, phones, SSNs) still run on them.
+
+    The checks run on an Arrow-backed string array, without a Python loop per value.
+
+    Args:
+        texts (Sequence[str]): Text values (no missing values).
+        min_length (int): Shortest stripped text sent to NER.
+        require_capital_or_digit (bool): Skip all-lowercase texts without digits.
+        skip_identifiers (bool): Skip codes, IDs, enums and plain numbers.
+
+    Returns:
+        np.ndarray: Boolean mask, True for texts to run NER on.
+    """
+    series = pd.Series(texts, dtype="string[pyarrow]")
+    mask = (series.str.strip().str.len() >= min_length).to_numpy(dtype=bool)
+    if not mask.any():
+        return mask
+
+    lower = series.str.lower()
+    has_digit = series.str.contains(r"\d", regex=True).to_numpy(dtype=bool)
+    if require_capital_or_digit:
+        has_letter = (lower != series).to_numpy(dtype=bool)
+    else:
+        # Cased letters differ between their lower and upper forms
+        has_letter = (lower != series.str.upper()).to_numpy(dtype=bool)
+    # Dates, times and amounts have no cased letter, so the letter check only applies without digits
+    mask &= has_letter | has_digit
+
+    if skip_identifiers and mask.any():
+        stripped = series.str.strip()
+        identifier = stripped.str.fullmatch(IDENTIFIER_PATTERN).to_numpy(dtype=bool)
+        date_time = series.str.contains(DATE_TIME_PATTERN, regex=True).to_numpy(dtype=bool)
+        mask &= ~identifier | date_time
+    return mask
@@ -3,21 +3,107 @@ pii_redactor.py: Redact/mask PII information to support GDPR and HIPAA complianc
 """
 
 import re
+import numpy as np
 import pandas as pd
+from typing import Dict, List, Optional
 from datacleancraft.models.spacy_model_loader import SpacyModelLoader
+from datacleancraft.preprocessing.ner_gate import needs_ner
+from datacleancraft.preprocessing.redaction import EMAIL_PATTERN, PHONE_PATTERN, PII_ENTITIES, SSN_PATTERN, RedactionEngine
+from datacleancraft.preprocessing.unique import map_unique_strings, string_mask
+from datacleancraft.utils.cache import CacheInfo, LRUCache
+
+# Pipeline factories that set ``doc.ents``
+ENTITY_FACTORIES = {"ner", "beam_ner", "entity_ruler", "span_ruler"}
+
+# Sentinel for cache lookups, since a redacted value may legitimately be any object
+_MISSING = object()
+
+
+def ner_components(nlp) -> List[str]:
+    """
+    Return the pipeline components needed to compute ``doc.ents``.
+
+    These are the entity recognizers and rulers, plus any shared ``tok2vec`` or
+    ``transformer`` component they listen to. Every other component (tagger, parser,
+    lemmatizer, ...) can be disabled without changing the entities.
+
+    Args:
+        nlp (spacy.language.Language): Loaded pipeline.
+
+    Returns:
+        List[str]: Names of the components to keep enabled, in pipeline order.
+    """
+    entity_names = {name for name in nlp.pipe_names if nlp.get_pipe_meta(name).factory in ENTITY_FACTORIES}
+    keep = set(entity_names)
+    for name, component in nlp.pipeline:
+        if entity_names.intersection(getattr(component, "listening_components", ())):
+            keep.add(name)
+    return [name for name in nlp.pipe_names if name in keep]
 
-# PII entity labels that we want to redact
-PII_ENTITIES = {"PERSON", "GPE", "LOC", "ORG", "DATE", "TIME", "MONEY", "EMAIL", "PHONE"}
 
 class PIIRedactor:
-    EMAIL_PATTERN = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
-    PHONE_PATTERN = re.compile(r'\b(\+?\d{1,3}[-.\s]?|\()?\d{1,4}\)?[-.\s]?\d{1,4}[-.\s]?\d{1,9}\b')
-    SSN_PATTERN = re.compile(r'\b\d{3}-\d{2}-\d{4}\b')
+    EMAIL_PATTERN = re.compile(EMAIL_PATTERN)
+    PHONE_PATTERN = re.compile(PHONE_PATTERN)
+    SSN_PATTERN = re.compile(SSN_PATTERN)
     
-    def __init__(self, mask_token: str = "[REDACTED]"):
+    def __init__(
+        self,
+        mask_token: str = "[REDACTED]",
+        cache_size: Optional[int] = 100000,
+        gate_ner: bool = False,
+        profile_sample_size: Optional[int] = None,
+    ):
+        """
+        Args:
+            mask_token (str): Replacement for redacted spans.
+            cache_size (int, optional): Number of redacted values memoized. ``0`` disables
+                the cache and ``None`` makes it unbounded.
+            gate_ner (bool): In batched redaction, only send values passing the cheap checks
+                of ``needs_ner`` to spaCy; the others are redacted by the regex detectors only.
+            profile_sample_size (int, optional): In batched redaction, run NER on this many
+                distinct values the first time a column is seen, and turn NER off for the
+                column if none of them holds a PII entity.
+        """
         spacymodelloader = SpacyModelLoader()
         self.nlp = spacymodelloader.load_model()
         self.mask_token = mask_token
+        self.engine = RedactionEngine(mask_token=mask_token)
+        self._cache = LRUCache(cache_size)
+        self.gate_ner = gate_ner
+        self.profile_sample_size = profile_sample_size
+        self.column_profiles: Dict[str, bool] = {}
+        self.stats: Dict[str, int] = {}
+        self.reset_stats()
+
+    def reset_stats(self) -> None:
+        """
+        Zero the counters of redacted values: ``values`` redacted (cache misses),
+        ``ner_values`` sent to NER, ``skipped_by_gate`` and ``skipped_by_profile``.
+        """
+        self.stats = {"values": 0, "ner_values": 0, "skipped_by_gate": 0, "skipped_by_profile": 0}
+
+    def add_pattern(self, label: str, pattern: str) -> None:
+        """
+        Add a regex detector (e.g. ``add_pattern("IBAN", r"\\bGB\\d{2}[A-Z]{4}\\d{14}\\b")``).
+
+        Args:
+            label (str): Detector name, a valid Python identifier.
+            pattern (str): Regular expression matching the values to redact.
+        """
+        self.engine.add_pattern(label, pattern)
+        self._cache.clear()
+
+    def cache_info(self) -> CacheInfo:
+        """
+        Report hits, misses and size of the redaction cache.
+        """
+        return self._cache.cache_info()
+
+    def cache_clear(self) -> None:
+        """
+        Empty the redaction cache and reset its counters.
+        """
+        self._cache.clear()
 
     def redact_text(self, text: str) -> str:
         """
@@ -32,38 +118,181 @@ class PIIRedactor:
         if not isinstance(text, str):
             return text
 
-        # Redact PII entities using spaCy's NER
-        doc = self.nlp(text)
-        redacted = text
+        key = (text, self.mask_token, True)
+        redacted = self._cache.get(key)
+        if redacted is not None:
+            return redacted
 
-        for ent in doc.ents:
-            if ent.label_ in PII_ENTITIES:
-                redacted = redacted.replace(ent.text, self.mask_token)
+        redacted = self._redact_with_doc(text, self.nlp(text))
+        self._cache.put(key, redacted)
+        return redacted
 
-        # Simple regex-based email/phone fallback
-        redacted = self.EMAIL_PATTERN.sub(self.mask_token, redacted)
-        redacted = self.PHONE_PATTERN.sub(self.mask_token, redacted)
-        redacted = self.SSN_PATTERN.sub(self.mask_token, redacted)
+    def _redact_with_doc(self, text: str, doc) -> str:
+        """
+        Mask the PII entities of an already parsed ``doc`` and every regex match in one pass.
+        """
+        return self.engine.redact(text, doc, mask_token=self.mask_token)
 
-        return redacted
+    def redact_series(self,
+        series: pd.Series,
+        batch_size: int = 1000,
+        n_process: int = 1,
+        factorize: bool = True,
+        use_ner: bool = True
+    ) -> pd.Series:
+        """
+        Redact a text column in batches with ``nlp.pipe``; non-string values are kept as is.
+
+        Only the components behind ``doc.ents`` run (see ``ner_components``), and values
+        already in the cache are not parsed again.
+
+        Args:
+            series (pd.Series): Text column. Categorical columns are redacted per category.
+            batch_size (int): Number of texts per ``nlp.pipe`` batch.
+            n_process (int): Number of processes used by ``nlp.pipe``.
+            factorize (bool): Redact each distinct value once and map the results back by code.
+            use_ner (bool): Run NER at all; False redacts with the regex detectors only.
+
+        Returns:
+            pd.Series: Redacted column, matching ``series.apply(self.redact_text)`` unless
+            NER is gated or turned off.
+        """
+        return map_unique_strings(
+            series,
+            lambda texts: self._redact_batch(texts, batch_size, n_process, use_ner),
+            factorize=factorize
+        )
+
+    def redact_regex_series(self, series: pd.Series, factorize: bool = True) -> pd.Series:
+        """
+        Mask emails, phones, SSNs and added patterns in a whole column, without NER.
+
+        The regex detectors run as one vectorized Arrow kernel over the column (see
+        ``RedactionEngine.redact_array``); non-string values are kept as is.
+
+        Args:
+            series (pd.Series): Text column. Categorical columns are redacted per category.
+            factorize (bool): Redact each distinct value once and map the results back by code.
+
+        Returns:
+            pd.Series: Redacted column.
+        """
+        return map_unique_strings(
+            series,
+            lambda texts: self.engine.redact_array(texts, mask_token=self.mask_token),
+            factorize=factorize
+        )
 
-    def redact_dataframe(self, df: pd.DataFrame, columns: list = None) -> pd.DataFrame:
+    def profile_column(self, series: pd.Series, batch_size: int = 1000, n_process: int = 1) -> bool:
+        """
+        Check whether NER finds a PII entity in evenly spaced distinct values of a column.
+
+        Args:
+            series (pd.Series): Text column.
+            batch_size (int): Number of texts per ``nlp.pipe`` batch.
+            n_process (int): Number of processes used by ``nlp.pipe``.
+
+        Returns:
+            bool: True if the column needs NER.
+        """
+        values = pd.unique(series.to_numpy(dtype=object)[string_mask(series)])
+        if self.profile_sample_size is not None and len(values) > self.profile_sample_size:
+            positions = np.linspace(0, len(values) - 1, self.profile_sample_size).round().astype(np.int64)
+            values = values[np.unique(positions)]
+        if self.gate_ner and len(values):
+            values = values[needs_ner(values)]
+
+        docs = self.nlp.pipe(values.tolist(), batch_size=batch_size, n_process=n_process, disable=self._ner_disabled())
+        return any(ent.label_ in self.engine.entity_labels for doc in docs for ent in doc.ents)
+
+    def _ner_disabled(self) -> List[str]:
+        """
+        Names of the pipeline components not needed for NER.
+        """
+        enabled = ner_components(self.nlp)
+        return [name for name in self.nlp.pipe_names if name not in enabled]
+
+    def _redact_batch(self, texts: List[str], batch_size: int, n_process: int, use_ner: bool = True) -> List[str]:
+        """
+        Redact a list of strings, serving cached values and parsing the misses with ``nlp.pipe``.
+        """
+        if use_ner and self.gate_ner:
+            ner_mask = needs_ner(texts).tolist()
+        else:
+            ner_mask = [use_ner] * len(texts)
+
+        keys = [(text, self.mask_token, ner) for text, ner in zip(texts, ner_mask)]
+        results = [self._cache.get(key, _MISSING) for key in keys]
+        missing = [i for i, result in enumerate(results) if result is _MISSING]
+        if not missing:
+            return results
+
+        ner_missing = [i for i in missing if ner_mask[i]]
+        regex_missing = [i for i in missing if not ner_mask[i]]
+        self.stats["values"] += len(missing)
+        self.stats["ner_values"] += len(ner_missing)
+        self.stats["skipped_by_gate" if use_ner else "skipped_by_profile"] += len(regex_missing)
+
+        for i in regex_missing:
+            results[i] = self.engine.redact(texts[i], mask_token=self.mask_token)
+            self._cache.put(keys[i], results[i])
+
+        if ner_missing:
+            docs = self.nlp.pipe((texts[i] for i in ner_missing), batch_size=batch_size, n_process=n_process, disable=self._ner_disabled())
+            for i, doc in zip(ner_missing, docs):
+                results[i] = self._redact_with_doc(texts[i], doc)
+                self._cache.put(keys[i], results[i])
+        return results
+
+    def redact_dataframe(self,
+        df: pd.DataFrame,
+        columns: list = None,
+        factorize: bool = True,
+        batch_size: Optional[int] = 1000,
+        n_process: int = 1,
+        regex_only_columns: Optional[List[str]] = None
+    ) -> pd.DataFrame:
         """
         Redact PII from specified DataFrame columns or all text columns if none are provided.
 
+        Each column is streamed through ``nlp.pipe`` with only the NER components enabled;
+        the output is the same as applying ``redact_text`` to every cell unless NER gating
+        or column profiling is enabled.
+
         Args:
             df (pd.DataFrame): Input DataFrame.
             columns (list): Columns to redact. If None, all text columns are redacted.
+            factorize (bool): Redact each distinct value of a column once and map the results
+                back to the rows by code.
+            batch_size (int, optional): Number of texts per ``nlp.pipe`` batch. ``None``
+                redacts cell by cell with ``redact_text``.
+            n_process (int): Number of processes used by ``nlp.pipe``.
+            regex_only_columns (List[str], optional): Columns redacted with the regex
+                detectors only, vectorized and without NER (e.g. contact fields).
 
         Returns:
             pd.DataFrame: Redacted DataFrame.
         """
         # If no columns specified, select all text columns
         if columns is None:
-            columns = df.select_dtypes(include=["object", "string"]).columns.tolist()
+            columns = df.select_dtypes(include=["object", "string", "category"]).columns.tolist()
         
         for col in columns:
             if col in df.columns:  # Ensure the column exists in the DataFrame
-                df[col] = df[col].apply(self.redact_text)
+                if regex_only_columns and col in regex_only_columns:
+                    df[col] = self.redact_regex_series(df[col], factorize=factorize)
+                elif batch_size is not None:
+                    use_ner = True
+                    if self.profile_sample_size is not None:
+                        if col not in self.column_profiles:
+                            self.column_profiles[col] = self.profile_column(df[col], batch_size, n_process)
+                        use_ner = self.column_profiles[col]
+                    df[col] = self.redact_series(
+                        df[col], batch_size=batch_size, n_process=n_process, factorize=factorize, use_ner=use_ner
+                    )
+                elif factorize:
+                    df[col] = map_unique_strings(df[col], lambda texts: [self.redact_text(text) for text in texts])
+                else:
+                    df[col] = df[col].apply(self.redact_text)
         
         return df
\ No newline at end of file
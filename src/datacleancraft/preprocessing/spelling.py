@@ -0,0 +1,310 @@
+"""
+spelling.py: Fast spelling correction with a symmetric-delete (SymSpell) index.
+"""
+
+import hashlib
+import logging
+import os
+import pickle
+import string
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Union
+from datacleancraft.utils.cache import CacheInfo, LRUCache, get_cache_dir
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_EDIT_DISTANCE = 2
+
+# In-process indexes keyed by (dictionary path, max edit distance)
+_INDEXES: Dict[tuple, "SymSpellIndex"] = {}
+
+
+def default_dictionary_path() -> Path:
+    """
+    Return the word frequency list shipped with TextBlob, the data behind ``Word.correct``.
+    """
+    import textblob
+
+    return Path(textblob.__file__).parent / "en" / "en-spelling.txt"
+
+
+def load_frequency_dictionary(path: Optional[Union[str, Path]] = None) -> Dict[str, int]:
+    """
+    Read a ``word count`` per line frequency list; lines starting with ``;;;`` are comments.
+
+    Args:
+        path (str or Path, optional): Frequency list. Defaults to TextBlob's English list.
+
+    Returns:
+        Dict[str, int]: Word frequencies.
+    """
+    frequencies = {}
+    with open(path or default_dictionary_path(), "r", encoding="utf-8") as f:
+        for line in f:
+            if line.startswith(";;;"):
+                continue
+            parts = line.split()
+            if len(parts) >= 2:
+                frequencies[parts[0]] = int(parts[1])
+    return frequencies
+
+
+def _deletes(word: str, max_distance: int) -> Set[str]:
+    """
+    All strings obtained by deleting up to ``max_distance`` characters from ``word``.
+    """
+    deletes = {word}
+    frontier = {word}
+    for _ in range(max_distance):
+        frontier = {candidate[:i] + candidate[i + 1:] for candidate in frontier for i in range(len(candidate))}
+        deletes |= frontier
+    return deletes
+
+
+def edit_distance(a: str, b: str, max_distance: int) -> int:
+    """
+    Damerau-Levenshtein distance (insertions, deletions, substitutions and adjacent
+    transpositions, with no restriction on editing a substring twice), capped at
+    ``max_distance + 1``. This is the number of edits ``textblob.Word.correct`` chains,
+    e.g. 2 for ``"reicve"`` and ``"receive"``.
+    """
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+    infinity = len(a) + len(b)
+    # Row i + 1 and column j + 1 hold the distance between a[:i] and b[:j]
+    table = [[infinity] * (len(b) + 2)] + [[infinity, i] + [0] * len(b) for i in range(len(a) + 1)]
+    table[1] = [infinity] + list(range(len(b) + 1))
+    last_row = {}
+    for i in range(1, len(a) + 1):
+        last_match_column = 0
+        for j in range(1, len(b) + 1):
+            k = last_row.get(b[j - 1], 0)
+            l = last_match_column
+            if a[i - 1] == b[j - 1]:
+                cost = 0
+                last_match_column = j
+            else:
+                cost = 1
+            table[i + 1][j + 1] = min(
+                table[i][j] + cost,
+                table[i + 1][j] + 1,
+                table[i][j + 1] + 1,
+                table[k][l] + (i - k - 1) + 1 + (j - l - 1),
+            )
+        last_row[a[i - 1]] = i
+        # Row minima never decrease (a transposition costs at least the deletions it skips)
+        if min(table[i + 1][1:]) > max_distance:
+            return max_distance + 1
+    return min(table[len(a) + 1][len(b) + 1], max_distance + 1)
+
+
+def within_one_edit(a: str, b: str) -> bool:
+    """
+    Whether ``a`` and ``b`` differ by at most one insertion, deletion, substitution or
+    adjacent transposition; a linear-time special case of ``edit_distance``.
+    """
+    if len(a) < len(b):
+        a, b = b, a
+    if len(a) - len(b) > 1:
+        return False
+    prefix = 0
+    while prefix < len(b) and a[prefix] == b[prefix]:
+        prefix += 1
+    if len(a) != len(b):
+        return a[prefix + 1:] == b[prefix:]
+    if prefix == len(a) or a[prefix + 1:] == b[prefix + 1:]:
+        return True
+    return a[prefix + 2:] == b[prefix + 2:] and a[prefix] == b[prefix + 1] and a[prefix + 1] == b[prefix]
+
+
+class SymSpellIndex:
+    """
+    Symmetric-delete spelling index.
+
+    Every dictionary word is stored under all strings reachable by deleting up to
+    ``max_edit_distance`` characters. A lookup generates the deletes of the input and only
+    verifies the few dictionary words sharing one of them, instead of generating every
+    possible edit of the input as ``textblob.Word.correct`` does.
+    """
+
+    def __init__(self, frequencies: Dict[str, int], max_edit_distance: int = DEFAULT_MAX_EDIT_DISTANCE):
+        """
+        Args:
+            frequencies (Dict[str, int]): Word frequencies.
+            max_edit_distance (int): Largest edit distance the index can answer.
+        """
+        self.max_edit_distance = max_edit_distance
+        self.frequencies = frequencies
+        self.deletes: Dict[str, List[str]] = {}
+        for word in frequencies:
+            for delete in _deletes(word, max_edit_distance):
+                self.deletes.setdefault(delete, []).append(word)
+
+    def lookup(self, word: str, max_edit_distance: Optional[int] = None) -> Optional[str]:
+        """
+        Return the closest dictionary word, preferring the smallest edit distance, then the
+        highest frequency, then (like TextBlob) the alphabetically last word.
+
+        Args:
+            word (str): Word to correct.
+            max_edit_distance (int, optional): At most the index's ``max_edit_distance``.
+
+        Returns:
+            str or None: Best suggestion, or None if nothing is close enough.
+        """
+        if word in self.frequencies:
+            return word
+        max_distance = min(max_edit_distance if max_edit_distance is not None else self.max_edit_distance,
+                           self.max_edit_distance)
+
+        # Closer candidates always win, so search distance 1 before paying for distance 2.
+        # Every word within distance d shares a delete of at most d characters with
+        # ``word``, so each pass finds all candidates of its distance.
+        for distance in range(1, max_distance + 1):
+            best = self._best_candidate(word, distance)
+            if best is not None:
+                return best
+        return None
+
+    def _best_candidate(self, word: str, max_distance: int) -> Optional[str]:
+        """
+        Closest, then most frequent, then alphabetically last dictionary word within
+        ``max_distance`` of ``word``.
+        """
+        best = None
+        best_key = None
+        seen = set()
+        for delete in _deletes(word, max_distance):
+            for candidate in self.deletes.get(delete, ()):
+                if candidate in seen:
+                    continue
+                seen.add(candidate)
+                if max_distance == 1:
+                    distance = 1 if within_one_edit(word, candidate) else 2
+                else:
+                    distance = edit_distance(word, candidate, max_distance)
+                if distance > max_distance:
+                    continue
+                key = (-distance, self.frequencies[candidate], candidate)
+                if best_key is None or key > best_key:
+                    best, best_key = candidate, key
+        return best
+
+    def save(self, path: Union[str, Path]) -> None:
+        """
+        Pickle the index to ``path``, writing atomically.
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_suffix(path.suffix + f".{os.getpid()}.tmp")
+        with open(temp_path, "wb") as f:
+            pickle.dump(self, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, path)
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "SymSpellIndex":
+        """
+        Load an index written by ``save``.
+        """
+        with open(path, "rb") as f:
+            return pickle.load(f)
+
+
+def get_spelling_index(
+    max_edit_distance: int = DEFAULT_MAX_EDIT_DISTANCE,
+    dictionary_path: Optional[Union[str, Path]] = None,
+) -> SymSpellIndex:
+    """
+    Return the spelling index for a dictionary, building and persisting it on first use.
+
+    The index is pickled in the ``spelling`` folder of the datacleancraft cache, under a
+    name derived from the dictionary contents and ``max_edit_distance``, and shared within
+    the process.
+
+    Args:
+        max_edit_distance (int): Largest edit distance the index can answer.
+        dictionary_path (str or Path, optional): Frequency list. Defaults to TextBlob's.
+
+    Returns:
+        SymSpellIndex: Ready-to-use index.
+    """
+    dictionary_path = Path(dictionary_path or default_dictionary_path())
+    key = (str(dictionary_path), max_edit_distance)
+    if key in _INDEXES:
+        return _INDEXES[key]
+
+    digest = hashlib.sha1(dictionary_path.read_bytes()).hexdigest()[:16]
+    index_path = get_cache_dir("spelling") / f"symspell-{digest}-d{max_edit_distance}.pkl"
+    index = None
+    if index_path.exists():
+        try:
+            index = SymSpellIndex.load(index_path)
+        except Exception as e:
+            logger.warning(f"Rebuilding unreadable spelling index {index_path}: {e}")
+    if index is None:
+        index = SymSpellIndex(load_frequency_dictionary(dictionary_path), max_edit_distance)
+        index.save(index_path)
+
+    _INDEXES[key] = index
+    return index
+
+
+class SpellingCorrector:
+    """
+    Word-by-word spelling correction compatible with ``textblob.Word.correct``.
+
+    Single characters, punctuation and numbers are kept, known words are kept, and
+    title-cased words keep their capitalization. Corrections are memoized per word.
+    """
+
+    def __init__(
+        self,
+        max_edit_distance: int = DEFAULT_MAX_EDIT_DISTANCE,
+        cache_size: Optional[int] = 100000,
+        dictionary_path: Optional[Union[str, Path]] = None,
+    ):
+        """
+        Args:
+            max_edit_distance (int): Largest edit distance considered for a correction.
+            cache_size (int, optional): Number of corrected words memoized.
+            dictionary_path (str or Path, optional): Frequency list. Defaults to TextBlob's.
+        """
+        self.max_edit_distance = max_edit_distance
+        self.index = get_spelling_index(max_edit_distance, dictionary_path)
+        self._cache = LRUCache(cache_size)
+
+    def correct_word(self, word: str) -> str:
+        """
+        Return the most likely spelling of a single word.
+        """
+        corrected = self._cache.get(word)
+        if corrected is None:
+            corrected = self._correct_word(word)
+            self._cache.put(word, corrected)
+        return corrected
+
+    def _correct_word(self, word: str) -> str:
+        if len(word) == 1 or word in string.punctuation or word in string.whitespace:
+            return word
+        if word.replace(".", "").isdigit():
+            return word
+        suggestion = self.index.lookup(word, self.max_edit_distance) or word
+        return suggestion.title() if word.istitle() else suggestion
+
+    def correct(self, text: str) -> str:
+        """
+        Correct every whitespace-separated word of ``text``.
+
+        Args:
+            text (str): Input text.
+
+        Returns:
+            str: Text with corrected spelling, words joined by single spaces.
+        """
+        return " ".join(self.correct_word(word) for word in text.split())
+
+    def cache_info(self) -> CacheInfo:
+        """
+        Report hits, misses and size of the per-word cache.
+        """
+        return self._cache.cache_info()
@@ -0,0 +1,94 @@
+"""
+unique.py: Apply text transforms once per distinct value of a column.
+"""
+
+import numpy as np
+import pandas as pd
+from typing import Any, Callable, Iterable, List
+
+# Transform applied to a list of strings, returning one result per string in order
+BatchTransform = Callable[[List[str]], Iterable[Any]]
+
+
+def map_unique_strings(series: pd.Series, transform: BatchTransform, factorize: bool = True) -> pd.Series:
+    """
+    Apply ``transform`` to the string cells of a column, leaving other values untouched.
+
+    With ``factorize`` the strings are factorized first, so ``transform`` only sees each
+    distinct value once and the results are mapped back to the rows by code. Categorical
+    columns are always transformed per category.
+
+    Args:
+        series (pd.Series): Input column.
+        transform (Callable[[List[str]], Iterable]): Batch function over a list of strings.
+        factorize (bool): Transform distinct values only.
+
+    Returns:
+        pd.Series: Transformed column, equivalent to ``series.apply`` with the per-value
+        function behind ``transform``.
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        categories = [category for category in series.cat.categories if isinstance(category, str)]
+        mapping = dict(zip(categories, transform(categories)))
+        return series.map(lambda value: mapping.get(value, value) if isinstance(value, str) else value)
+
+    mask = string_mask(series)
+    if not mask.any():
+        return series.copy()
+
+    values = series.to_numpy(dtype=object, copy=True)
+    strings = values[mask]
+    if factorize:
+        codes, uniques = pd.factorize(strings)
+        results = _to_object_array(transform(list(uniques)), len(uniques))
+        values[mask] = results[codes]
+    else:
+        values[mask] = _to_object_array(transform(list(strings)), len(strings))
+
+    return pd.Series(values, index=series.index, name=series.name, dtype=object)
+
+
+def string_mask(series: pd.Series) -> np.ndarray:
+    """
+    Flag the cells of a column that hold Python strings.
+
+    String, Arrow string and categorical columns are decided from their dtype, and object
+    columns holding only strings (and missing values) from ``infer_dtype`` scans in C, so
+    only mixed object columns are checked cell by cell.
+
+    Args:
+        series (pd.Series): Input column.
+
+    Returns:
+        np.ndarray: Boolean mask, True for string cells.
+    """
+    dtype = series.dtype
+    if isinstance(dtype, pd.CategoricalDtype):
+        is_str = np.fromiter((isinstance(category, str) for category in dtype.categories), dtype=bool, count=len(dtype.categories))
+        codes = series.cat.codes.to_numpy()
+        return (codes >= 0) & np.append(is_str, False)[codes]
+    if pd.api.types.is_string_dtype(dtype) and dtype != object:
+        # StringDtype ("string", "string[pyarrow]") and Arrow string types hold strings or NA
+        return series.notna().to_numpy(dtype=bool)
+    if dtype != object:
+        return np.zeros(len(series), dtype=bool)
+
+    if pd.api.types.infer_dtype(series, skipna=False) == "string":
+        return np.ones(len(series), dtype=bool)
+    inferred = pd.api.types.infer_dtype(series, skipna=True)
+    if inferred == "string":
+        return series.notna().to_numpy(dtype=bool)
+    if inferred == "empty":
+        return np.zeros(len(series), dtype=bool)
+    values = series.to_numpy(dtype=object)
+    return np.fromiter((isinstance(value, str) for value in values), dtype=bool, count=len(values))
+
+
+def _to_object_array(results: Iterable[Any], size: int) -> np.ndarray:
+    """
+    Collect transform results into a 1-D object array without numpy unpacking sequences.
+    """
+    array = np.empty(size, dtype=object)
+    for i, result in enumerate(results):
+        array[i] = result
+    return array
@@ -1,4 +1,15 @@
 from .error_handler import PipelineError, handle_exception
 from .logger import setup_logger, get_logger, default_logger
+from .fingerprint import schema_fingerprint
+from .cache import get_cache_dir, LRUCache
 
-__all__ = ["PipelineError", "handle_exception", "Logger"]
\ No newline at end of file
+__all__ = [
+    "PipelineError",
+    "handle_exception",
+    "setup_logger",
+    "get_logger",
+    "default_logger",
+    "schema_fingerprint",
+    "get_cache_dir",
+    "LRUCache",
+]
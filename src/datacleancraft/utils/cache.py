@@ -0,0 +1,97 @@
+"""
+cache.py: On-disk cache location and in-memory LRU cache shared by datacleancraft components.
+"""
+
+import os
+from collections import OrderedDict, namedtuple
+from pathlib import Path
+from typing import Any, Hashable, Optional
+
+CACHE_DIR_ENV = "DATACLEANCRAFT_CACHE_DIR"
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "datacleancraft"
+
+
+def get_cache_dir(*parts: str) -> Path:
+    """
+    Return (and create) a directory inside the datacleancraft cache.
+
+    The cache root defaults to ``~/.cache/datacleancraft`` and can be moved with the
+    ``DATACLEANCRAFT_CACHE_DIR`` environment variable.
+
+    Args:
+        *parts (str): Sub-directory names inside the cache root.
+
+    Returns:
+        Path: Existing cache directory.
+    """
+    path = Path(os.environ.get(CACHE_DIR_ENV, DEFAULT_CACHE_DIR)).joinpath(*parts)
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+_MISSING = object()
+
+
+class LRUCache:
+    """
+    Bounded least-recently-used cache with hit and miss counters.
+
+    Unlike ``functools.lru_cache`` it can be read and filled explicitly, so batched code
+    paths can look up many keys, compute only the misses together and store the results.
+    """
+
+    def __init__(self, maxsize: Optional[int] = 100000):
+        """
+        Args:
+            maxsize (int, optional): Maximum number of entries. ``0`` disables caching and
+                ``None`` makes the cache unbounded.
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Return the cached value for ``key`` (counting a hit) or ``default`` (counting a miss).
+        """
+        value = self._data.get(key, _MISSING)
+        if value is _MISSING:
+            self.misses += 1
+            return default
+        self.hits += 1
+        self._data.move_to_end(key)
+        return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        Store ``value`` under ``key``, evicting the least recently used entry when full.
+        """
+        if self.maxsize == 0:
+            return
+        self._data[key] = value
+        self._data.move_to_end(key)
+        if self.maxsize is not None and len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def cache_info(self) -> CacheInfo:
+        """
+        Report hits, misses, maximum size and current size, like ``functools.lru_cache``.
+        """
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._data))
+
+    def clear(self) -> None:
+        """
+        Drop all entries and reset the counters.
+        """
+        self._data.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -0,0 +1,24 @@
+"""
+fingerprint.py: Stable fingerprints of DataFrame schemas, used as cache keys.
+"""
+
+import hashlib
+import json
+import pandas as pd
+
+
+def schema_fingerprint(df: pd.DataFrame) -> str:
+    """
+    Fingerprint a DataFrame layout from its column names and dtypes.
+
+    Frames with the same columns, in the same order and with the same dtypes, share a
+    fingerprint regardless of their contents or length.
+
+    Args:
+        df (pd.DataFrame): DataFrame to fingerprint.
+
+    Returns:
+        str: Hex digest identifying the schema.
+    """
+    schema = [[str(col), str(dtype)] for col, dtype in df.dtypes.items()]
+    return hashlib.sha1(json.dumps(schema).encode("utf-8")).hexdigest()
@@ -5,56 +5,262 @@ Detects anomalies in numeric datasets using a simple Autoencoder.
 
 import numpy as np
 import pandas as pd
-import torch
-from datacleancraft.models.autoencoder_loader import load_autoencoder
+from typing import Dict, Optional
 from datacleancraft.utils.error_handler import handle_exception
+from datacleancraft.utils.fingerprint import schema_fingerprint
+
+# Threshold of the untrained model, which scores raw values
+DEFAULT_THRESHOLD = 0.1
+
+
+class RowReservoir:
+    """
+    Uniform sample of at most ``size`` rows from a stream of numeric chunks (algorithm R).
+    """
+
+    def __init__(self, columns: pd.Index, size: int, seed: Optional[int] = 0):
+        """
+        Args:
+            columns (pd.Index): Columns of the sampled rows.
+            size (int): Most rows kept.
+            seed (int, optional): Seed of the replacement choices.
+        """
+        self.columns = columns
+        self.size = size
+        self.rows = np.empty((size, len(columns)), dtype=np.float32)
+        self.seen = 0
+        self._rng = np.random.default_rng(seed)
+
+    def add(self, values: np.ndarray) -> None:
+        """
+        Offer the rows of ``values`` to the sample.
+        """
+        # Fill the free slots first
+        filled = min(self.seen, self.size)
+        head = min(self.size - filled, len(values))
+        self.rows[filled:filled + head] = values[:head]
+
+        # Row number t (0-based) then replaces a random slot with probability size / (t + 1)
+        rest = values[head:]
+        if len(rest):
+            slots = self._rng.integers(0, np.arange(self.seen + head, self.seen + len(values)) + 1)
+            chosen = np.flatnonzero(slots < self.size)
+            # When several rows pick one slot the last of them wins, as in the sequential algorithm
+            last_slots, reversed_index = np.unique(slots[chosen][::-1], return_index=True)
+            self.rows[last_slots] = rest[chosen[::-1][reversed_index]]
+        self.seen += len(values)
+
+    def sample(self) -> pd.DataFrame:
+        """
+        Rows kept so far.
+        """
+        return pd.DataFrame(self.rows[:min(self.seen, self.size)], columns=self.columns)
+
 
 class AnomalyDetector:
-    def __init__(self, threshold: float = 0.1):
+    def __init__(
+        self,
+        threshold: Optional[float] = None,
+        use_registry: Optional[bool] = None,
+        train_if_missing: bool = False,
+        min_train_rows: int = 100,
+        registry_dir: Optional[str] = None,
+        training_options: Optional[dict] = None,
+        train_sample_size: int = 50_000,
+    ):
         """
         Initialize the anomaly detector.
 
+        By default an untrained model scores the raw values. With the registry enabled, a
+        trained model saved for the schema fingerprint of the numeric columns is loaded
+        instead (it scores standardized values), or, with ``train_if_missing``, trained on
+        the data and saved first.
+
         Args:
-            threshold (float): Reconstruction error threshold to mark anomalies.
+            threshold (float, optional): Reconstruction error threshold to mark anomalies.
+                Defaults to the 99th percentile of the training errors of a trained model,
+                or ``DEFAULT_THRESHOLD`` for the untrained one.
+            use_registry (bool, optional): Load (and save) trained models in the autoencoder
+                registry. Defaults to on when ``train_if_missing`` or ``registry_dir`` is set.
+            train_if_missing (bool): Train and save a model when the registry has none.
+            min_train_rows (int): Fewest rows to train on; smaller inputs use the fallback.
+            registry_dir (str, optional): Registry directory. Defaults to the cache directory.
+            training_options (dict, optional): Keyword arguments of ``train_autoencoder``.
+            train_sample_size (int): Most rows kept per schema by ``observe`` to train on.
         """
         self.threshold = threshold
         self.model = None
         self.input_dim = None
+        self.scaler = None
+        self.metadata = {}
+        self.fingerprint = None
+        if use_registry is None:
+            use_registry = train_if_missing or registry_dir is not None
+        self.use_registry = use_registry
+        self.train_if_missing = train_if_missing
+        self.min_train_rows = min_train_rows
+        self.registry_dir = registry_dir
+        self.training_options = dict(training_options or {})
+        self.train_sample_size = train_sample_size
+        self._registry = None
+        self._trained: Dict[str, tuple] = {}
+        self._reservoirs: Dict[str, RowReservoir] = {}
 
-    @handle_exception
-    def detect_anomalies(self, df: pd.DataFrame) -> pd.DataFrame:
+    @property
+    def registry(self):
         """
-        Detect anomalies and return anomaly scores.
+        Autoencoder registry, created (and torch imported) on first use.
+        """
+        if self._registry is None:
+            from datacleancraft.models.autoencoder_registry import AutoencoderRegistry
+            self._registry = AutoencoderRegistry(self.registry_dir)
+        return self._registry
+
+    def train(self, df: pd.DataFrame) -> dict:
+        """
+        Train a model on the numeric columns of ``df`` and save it for their fingerprint.
 
         Args:
-            df (pd.DataFrame): Numeric DataFrame.
+            df (pd.DataFrame): Representative, mostly normal data.
 
         Returns:
-            pd.DataFrame: DataFrame with anomaly scores and anomaly flags.
+            dict: Training metadata (rows, epochs, best loss, duration).
+        """
+        numeric_df = self._numeric(df)
+        return self._train(numeric_df, schema_fingerprint(numeric_df))
+
+    def _train(self, numeric_df: pd.DataFrame, fingerprint: str) -> dict:
+        """
+        Train on ``numeric_df`` and keep (and save) the model under ``fingerprint``.
+        """
+        from datacleancraft.models.autoencoder_trainer import train_autoencoder
+
+        model, scaler, metadata = train_autoencoder(numeric_df.to_numpy(), **self.training_options)
+        if self.use_registry:
+            self.registry.save(fingerprint, model, scaler, metadata)
+        self._trained[fingerprint] = (model, scaler, metadata)
+        self.model, self.scaler, self.metadata, self.fingerprint = model, scaler, metadata, fingerprint
+        self.input_dim = numeric_df.shape[1]
+        return metadata
+
+    def observe(self, df: pd.DataFrame) -> None:
+        """
+        Add the numeric rows of one chunk to the training sample of their schema.
+
+        Streams are sampled with a reservoir of ``train_sample_size`` rows per schema, so
+        every chunk has the same chance to be trained on. Schemas that already have a
+        model are skipped. Call ``train_from_samples`` once the stream is exhausted.
+
+        Args:
+            df (pd.DataFrame): One chunk of the data to score later.
+        """
+        numeric_df = df.select_dtypes(include=[np.number]).dropna()
+        if numeric_df.empty:
+            return
+        fingerprint = schema_fingerprint(numeric_df)
+        reservoir = self._reservoirs.get(fingerprint)
+        if reservoir is None:
+            if fingerprint in self._trained or (self.use_registry and fingerprint in self.registry):
+                return
+            reservoir = RowReservoir(numeric_df.columns, self.train_sample_size)
+            self._reservoirs[fingerprint] = reservoir
+        reservoir.add(numeric_df.to_numpy(dtype=np.float32))
+
+    def train_from_samples(self) -> Dict[str, dict]:
+        """
+        Train a model for every schema sampled by ``observe`` with at least
+        ``min_train_rows`` rows, then clear the samples.
+
+        Returns:
+            Dict[str, dict]: Training metadata by schema fingerprint.
+        """
+        trained = {}
+        for fingerprint, reservoir in self._reservoirs.items():
+            sample = reservoir.sample()
+            if len(sample) < self.min_train_rows:
+                continue
+            print(f"Training autoencoder on {len(sample)} sampled of {reservoir.seen} rows")
+            trained[fingerprint] = self._train(sample, fingerprint)
+        self._reservoirs = {}
+        return trained
+
+    def effective_threshold(self) -> float:
         """
+        Threshold applied to the current model's scores.
+        """
+        if self.threshold is not None:
+            return self.threshold
+        if self.scaler is not None and "train_error_p99" in self.metadata:
+            return float(self.metadata["train_error_p99"])
+        return DEFAULT_THRESHOLD
+
+    def _numeric(self, df: pd.DataFrame) -> pd.DataFrame:
         # Ensure the dataframe has numeric columns
         numeric_df = df.select_dtypes(include=[np.number]).dropna()
 
         if numeric_df.empty:
             raise ValueError("No numeric data available for anomaly detection.")
+        return numeric_df
+
+    def _prepare_model(self, numeric_df: pd.DataFrame, fingerprint: str) -> None:
+        """
+        Load the model of ``fingerprint``, train one, or fall back to an untrained model.
+        """
+        entry = self._trained.get(fingerprint)
+        if entry is None and self.use_registry:
+            entry = self.registry.load(fingerprint)
+        if entry is not None:
+            self.model, self.scaler, self.metadata = entry
+            self.fingerprint = fingerprint
+            return
+        if self.train_if_missing and len(numeric_df) >= self.min_train_rows:
+            self.train(numeric_df)
+            return
+
+        from datacleancraft.models.autoencoder_loader import load_autoencoder
+
+        print(f"Loading autoencoder model for input dimension {self.input_dim}")
+        self.model = load_autoencoder(self.input_dim)
+        self.model.eval()  # Set the model to evaluation mode
+        self.scaler = None
+        self.metadata = {}
+        self.fingerprint = fingerprint
+
+    @handle_exception
+    def detect_anomalies(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Detect anomalies and return anomaly scores.
 
+        Args:
+            df (pd.DataFrame): Numeric DataFrame.
+
+        Returns:
+            pd.DataFrame: DataFrame with anomaly scores and anomaly flags.
+        """
+        numeric_df = self._numeric(df)
         self.input_dim = numeric_df.shape[1]
 
-        # Load the autoencoder model only if it's not loaded yet
-        if self.model is None:
-            print(f"Loading autoencoder model for input dimension {self.input_dim}")
-            self.model = load_autoencoder(self.input_dim)
-            self.model.eval()  # Set the model to evaluation mode
+        # torch is imported on first use so importing the pipeline stays fast
+        import torch
+
+        # Load the autoencoder model only if it's not loaded yet for this schema
+        fingerprint = schema_fingerprint(numeric_df)
+        if self.model is None or fingerprint != self.fingerprint:
+            self._prepare_model(numeric_df, fingerprint)
+
+        values = numeric_df.to_numpy(dtype=np.float32)
+        if self.scaler is not None:
+            values = self.scaler.transform(values)
 
         # Convert the dataframe to a tensor for inference
         with torch.no_grad():
-            inputs = torch.tensor(numeric_df.values, dtype=torch.float32)
+            inputs = torch.from_numpy(values)
             outputs = self.model(inputs)
             reconstruction_error = torch.mean((outputs - inputs) ** 2, dim=1)
             anomaly_score = reconstruction_error.numpy()
 
             # Detect anomalies based on the reconstruction error
-            anomalies = anomaly_score > self.threshold
+            anomalies = anomaly_score > self.effective_threshold()
 
         # Return the result with anomaly score and flags
         result = pd.DataFrame({
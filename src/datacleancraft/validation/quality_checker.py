@@ -2,8 +2,9 @@
 quality_checker.py: Basic data quality checks.
 """
 
+import numpy as np
 import pandas as pd
-from typing import List, Dict
+from typing import List, Dict, Optional
 
 class DataQualityChecker:
     def __init__(self, max_null_threshold: float = 0.4):
@@ -13,12 +14,14 @@ class DataQualityChecker:
         """
         self.max_null_threshold = max_null_threshold
 
-    def validate(self, df: pd.DataFrame) -> List[Dict[str, str]]:
+    def validate(self, df: pd.DataFrame, row_hashes: Optional[np.ndarray] = None) -> List[Dict[str, str]]:
         """
         Run basic quality checks on the DataFrame and return the issues found.
 
         Args:
             df (pd.DataFrame): Data to validate.
+            row_hashes (np.ndarray, optional): Precomputed row hashes (see
+                ``preprocessing.deduplicator.row_hashes``), reused for the duplicate check.
 
         Returns:
             List[Dict[str, str]]: List of issues found during validation.
@@ -26,7 +29,7 @@ class DataQualityChecker:
         issues = []
         
         issues.extend(self._check_missing_values(df))
-        issues.extend(self._check_duplicate_rows(df))
+        issues.extend(self._check_duplicate_rows(df, row_hashes))
         issues.extend(self._check_constant_columns(df))
         
         return issues
@@ -39,8 +42,11 @@ class DataQualityChecker:
             return [{"issue": "Too many missing values", "columns": str(problematic_columns)}]
         return []
 
-    def _check_duplicate_rows(self, df: pd.DataFrame) -> List[Dict[str, str]]:
-        duplicate_count = df.duplicated().sum()
+    def _check_duplicate_rows(self, df: pd.DataFrame, row_hashes: Optional[np.ndarray] = None) -> List[Dict[str, str]]:
+        if row_hashes is not None:
+            duplicate_count = pd.Series(row_hashes).duplicated().sum()
+        else:
+            duplicate_count = df.duplicated().sum()
 
         if duplicate_count > 0:
             return [{"issue": f"Duplicate rows detected", "count": str(duplicate_count)}]
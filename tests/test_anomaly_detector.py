@@ -1,7 +1,12 @@
 import pytest
 import pandas as pd
 import numpy as np
-from datacleancraft.validation.anomaly_detector import AnomalyDetector
+from datacleancraft.validation.anomaly_detector import DEFAULT_THRESHOLD, AnomalyDetector, RowReservoir
+
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path, monkeypatch):
+    """Keep every test away from the developer's autoencoder registry."""
+    monkeypatch.setenv("DATACLEANCRAFT_CACHE_DIR", str(tmp_path / "cache"))
 
 def test_detect_anomalies_output_structure(sample_data):
     """Test if detect_anomalies returns expected structure."""
@@ -59,3 +64,103 @@ def test_no_anomalies_detection():
     result = detector.detect_anomalies(normal_data)
 
     assert not result["is_anomaly"].any()
+
+def test_trained_model_is_saved_and_reused(tmp_path):
+    """Test that a model trained for a schema is loaded from the registry next time."""
+    rng = np.random.default_rng(0)
+    base = rng.normal(size=(300, 2))
+    df = pd.DataFrame(np.hstack([base, base * 2, base - 1, base * 3]), columns=[f"f{i}" for i in range(8)])
+
+    detector = AnomalyDetector(train_if_missing=True, registry_dir=str(tmp_path), training_options={"epochs": 20})
+    first = detector.detect_anomalies(df)
+    assert detector.scaler is not None
+    assert len(list(tmp_path.glob("*.pt"))) == 1
+
+    reused = AnomalyDetector(registry_dir=str(tmp_path))
+    second = reused.detect_anomalies(df)
+    assert np.allclose(first["anomaly_score"], second["anomaly_score"])
+
+    # Without a threshold, rows above the 99th percentile training error are flagged
+    p99 = reused.metadata["train_error_p99"]
+    assert reused.effective_threshold() == pytest.approx(p99)
+    assert second["is_anomaly"].equals(second["anomaly_score"] > p99)
+    assert 0 < second["is_anomaly"].sum() <= 0.05 * len(df)
+
+def test_registry_is_opt_in(tmp_path):
+    """Test that a saved model is ignored unless the registry is enabled."""
+    rng = np.random.default_rng(1)
+    df = pd.DataFrame(rng.normal(size=(200, 4)), columns=list("abcd"))
+    AnomalyDetector(train_if_missing=True, training_options={"epochs": 2}).detect_anomalies(df)
+
+    default = AnomalyDetector()
+    default.detect_anomalies(df)
+    assert not default.use_registry
+    assert default.scaler is None
+    assert default.effective_threshold() == DEFAULT_THRESHOLD
+
+    enabled = AnomalyDetector(use_registry=True)
+    enabled.detect_anomalies(df)
+    assert enabled.scaler is not None
+
+def test_untrained_fallback_below_min_rows(tmp_path):
+    """Test that small inputs are scored by the untrained model without saving anything."""
+    df = pd.DataFrame({"feature1": [0.1, 0.2, 0.3], "feature2": [0.1, 0.2, 0.3]})
+
+    detector = AnomalyDetector(threshold=10.0, train_if_missing=True, registry_dir=str(tmp_path))
+    result = detector.detect_anomalies(df)
+
+    assert detector.scaler is None
+    assert not result["is_anomaly"].any()
+    assert list(tmp_path.glob("*.pt")) == []
+
+def test_row_reservoir_samples_every_chunk_uniformly():
+    """Test that each streamed row is kept with the same probability."""
+    counts = np.zeros(100)
+    for seed in range(500):
+        reservoir = RowReservoir(pd.Index(["a"]), size=10, seed=seed)
+        for start in range(0, 100, 7):
+            reservoir.add(np.arange(start, min(start + 7, 100), dtype=np.float32)[:, None])
+        sample = reservoir.sample()
+        assert len(sample) == 10 and sample["a"].is_unique
+        counts[sample["a"].astype(int)] += 1
+
+    assert reservoir.seen == 100
+    # Each row is expected 50 times; the first and last chunks are not favoured
+    assert counts[:7].mean() == pytest.approx(50, rel=0.25)
+    assert counts[-7:].mean() == pytest.approx(50, rel=0.25)
+
+def test_training_from_samples_covers_all_chunks(tmp_path):
+    """Test that chunked training sees rows from every chunk, not only the first."""
+    rng = np.random.default_rng(0)
+    chunks = [pd.DataFrame(rng.normal(loc=10 * i, size=(100, 4)), columns=list("abcd")) for i in range(5)]
+
+    detector = AnomalyDetector(
+        train_if_missing=True, registry_dir=str(tmp_path), train_sample_size=200, training_options={"epochs": 2}
+    )
+    for chunk in chunks:
+        detector.observe(chunk)
+    metadata = detector.train_from_samples()
+
+    assert len(metadata) == 1
+    assert next(iter(metadata.values()))["rows"] == 200
+    # The mean of the first chunk is 0, of all chunks 20
+    assert detector.scaler.mean == pytest.approx(np.full(4, 20), abs=3)
+    assert len(list(tmp_path.glob("*.pt"))) == 1
+
+    # Scoring uses the sampled model and does not train again
+    model = detector.model
+    detector.detect_anomalies(chunks[0])
+    assert detector.model is model
+
+    # Schemas with a saved model are not sampled again
+    detector.observe(chunks[0])
+    assert detector.train_from_samples() == {}
+
+def test_untrained_scores_are_unchanged():
+    """Test that the untrained fallback keeps the original architecture."""
+    from datacleancraft.models.autoencoder_loader import ORIGINAL_ARCHITECTURE
+
+    df = pd.DataFrame({"feature1": [0.1, 0.2, 0.3], "feature2": [0.1, 0.2, 0.3]})
+    detector = AnomalyDetector(threshold=10.0)
+    detector.detect_anomalies(df)
+    assert detector.model.architecture == ORIGINAL_ARCHITECTURE
@@ -1,6 +1,6 @@
 import pytest
 import torch
-from datacleancraft.models.autoencoder_loader import load_autoencoder
+from datacleancraft.models.autoencoder_loader import LINEAR_CODE_ARCHITECTURE, load_autoencoder
 
 def test_autoencoder_loading():
     """
@@ -28,3 +28,22 @@ def test_autoencoder_invalid_input():
     """
     with pytest.raises(TypeError):
         load_autoencoder("invalid_input")  # Should raise error since input_dim must be int
+
+def test_default_architecture_is_unchanged():
+    """
+    Test that untrained models keep the original layers and scores, and that the linear
+    code version differs only by the final ReLU.
+    """
+    torch.manual_seed(0)
+    original = load_autoencoder(8)
+    torch.manual_seed(0)
+    linear = load_autoencoder(8, architecture=LINEAR_CODE_ARCHITECTURE)
+
+    assert isinstance(original.encoder[-1], torch.nn.ReLU)
+    assert isinstance(linear.encoder[-1], torch.nn.Linear)
+    assert original.state_dict().keys() == linear.state_dict().keys()
+    assert (original.encoder(torch.randn(16, 8)) >= 0).all()
+
+def test_unknown_architecture():
+    with pytest.raises(ValueError, match="architecture"):
+        load_autoencoder(8, architecture=3)
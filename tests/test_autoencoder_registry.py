@@ -0,0 +1,69 @@
+import time
+
+import numpy as np
+import torch
+from datacleancraft.models.autoencoder_loader import LINEAR_CODE_ARCHITECTURE, ORIGINAL_ARCHITECTURE
+from datacleancraft.models.autoencoder_registry import AutoencoderRegistry
+from datacleancraft.models.autoencoder_trainer import train_autoencoder
+
+
+def trained(rows=200):
+    values = np.random.default_rng(0).normal(size=(rows, 8))
+    return train_autoencoder(values, epochs=3)
+
+
+def test_save_and_load_roundtrip(tmp_path):
+    model, scaler, metadata = trained()
+    registry = AutoencoderRegistry(tmp_path)
+    registry.save("abc", model, scaler, metadata)
+
+    assert "abc" in registry
+    assert registry.fingerprints() == ["abc"]
+
+    loaded_model, loaded_scaler, loaded_metadata = AutoencoderRegistry(tmp_path).load("abc")
+    assert not loaded_model.training
+    for a, b in zip(model.state_dict().values(), loaded_model.state_dict().values()):
+        assert torch.equal(a, b)
+    assert np.array_equal(loaded_scaler.mean, scaler.mean)
+    assert np.array_equal(loaded_scaler.scale, scaler.scale)
+    assert loaded_metadata["rows"] == 200
+
+
+def test_load_is_cached_until_the_file_changes(tmp_path):
+    model, scaler, metadata = trained()
+    registry = AutoencoderRegistry(tmp_path)
+    registry.save("abc", model, scaler, metadata)
+
+    first = registry.load("abc")
+    start = time.perf_counter()
+    assert registry.load("abc") is first
+    assert time.perf_counter() - start < 0.05
+
+    registry.save("abc", *trained(300))
+    assert registry.load("abc")[2]["rows"] == 300
+
+
+def test_missing_and_delete(tmp_path):
+    registry = AutoencoderRegistry(tmp_path)
+    assert registry.load("missing") is None
+    assert not registry.delete("missing")
+
+    registry.save("abc", *trained())
+    assert registry.delete("abc")
+    assert registry.load("abc") is None
+
+
+def test_architecture_is_stored(tmp_path):
+    registry = AutoencoderRegistry(tmp_path)
+    values = np.random.default_rng(0).normal(size=(200, 8))
+    registry.save("original", *train_autoencoder(values, epochs=1, architecture=ORIGINAL_ARCHITECTURE))
+    registry.save("linear", *trained())
+
+    assert AutoencoderRegistry(tmp_path).load("original")[0].architecture == ORIGINAL_ARCHITECTURE
+    assert AutoencoderRegistry(tmp_path).load("linear")[0].architecture == LINEAR_CODE_ARCHITECTURE
+
+    # Entries saved before the version was recorded were trained with a linear code layer
+    payload = torch.load(registry.path("linear"), weights_only=True)
+    del payload["architecture"]
+    torch.save(payload, registry.path("legacy"))
+    assert AutoencoderRegistry(tmp_path).load("legacy")[0].architecture == LINEAR_CODE_ARCHITECTURE
@@ -0,0 +1,66 @@
+import numpy as np
+import pytest
+import torch
+from datacleancraft.models.autoencoder_loader import LINEAR_CODE_ARCHITECTURE, SimpleAutoencoder
+from datacleancraft.models.autoencoder_trainer import FeatureScaler, reconstruction_errors, train_autoencoder
+
+
+def correlated_rows(rows=600, seed=0):
+    rng = np.random.default_rng(seed)
+    base = rng.normal(size=(rows, 2))
+    # 8 features driven by 2 latent factors, so the bottleneck can reconstruct them
+    return np.hstack([base, base * 2 + 1, base - 3, base * 0.5]) + rng.normal(scale=0.01, size=(rows, 8))
+
+
+def test_feature_scaler():
+    values = np.array([[1.0, 5.0], [3.0, 5.0]])
+    scaler = FeatureScaler.fit(values)
+    scaled = scaler.transform(values)
+
+    assert np.allclose(scaled[:, 0], [-1, 1])
+    assert np.allclose(scaled[:, 1], 0)  # constant column keeps a unit scale
+
+
+def test_training_reduces_loss_and_stops_early():
+    values = correlated_rows()
+    model, scaler, metadata = train_autoencoder(values, epochs=200, patience=3, min_delta=0.005, batch_size=64)
+
+    inputs = torch.from_numpy(scaler.transform(values))
+    torch.manual_seed(0)
+    untrained_loss = reconstruction_errors(SimpleAutoencoder(values.shape[1]), inputs).mean()
+    assert not model.training
+    assert metadata["rows"] == len(values)
+    assert metadata["epochs"] < 200
+    assert metadata["best_loss"] < untrained_loss * 0.75
+    assert reconstruction_errors(model, inputs).mean() == pytest.approx(metadata["best_loss"], rel=0.5)
+
+
+def test_trained_model_flags_outliers():
+    values = correlated_rows()
+    model, scaler, metadata = train_autoencoder(values, epochs=100, batch_size=64)
+
+    outliers = values[:5].copy()
+    outliers[:, 2] += 20  # break the relation between features
+    normal_errors = reconstruction_errors(model, torch.from_numpy(scaler.transform(values[5:10])))
+    outlier_errors = reconstruction_errors(model, torch.from_numpy(scaler.transform(outliers)))
+    assert outlier_errors.min() > metadata["train_error_p99"] > normal_errors.max() * 0.5
+
+
+def test_training_is_reproducible_with_seed():
+    values = correlated_rows(200)
+    first = train_autoencoder(values, epochs=5, seed=3)[0]
+    second = train_autoencoder(values, epochs=5, seed=3)[0]
+    for a, b in zip(first.state_dict().values(), second.state_dict().values()):
+        assert torch.equal(a, b)
+
+
+def test_training_needs_rows():
+    with pytest.raises(ValueError):
+        train_autoencoder(np.ones((1, 4)))
+
+
+def test_trained_models_use_the_linear_code_layer():
+    model, _, metadata = train_autoencoder(correlated_rows(rows=100), epochs=1)
+
+    assert model.architecture == LINEAR_CODE_ARCHITECTURE
+    assert metadata["architecture"] == LINEAR_CODE_ARCHITECTURE
@@ -0,0 +1,26 @@
+from datacleancraft.utils.cache import LRUCache, get_cache_dir
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = LRUCache(maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+
+    assert "b" not in cache
+    assert cache.get("b", "missing") == "missing"
+    assert cache.cache_info() == (1, 1, 2, 2)
+
+
+def test_lru_cache_disabled():
+    cache = LRUCache(maxsize=0)
+    cache.put("a", 1)
+    assert len(cache) == 0
+
+
+def test_get_cache_dir_honours_environment(tmp_path, monkeypatch):
+    monkeypatch.setenv("DATACLEANCRAFT_CACHE_DIR", str(tmp_path))
+    path = get_cache_dir("plans")
+    assert path == tmp_path / "plans"
+    assert path.is_dir()
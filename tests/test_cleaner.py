@@ -83,3 +83,39 @@ def test_spacy_model_loading():
     output_text = textcleaner.clean_text(input_text)
     assert "tasks" in output_text and "spacy" in output_text  # Ensure spaCy's lemmatization worked
 
+
+# Test that the batched nlp.pipe path gives the same output as clean_text
+def test_clean_text_dataframe_batched_matches_clean_text():
+    textcleaner = TextCleaner()
+    df = pd.DataFrame({
+        "col1": ["This is a test sentence", "Hello, I am learning 2.0 NLP!!!", None, 12345],
+        "col2": pd.Series(["Yes!", "No", "yes", "No"], dtype="category"),
+    })
+
+    batched = textcleaner.clean_text_dataframe(df, batch_size=2)
+    per_cell = textcleaner.clean_text_dataframe(df, batch_size=None)
+
+    pd.testing.assert_frame_equal(batched, per_cell)
+    assert batched["col1"].tolist()[:2] == [textcleaner.clean_text(text) for text in df["col1"][:2]]
+
+# Test that repeated values are served from the cache
+def test_clean_text_cache():
+    textcleaner = TextCleaner(cache_size=10)
+    df = pd.DataFrame({"col1": ["Hello, World!", "Hello, World!", "Bye"], "id": [1, 2, 3]})
+
+    textcleaner.clean_text_dataframe(df)
+    assert textcleaner.cache_info().misses == 2
+
+    assert textcleaner.clean_text("Hello, World!") == "hello world"
+    assert textcleaner.cache_info().hits == 1
+
+# Test that the tokenizer-only lite mode cleans text exactly like the full pipeline
+def test_lite_mode_matches_full_pipeline():
+    full = TextCleaner(cache_size=0)
+    lite = TextCleaner(cache_size=0, lite=True)
+
+    for text in ["I am learning NLP", "Hello, I am learning 2.0 NLP!!!", "This    is   a   test   sentence"]:
+        assert lite.clean_text(text) == full.clean_text(text)
+
+    with pytest.raises(ValueError):
+        lite.tokenize_and_lemmatize(["Running tests"])
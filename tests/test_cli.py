@@ -20,3 +20,10 @@ def test_cli_run(tmp_path):
 
     assert result.returncode == 0
     assert  os.path.isfile(output_file)
+
+def test_parse_filter():
+    from datacleancraft.cli import parse_filter
+    assert parse_filter("age>=18") == ("age", ">=", 18)
+    assert parse_filter("score < 1.5") == ("score", "<", 1.5)
+    assert parse_filter("country=DE") == ("country", "==", "DE")
+    assert parse_filter("zip=='01234'") == ("zip", "==", "01234")
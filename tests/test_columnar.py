@@ -0,0 +1,54 @@
+import pytest
+import pandas as pd
+from datacleancraft.ingestion.columnar import read_columnar
+from datacleancraft.ingestion.reader import load_data, read_file
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+feather = pytest.importorskip("pyarrow.feather")
+
+@pytest.fixture
+def wide_dataframe():
+    return pd.DataFrame({
+        "id": range(10),
+        "country": ["DE", "FR"] * 5,
+        "amount": [float(i) * 1.5 for i in range(10)],
+        "note": [f"note {i}" for i in range(10)],
+    })
+
+@pytest.fixture
+def parquet_path(tmp_path, wide_dataframe):
+    path = tmp_path / "data.parquet"
+    pq.write_table(pa.Table.from_pandas(wide_dataframe, preserve_index=False), path, row_group_size=3)
+    return path
+
+def test_read_parquet_projection(parquet_path, wide_dataframe):
+    df = read_columnar(parquet_path, columns=["note", "id"])
+    assert list(df.columns) == ["note", "id"]
+    pd.testing.assert_frame_equal(df, wide_dataframe[["note", "id"]])
+
+def test_read_parquet_filters(parquet_path):
+    df = read_columnar(parquet_path, columns=["id"], filters=[("id", ">=", 7), ("country", "==", "FR")])
+    assert df["id"].tolist() == [7, 9]
+
+def test_read_parquet_chunked(parquet_path):
+    chunks = list(read_columnar(parquet_path, chunk_size=2))
+    assert all(len(chunk) <= 2 for chunk in chunks)
+    assert sum(len(chunk) for chunk in chunks) == 10
+
+@pytest.mark.parametrize("suffix", [".feather", ".arrow"])
+def test_read_feather_and_arrow(tmp_path, wide_dataframe, suffix):
+    path = tmp_path / f"data{suffix}"
+    feather.write_feather(wide_dataframe, path)
+    df = read_file(path, columns=["id", "amount"], filters=[("amount", "<", 3)])
+    assert df["id"].tolist() == [0, 1]
+    assert list(df.columns) == ["id", "amount"]
+
+def test_load_data_infers_parquet(parquet_path, wide_dataframe):
+    pd.testing.assert_frame_equal(load_data(parquet_path), wide_dataframe)
+
+def test_filters_rejected_for_csv(tmp_path):
+    p = tmp_path / "test.csv"
+    p.write_text("a\n1\n")
+    with pytest.raises(ValueError, match="Row filters"):
+        load_data(p, filters=[("a", "==", 1)])
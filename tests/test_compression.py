@@ -0,0 +1,59 @@
+import bz2
+import gzip
+import lzma
+import pytest
+import pandas as pd
+from datacleancraft.ingestion.compression import detect_compression, open_stream, strip_compression_suffix
+from datacleancraft.ingestion.reader import load_data, read_file
+
+CSV_TEXT = "id,name\n" + "".join(f"{i},name {i}\n" for i in range(1000))
+
+@pytest.mark.parametrize("suffix, opener", [(".gz", gzip.open), (".bz2", bz2.open), (".xz", lzma.open)])
+def test_read_compressed_csv(tmp_path, suffix, opener):
+    path = tmp_path / f"data.csv{suffix}"
+    with opener(path, "wt") as f:
+        f.write(CSV_TEXT)
+
+    df = read_file(path)
+    assert df.shape == (1000, 2)
+    assert sum(len(chunk) for chunk in load_data(path, chunk_size=300)) == 1000
+
+def test_read_zstd_jsonl(tmp_path):
+    zstandard = pytest.importorskip("zstandard")
+    path = tmp_path / "data.jsonl.zst"
+    path.write_bytes(zstandard.ZstdCompressor().compress(b'{"a": 1}\n{"a": 2}\n'))
+
+    assert detect_compression(path) == "zstd"
+    assert load_data(path)["a"].tolist() == [1, 2]
+
+def test_read_bz2_xml(tmp_path):
+    path = tmp_path / "data.xml.bz2"
+    with bz2.open(path, "wt") as f:
+        f.write("<rows><row><a>1</a></row><row><a>2</a></row></rows>")
+    assert read_file(path)["a"].tolist() == ["1", "2"]
+
+def test_detect_by_magic_bytes(tmp_path):
+    path = tmp_path / "data.csv"
+    with gzip.open(path, "wt") as f:
+        f.write(CSV_TEXT)
+
+    assert detect_compression(path) == "gzip"
+    pd.testing.assert_frame_equal(load_data(path), pd.read_csv(path, compression="gzip"))
+
+def test_uncompressed_file(tmp_path):
+    path = tmp_path / "data.txt"
+    path.write_text("hello\n")
+    assert detect_compression(path) is None
+    with open_stream(path, text=True) as f:
+        assert f.read() == "hello\n"
+
+def test_threaded_stream_matches_plain(tmp_path):
+    payload = bytes(range(256)) * 20000
+    path = tmp_path / "blob.gz"
+    path.write_bytes(gzip.compress(payload))
+    with open_stream(path, threaded=True) as f:
+        assert f.read() == payload
+
+def test_strip_compression_suffix():
+    assert strip_compression_suffix("data.csv.gz").name == "data.csv"
+    assert strip_compression_suffix("data.csv").name == "data.csv"
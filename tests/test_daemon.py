@@ -0,0 +1,147 @@
+import threading
+
+import pytest
+from click.testing import CliRunner
+from datacleancraft.cli import run_pipeline
+from datacleancraft.daemon import DaemonUnavailable, PipelineDaemon, is_running, send_request, submit_job
+from datacleancraft.utils.error_handler import PipelineError
+
+
+@pytest.fixture
+def daemon(tmp_path):
+    daemon = PipelineDaemon(socket_path=str(tmp_path / "d.sock"), workers=1, preload=False)
+    daemon.start()
+    thread = threading.Thread(target=daemon.serve_forever, daemon=True)
+    thread.start()
+    yield daemon
+    daemon.shutdown()
+    thread.join(timeout=30)
+
+
+def test_submit_without_daemon(tmp_path):
+    socket_path = str(tmp_path / "missing.sock")
+    assert not is_running(socket_path)
+    with pytest.raises(DaemonUnavailable):
+        submit_job({"input_path": "in.csv", "output_path": "out.csv"}, socket_path=socket_path)
+
+
+def test_ping_and_failed_job(daemon, tmp_path):
+    assert is_running(daemon.socket_path)
+
+    with pytest.raises(PipelineError, match="FileNotFoundError"):
+        submit_job({"input_path": str(tmp_path / "none-*.csv"), "output_path": str(tmp_path / "out.csv")},
+                   socket_path=daemon.socket_path)
+
+    response = send_request({"action": "ping"}, daemon.socket_path)
+    assert response["jobs_failed"] == 1
+    assert send_request({"action": "unknown"}, daemon.socket_path)["status"] == "error"
+
+
+def test_second_daemon_on_same_socket_is_refused(daemon):
+    with pytest.raises(PipelineError, match="already running"):
+        PipelineDaemon(socket_path=daemon.socket_path, workers=1, preload=False).start()
+
+
+def test_shutdown_removes_socket(tmp_path):
+    daemon = PipelineDaemon(socket_path=str(tmp_path / "d.sock"), workers=1, preload=False)
+    daemon.start()
+    thread = threading.Thread(target=daemon.serve_forever, daemon=True)
+    thread.start()
+
+    assert send_request({"action": "shutdown"}, daemon.socket_path)["status"] == "ok"
+    thread.join(timeout=30)
+    assert not thread.is_alive()
+    assert not (tmp_path / "d.sock").exists()
+
+
+def test_cli_falls_back_to_in_process(tmp_path):
+    result = CliRunner().invoke(run_pipeline, [
+        "--input-path", str(tmp_path / "none-*.csv"),
+        "--output-path", str(tmp_path / "out.csv"),
+        "--daemon", "--daemon-socket", str(tmp_path / "missing.sock"),
+    ])
+    # The in-process run is attempted and fails on the missing input
+    assert isinstance(result.exception, FileNotFoundError)
+
+
+def test_successful_job_matches_in_process_run(daemon, tmp_path):
+    from datacleancraft.pipeline import DataCleaningPipeline
+
+    input_file = tmp_path / "small.csv"
+    input_file.write_text("name,comment,amount\nAlice,Great service!,10\nBob,The delivery was slow.,20\nAlice,Great service!,10\n")
+    params = dict(redact_pii_enabled=False, anomaly_detection_enabled=False)
+
+    response = submit_job(dict(params, input_path=str(input_file), output_path=str(tmp_path / "daemon.csv")),
+                          socket_path=daemon.socket_path)
+    DataCleaningPipeline(input_path=str(input_file), output_path=str(tmp_path / "local.csv"), **params).run()
+
+    assert response["status"] == "ok"
+    assert (tmp_path / "daemon.csv").read_text() == (tmp_path / "local.csv").read_text()
+
+
+def test_job_is_retried_when_worker_dies(daemon, tmp_path):
+    import os
+    import signal
+
+    for pid in list(daemon._pool._processes):
+        os.kill(pid, signal.SIGKILL)
+
+    # The job reaches a fresh worker and fails on its own missing input, not on the dead pool
+    response = daemon.run_job({"input_path": str(tmp_path / "none-*.csv"), "output_path": str(tmp_path / "out.csv")})
+    assert response["status"] == "error"
+    assert "FileNotFoundError" in response["error"]
+
+
+def test_job_after_close_is_refused(tmp_path):
+    daemon = PipelineDaemon(socket_path=str(tmp_path / "d.sock"), workers=1, preload=False)
+    daemon.start()
+    daemon.close()
+
+    response = daemon.run_job({"input_path": "in.csv", "output_path": "out.csv"})
+    assert response == {"status": "error", "error": "Daemon is shutting down."}
+
+
+def test_unusable_socket_counts_as_no_daemon(tmp_path, monkeypatch):
+    import socket
+
+    def connect(self, address):
+        raise PermissionError(13, "Permission denied")
+
+    # e.g. a stale socket left by another user
+    monkeypatch.setattr(socket.socket, "connect", connect)
+    with pytest.raises(DaemonUnavailable, match="Permission denied"):
+        send_request({"action": "ping"}, str(tmp_path / "d.sock"))
+
+
+def test_pool_restart_does_not_hold_the_lock(tmp_path, monkeypatch):
+    class FakePool:
+        def shutdown(self, wait=True, cancel_futures=False):
+            pass
+
+    daemon = PipelineDaemon(socket_path=str(tmp_path / "d.sock"), workers=1, preload=False)
+    broken, replacement = FakePool(), FakePool()
+    daemon._pool = broken
+    warming_up, release = threading.Event(), threading.Event()
+    starts = []
+
+    def new_pool():
+        starts.append(1)
+        warming_up.set()
+        release.wait(timeout=30)
+        return replacement
+
+    monkeypatch.setattr(daemon, "_new_pool", new_pool)
+    threads = [threading.Thread(target=daemon._replace_pool, args=(broken,)) for _ in range(2)]
+    threads[0].start()
+    assert warming_up.wait(timeout=30)
+    threads[1].start()
+
+    # Other requests can take the lock while the new workers warm up
+    assert daemon._lock.acquire(timeout=5)
+    daemon._lock.release()
+
+    release.set()
+    for thread in threads:
+        thread.join(timeout=30)
+    assert daemon._pool is replacement
+    assert len(starts) == 1
@@ -0,0 +1,100 @@
+import numpy as np
+import pandas as pd
+import pytest
+from datacleancraft.preprocessing.deduplicator import HashDeduplicator, duplicated_hashes, row_hashes
+from datacleancraft.validation.quality_checker import DataQualityChecker
+
+
+def make_rows(n=3000, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "a": rng.integers(0, 40, n),
+        "b": rng.choice(["x", "y", None], n),
+        "c": rng.integers(0, 20, n).astype(float),
+    })
+
+
+@pytest.mark.parametrize("bits", [64, 128])
+def test_row_hashes_flag_same_rows_as_duplicated(bits):
+    df = make_rows()
+    hashes = row_hashes(df, bits=bits)
+    assert len(hashes) == len(df)
+    assert (duplicated_hashes(hashes) == df.duplicated().to_numpy()).all()
+
+
+def test_row_hashes_ignore_index_and_respect_subset():
+    df = pd.DataFrame({"a": [1, 1], "b": ["x", "y"]}, index=[10, 20])
+    assert row_hashes(df)[0] != row_hashes(df)[1]
+    assert row_hashes(df, subset=["a"])[0] == row_hashes(df, subset=["a"])[1]
+    with pytest.raises(ValueError):
+        row_hashes(df, bits=32)
+
+
+@pytest.mark.parametrize("bits", [64, 128])
+def test_chunked_deduplication_with_spilling_matches_drop_duplicates(bits, tmp_path):
+    df = make_rows()
+    expected = df.drop_duplicates().reset_index(drop=True)
+
+    with HashDeduplicator(bits=bits, max_memory_hashes=50, spill_dir=tmp_path, partitions=4) as deduplicator:
+        chunks = [deduplicator.drop_duplicates(df.iloc[start:start + 997]) for start in range(0, len(df), 997)]
+        assert deduplicator.spilled_hashes > 0
+        assert deduplicator.duplicates_dropped == len(df) - len(expected)
+
+    pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), expected)
+    assert not list(tmp_path.glob("hashes-*.npy"))
+
+
+def test_quality_checker_reuses_row_hashes():
+    df = pd.DataFrame({"a": [1, 1, 2], "b": ["x", "x", "y"]})
+    checker = DataQualityChecker()
+    assert checker.validate(df, row_hashes=row_hashes(df)) == checker.validate(df)
+
+
+@pytest.mark.parametrize("bits", [64, 128])
+def test_row_hashes_do_not_depend_on_column_dtypes(bits):
+    first = pd.DataFrame({
+        "a": [1, 2, None, -3],
+        "b": pd.Categorical(["x", "y", None, "z"]),
+        "c": [0.5, 1.0, None, 0.0],
+        "d": ["x", None, "y", "z"],
+    })
+    second = pd.DataFrame({
+        "a": pd.array([1, 2, None, -3], dtype="Int8"),
+        "b": ["x", "y", np.nan, "z"],
+        "c": np.array([0.5, 1, np.nan, 0], dtype="float32"),
+        "d": pd.array(["x", None, "y", "z"], dtype="string"),
+    })
+    assert (row_hashes(first, bits=bits) == row_hashes(second, bits=bits)).all()
+
+
+def test_chunks_with_different_dtypes_share_duplicates(tmp_path):
+    path = tmp_path / "rows.csv"
+    path.write_text("a,b\n1,x\n,y\n1,x\n2,z\n")
+    # The first chunk reads a as float64 (it holds a missing value), the second as int64
+    with HashDeduplicator() as deduplicator:
+        chunks = [deduplicator.drop_duplicates(chunk) for chunk in pd.read_csv(path, chunksize=2)]
+
+    assert sum(len(chunk) for chunk in chunks) == 3
+    assert deduplicator.duplicates_dropped == 1
+
+
+@pytest.mark.parametrize("bits", [64, 128])
+def test_spills_are_written_as_runs_and_merged(bits, tmp_path, monkeypatch):
+    monkeypatch.setattr("datacleancraft.preprocessing.deduplicator._MERGE_BLOCK", 7)
+    df = make_rows(n=6000, seed=1)
+    expected = df.drop_duplicates().reset_index(drop=True)
+
+    with HashDeduplicator(bits=bits, max_memory_hashes=20, spill_dir=tmp_path, partitions=2, merge_factor=3) as deduplicator:
+        chunks = [deduplicator.drop_duplicates(df.iloc[start:start + 50]) for start in range(0, len(df), 50)]
+        runs = sorted(tmp_path.glob("hashes-*.npy"))
+        # Never more than merge_factor - 1 runs per level and partition
+        levels = {level for partition_runs in deduplicator._runs for level, _ in partition_runs}
+        assert len(runs) <= 2 * 2 * len(levels)
+        assert max(levels) >= 2
+        for partition_runs in deduplicator._runs:
+            for _, path in partition_runs:
+                stored = np.load(path)
+                assert (stored[1:] > stored[:-1]).all()
+
+    pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), expected)
+    assert not list(tmp_path.glob("hashes-*.npy"))
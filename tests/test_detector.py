@@ -0,0 +1,56 @@
+import numpy as np
+import pandas as pd
+from datacleancraft.ingestion.detector import DataTypeDetector
+
+
+def test_detect_types():
+    df = pd.DataFrame({
+        "amount": [10, 20, 30, 40] * 10,
+        "numeric_text": ["1", "2.5", "3", "4"] * 10,
+        "joined": ["2020-01-02", "2021/03/04", "Jan 5 2020", "2020-01-02T10:00"] * 10,
+        "status": ["active", "inactive"] * 20,
+        "comment": [f"comment {i}" for i in range(40)],
+        "flag": [True, False] * 20,
+        "missing": [None] * 40,
+    })
+    result = DataTypeDetector(categorical_ratio=0.1).detect(df).set_index("column")
+
+    assert result["detected_type"].to_dict() == {
+        "amount": "Numeric",
+        "numeric_text": "Numeric",
+        "joined": "Datetime",
+        "status": "Categorical",
+        "comment": "Text",
+        "flag": "Boolean",
+        "missing": "Unknown",
+    }
+    assert result.loc["missing", "confidence"] == 0.0
+    assert result.loc["amount", "confidence"] == 1.0
+
+
+def test_confidence_reflects_partial_matches():
+    df = pd.DataFrame({"mostly_numbers": ["1", "2", "3", "oops"] * 5})
+    result = DataTypeDetector().detect(df)
+    assert result.loc[0, "detected_type"] == "Text"
+    assert result.loc[0, "confidence"] == 0.25
+
+
+def test_detection_is_deterministic_on_large_frames():
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({"value": rng.choice(["2020-01-01", "n/a", "2021-06-30"], 50000)})
+    first = DataTypeDetector(sample_size=100).detect(df)
+    second = DataTypeDetector(sample_size=100).detect(df)
+    pd.testing.assert_frame_equal(first, second)
+
+
+def test_results_are_cached_by_schema():
+    detector = DataTypeDetector(cache_size=1)
+    df = pd.DataFrame({"a": ["x", "y"], "b": [1, 2]})
+    detector.detect(df)
+
+    # Same layout, different values: the cached result is reused
+    other = pd.DataFrame({"a": ["1", "2"], "b": [3, 4]})
+    assert detector.detect(other).loc[0, "detected_type"] == "Text"
+
+    detector.clear_cache()
+    assert detector.detect(other).loc[0, "detected_type"] == "Numeric"
@@ -0,0 +1,86 @@
+import json
+import pandas as pd
+import pytest
+from datacleancraft.ingestion.dtype_optimizer import DtypeOptimizer
+from datacleancraft.ingestion.reader import load_data
+from datacleancraft.utils.fingerprint import schema_fingerprint
+
+
+@pytest.fixture
+def people_dataframe():
+    return pd.DataFrame({
+        "age": [25, 31, 47, 52] * 25,
+        "balance": [10.5, 20.25, 30.0, 40.75] * 25,
+        "country": ["DE", "FR", "DE", "US"] * 25,
+        "note": [f"note {i}" for i in range(100)],
+    })
+
+
+def test_infer_plan(people_dataframe, tmp_path):
+    optimizer = DtypeOptimizer(plan_dir=tmp_path)
+    plan = optimizer.infer_plan(people_dataframe)
+    assert plan["age"] == "uint8"
+    assert plan["balance"] == "float32"
+    assert plan["country"] == "category"
+    assert plan.get("note") == ("string[pyarrow]" if optimizer.use_arrow_strings else None)
+
+
+def test_optimize_keeps_values_and_reports_savings(people_dataframe, tmp_path):
+    optimizer = DtypeOptimizer(plan_dir=tmp_path)
+    optimized = optimizer.optimize(people_dataframe)
+
+    pd.testing.assert_frame_equal(optimized.astype(object), people_dataframe.astype(object))
+    report = optimizer.last_report.set_index("column")
+    assert report.loc["country", "dtype_after"] == "category"
+    assert report.loc["country", "bytes_saved"] > 0
+    assert optimizer.bytes_saved["age"] == report.loc["age", "bytes_saved"]
+
+
+def test_plan_is_persisted_by_fingerprint(people_dataframe, tmp_path):
+    DtypeOptimizer(plan_dir=tmp_path).optimize(people_dataframe)
+    plan_file = tmp_path / f"{schema_fingerprint(people_dataframe)}.json"
+    assert plan_file.exists()
+
+    # A fresh optimizer reuses the saved plan instead of inferring one
+    plan_file.write_text(json.dumps({"age": "int16"}))
+    optimized = DtypeOptimizer(plan_dir=tmp_path).optimize(people_dataframe)
+    assert str(optimized["age"].dtype) == "int16"
+    assert optimized["country"].dtype == object
+
+
+def test_apply_plan_skips_columns_that_no_longer_fit(tmp_path):
+    optimizer = DtypeOptimizer(plan_dir=tmp_path)
+    df = pd.DataFrame({"value": [1, 100000], "ratio": [0.1, 0.2]})
+    optimized = optimizer.apply_plan(df, {"value": "int8", "ratio": "float32"})
+    assert optimized["value"].dtype == "int64"
+    assert optimized["ratio"].dtype == "float64"
+
+
+def test_apply_plan_downcasts_nullable_integers_with_missing_values(tmp_path):
+    optimizer = DtypeOptimizer(plan_dir=tmp_path)
+    plan = optimizer.infer_plan(pd.DataFrame({"id": pd.array([1, 2, 3], dtype="Int64"), "delta": [-1, 0, 1]}))
+    assert plan == {"id": "uint8", "delta": "int8"}
+
+    # A later chunk with the same schema holds missing values
+    chunk = pd.DataFrame({"id": pd.array([4, None, 6], dtype="Int64"), "delta": pd.array([None, 5, -5], dtype="Int64")})
+    optimized = optimizer.apply_plan(chunk, plan)
+    assert str(optimized["id"].dtype) == "UInt8"
+    assert str(optimized["delta"].dtype) == "Int8"
+    assert optimized["id"].isna().tolist() == [False, True, False]
+    assert optimized["delta"].tolist()[1:] == [5, -5]
+
+    all_missing = pd.DataFrame({"id": pd.array([None, None], dtype="Int64")})
+    assert optimizer.apply_plan(all_missing, plan)["id"].dtype == "Int64"
+
+
+def test_load_data_with_optimizer(tmp_path):
+    csv_path = tmp_path / "data.csv"
+    pd.DataFrame({"id": range(10), "status": ["ok", "fail"] * 5}).to_csv(csv_path, index=False)
+    optimizer = DtypeOptimizer(plan_dir=tmp_path / "plans")
+
+    df = load_data(csv_path, dtype_optimizer=optimizer)
+    assert df["id"].dtype == "uint8"
+    assert df["status"].dtype == "category"
+
+    chunks = list(load_data(csv_path, chunk_size=4, dtype_optimizer=optimizer))
+    assert all(chunk["status"].dtype == "category" for chunk in chunks)
@@ -0,0 +1,57 @@
+import pandas as pd
+import pytest
+import spacy
+from datacleancraft.preprocessing.cleaner import TextCleaner
+from datacleancraft.preprocessing.fused_nlp import FusedRedactCleaner
+from datacleancraft.preprocessing.pii_redactor import PIIRedactor
+
+
+@pytest.fixture
+def ruler_nlp():
+    nlp = spacy.blank("en")
+    ruler = nlp.add_pipe("entity_ruler")
+    ruler.add_patterns([{"label": "PERSON", "pattern": "John Doe"}, {"label": "GPE", "pattern": "London"}])
+    return nlp
+
+
+@pytest.fixture
+def notes():
+    return pd.DataFrame({
+        "note": [
+            "John Doe moved to London last year!",
+            "(John Doe) wrote from London's office",
+            "mail john@x.com, or call 555-123-4567",
+            None,
+            "John Doe moved to London last year!",
+        ],
+        "contact": ["John Doe a@b.com", "555-123-4567", "none", "x", "y"],
+        "count": [1, 2, 3, 4, 5],
+    })
+
+
+def make_stages(nlp, **options):
+    redactor = PIIRedactor(**options)
+    redactor.nlp = nlp
+    return redactor, TextCleaner(lite=True, nlp=nlp)
+
+
+@pytest.mark.parametrize("options", [{}, {"gate_ner": True}, {"mask_token": "<pii>"}])
+def test_fused_matches_redaction_then_cleaning(ruler_nlp, notes, options):
+    redactor, cleaner = make_stages(ruler_nlp, **options)
+    expected = cleaner.clean_text_dataframe(
+        redactor.redact_dataframe(notes.copy(), regex_only_columns=["contact"]), deduplicate=False
+    )
+
+    redactor, cleaner = make_stages(ruler_nlp, **options)
+    fused = FusedRedactCleaner(redactor, cleaner).process_dataframe(notes, regex_only_columns=["contact"])
+    pd.testing.assert_frame_equal(fused, expected)
+
+
+def test_fused_keeps_options_and_stats(ruler_nlp, notes):
+    redactor, cleaner = make_stages(ruler_nlp)
+    fused = FusedRedactCleaner(redactor, cleaner)
+
+    processed = fused.process_dataframe(notes, columns=["note"], lowercase=False, remove_stopwords_punct=False)
+    assert processed["note"][0] == "REDACTED moved to REDACTED last year"
+    assert processed["contact"].tolist() == notes["contact"].tolist()
+    assert redactor.stats["values"] == 3
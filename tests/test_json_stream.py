@@ -0,0 +1,45 @@
+import io
+import json
+import pytest
+import pandas as pd
+from datacleancraft.ingestion.json_stream import iter_json_records, read_json_batches
+
+RECORDS = [
+    {"id": 1, "name": "John", "address": {"city": "London", "zip": "N1"}},
+    {"id": 2, "name": "Jane", "address": {"city": "Paris"}, "tags": ["a", "b"]},
+    {"id": 3, "name": "Ann \"A\" [x], {y}", "score": 1.5e3},
+]
+
+def test_iter_json_array_small_blocks():
+    text = json.dumps(RECORDS, indent=2)
+    assert list(iter_json_records(io.StringIO(text), block_size=7)) == RECORDS
+
+def test_iter_ndjson_small_blocks():
+    text = "\n".join(json.dumps(r) for r in RECORDS) + "\n"
+    assert list(iter_json_records(io.StringIO(text), block_size=5)) == RECORDS
+
+def test_iter_numbers_split_across_blocks():
+    assert list(iter_json_records(io.StringIO("[12345, 678]"), block_size=3)) == [12345, 678]
+
+def test_iter_single_object():
+    assert list(iter_json_records(io.StringIO('{"a": {"b": 1}}'))) == [{"a": {"b": 1}}]
+
+def test_iter_empty_array():
+    assert list(iter_json_records(io.StringIO(" [ ] "))) == []
+
+def test_iter_truncated_array():
+    with pytest.raises(ValueError):
+        list(iter_json_records(io.StringIO('[{"a": 1},')))
+
+def test_batches_match_json_normalize(tmp_path):
+    p = tmp_path / "data.json"
+    p.write_text(json.dumps(RECORDS))
+    batches = list(read_json_batches(p, batch_size=1))
+
+    assert len(batches) == 3
+    expected = pd.json_normalize(RECORDS)
+    result = pd.concat(batches, ignore_index=True)
+    assert list(result.columns) == list(expected.columns)
+    # Later batches carry every column seen so far
+    assert list(batches[1].columns) == list(expected.columns[:len(batches[1].columns)])
+    pd.testing.assert_frame_equal(result, expected, check_dtype=False)
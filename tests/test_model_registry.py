@@ -0,0 +1,91 @@
+import threading
+
+import pytest
+import spacy
+from datacleancraft.models.model_registry import SpacyModelRegistry, ensure_package, model_key
+from datacleancraft.models.spacy_model_loader import SpacyModelLoader
+
+
+@pytest.fixture
+def model_path(tmp_path):
+    nlp = spacy.blank("en")
+    nlp.add_pipe("sentencizer")
+    nlp.add_pipe("entity_ruler")
+    path = tmp_path / "blank_en"
+    nlp.to_disk(path)
+    return str(path)
+
+
+def test_model_key_ignores_component_order():
+    assert model_key("m", ["ner", "parser"]) == model_key("m", ["parser", "ner"])
+    assert model_key("m", exclude=["ner"]) != model_key("m", disable=["ner"])
+
+
+def test_get_returns_shared_instance(model_path):
+    registry = SpacyModelRegistry()
+    first = registry.get(model_path)
+    second = registry.get(model_path)
+
+    assert first is second
+    metrics = registry.metrics()
+    assert metrics["loads"] == 1
+    assert metrics["hits"] == 1
+    assert metrics["load_seconds"] > 0
+    assert list(metrics["models"]) == [model_key(model_path)]
+
+
+def test_component_selection_is_part_of_the_key(model_path):
+    registry = SpacyModelRegistry()
+    full = registry.get(model_path)
+    lite = registry.get(model_path, exclude=["entity_ruler"])
+    disabled = registry.get(model_path, disable=["entity_ruler"])
+
+    assert full is not lite and full is not disabled
+    assert "entity_ruler" not in lite.component_names
+    assert "entity_ruler" in disabled.disabled
+    assert registry.metrics()["loads"] == 3
+
+
+def test_evict(model_path):
+    registry = SpacyModelRegistry()
+    first = registry.preload(model_path)
+    registry.preload(model_path, exclude=["entity_ruler"])
+
+    assert registry.evict(model_path, exclude=["entity_ruler"]) == 1
+    assert registry.loaded() == [model_key(model_path)]
+    assert registry.evict() == 1
+    assert registry.loaded() == []
+    assert registry.get(model_path) is not first
+    assert registry.metrics()["evictions"] == 2
+
+
+def test_concurrent_gets_load_once(model_path):
+    registry = SpacyModelRegistry()
+    results = []
+
+    def worker():
+        results.append(registry.get(model_path))
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(results) == 8
+    assert all(nlp is results[0] for nlp in results)
+    assert registry.metrics()["loads"] == 1
+
+
+def test_loader_uses_registry(model_path, monkeypatch):
+    registry = SpacyModelRegistry()
+    monkeypatch.setattr("datacleancraft.models.spacy_model_loader.model_registry", registry)
+
+    shared = SpacyModelLoader(model_name=model_path).load_model()
+    assert SpacyModelLoader(model_name=model_path).load_model() is shared
+    private = SpacyModelLoader(model_name=model_path, shared=False).load_model()
+    assert private is not shared
+
+
+def test_ensure_package_accepts_model_directory(model_path):
+    assert ensure_package(model_path) is True
@@ -0,0 +1,87 @@
+import numpy as np
+import pandas as pd
+import pytest
+from datacleancraft.preprocessing.near_duplicates import NearDuplicateDetector, optimal_bands, shingles
+
+
+@pytest.fixture
+def comments():
+    return pd.DataFrame({
+        "comment": [
+            "the delivery was really slow and the driver was rude",
+            "completely unrelated feedback about the billing page",
+            "the delivery was really slow and the driver was very rude",
+            "the delivery was really slow and the driver was rude",
+            "",
+            None,
+        ],
+        "id": range(6),
+    })
+
+
+def test_shingles_and_bands():
+    assert shingles("a b c", ngram=2) == ["a b", "b c"]
+    assert shingles("a", ngram=3) == ["a"]
+    assert shingles("  ") == []
+    bands, rows = optimal_bands(0.8, 128)
+    assert bands * rows <= 128
+    assert abs((1 / bands) ** (1 / rows) - 0.8) < 0.05
+
+
+def test_signatures_estimate_jaccard():
+    detector = NearDuplicateDetector(num_perm=256)
+    a = " ".join(f"w{i}" for i in range(100))
+    b = " ".join(f"w{i}" for i in range(20, 120))  # Jaccard 80 / 120
+    signatures = detector.signatures([a, b])
+    assert signatures.shape == (2, 256)
+    assert abs((signatures[0] == signatures[1]).mean() - 80 / 120) < 0.1
+
+
+def test_mark_clusters_near_duplicates(comments):
+    marked = NearDuplicateDetector(threshold=0.7).mark(comments, ["comment"])
+    assert marked["near_duplicate_cluster"].tolist() == [0, 1, 0, 0, 4, 5]
+    assert marked["is_near_duplicate"].tolist() == [False, False, True, True, False, False]
+
+
+def test_drop_across_chunks_with_persisted_index(comments, tmp_path):
+    detector = NearDuplicateDetector(threshold=0.7)
+    first = detector.drop(comments.iloc[:2], ["comment"])
+    detector.save(tmp_path / "index.pkl")
+
+    restored = NearDuplicateDetector.load(tmp_path / "index.pkl")
+    second = restored.drop(comments.iloc[2:], ["comment"])
+    assert first["id"].tolist() == [0, 1]
+    assert second["id"].tolist() == [4, 5]
+    assert restored.documents == 6
+
+
+def test_invalid_threshold():
+    with pytest.raises(ValueError):
+        NearDuplicateDetector(threshold=0)
+
+
+def test_max_documents_bounds_the_index():
+    texts = [f"unique text number {i} with words {i * 7} {i * 13}" for i in range(50)]
+    detector = NearDuplicateDetector(threshold=0.7, max_documents=10)
+    for start in range(0, 50, 5):
+        detector.add(texts[start:start + 5])
+        assert detector.documents - detector._offset < 20
+        assert all(document >= detector._offset for table in detector._tables for bucket in table.values() for document in bucket)
+    assert detector.documents == 50
+    assert len(detector._parent) <= 40
+
+
+def test_max_documents_window_matches():
+    detector = NearDuplicateDetector(threshold=0.7, max_documents=2)
+    repeat = ["the delivery was really slow and the driver was rude"]
+    filler = [f"filler {i} alpha beta gamma {i}" for i in range(6)]
+
+    assert detector.add(repeat).tolist() == [0]
+    # Within the window the repeat joins cluster 0
+    assert detector.add(filler[:1] + repeat).tolist() == [1, 0]
+    # Reaching 2 * max_documents held rows evicts down to the last 2 (rows 6 and 7)
+    detector.add(filler[1:])
+    assert detector._offset == 6
+    # Both repeats were evicted, so the next one starts a new cluster
+    assert detector.add(repeat).tolist() == [8]
+    assert detector.add(repeat).tolist() == [8]
@@ -0,0 +1,31 @@
+from datacleancraft.preprocessing.ner_gate import needs_ner
+
+
+def test_needs_ner_cascade():
+    texts = ["John Smith", "june 5th", "Zürich", "12345", "--", " A ", "all lowercase words", ""]
+    assert needs_ner(texts).tolist() == [True, True, True, False, False, False, False, False]
+    assert needs_ner(texts, skip_identifiers=False).tolist() == [True, True, True, True, False, False, False, False]
+
+
+def test_needs_ner_keeps_dates_times_and_amounts():
+    texts = ["2020-01-05", "10:30", "$1,200", "€ 5", "-- --"]
+    assert needs_ner(texts).tolist() == [True, True, True, True, False]
+    assert needs_ner(texts, require_capital_or_digit=False).tolist() == [True, True, True, True, False]
+
+
+def test_needs_ner_without_capital_rule():
+    assert needs_ner(["all lowercase words", "x"], require_capital_or_digit=False).tolist() == [True, False]
+
+
+def test_needs_ner_skips_identifiers():
+    texts = [
+        "12345", "1,200.50", "555-123-4567", "SKU-1042", "INV2024", "ACTIVE", "PENDING_REVIEW",
+        "3f2a9c1e-1b2c-4d5e-8f90-0123456789ab",
+    ]
+    assert not needs_ner(texts).any()
+    assert needs_ner(texts, skip_identifiers=False).all()
+
+
+def test_needs_ner_keeps_dates_and_money_shaped_like_identifiers():
+    texts = ["2020-01-05", "05/06/2023 10:30", "10:30", "2024", "$1,200", "Order AB-12 for John Smith"]
+    assert needs_ner(texts).all()
@@ -0,0 +1,56 @@
+import re
+import string
+import pytest
+import pandas as pd
+from datacleancraft.preprocessing.normalization import normalize_text, normalize_text_series, normalize_texts
+from datacleancraft.preprocessing.unique import string_mask
+
+
+def reference_normalize(text, lowercase=True):
+    if lowercase:
+        text = text.lower()
+    text = "".join(c for c in text if c in string.printable and (c.isalnum() or c.isspace()))
+    text = re.sub(r'[^a-zA-Z0-9\s]', '', text)
+    return " ".join(text.split())
+
+
+def test_normalize_text_matches_character_filter():
+    texts = [
+        "Hello, World!!!",
+        "  Café\tcrème\n brûlée  ",
+        "Version 2.0 — released ’24",
+        "İstanbul KELVIN \x1c sign \xa0 nbsp",
+        "",
+        "😀 emoji only 😀",
+    ]
+    for lowercase in (True, False):
+        expected = [reference_normalize(text, lowercase) for text in texts]
+        assert [normalize_text(text, lowercase) for text in texts] == expected
+        assert normalize_texts(texts, lowercase) == expected
+
+
+def test_normalize_text_series_keeps_non_strings():
+    series = pd.Series(["  A  b ", None, 42, "A  b", "x!"], name="notes")
+    result = normalize_text_series(series)
+
+    assert result.tolist() == ["a b", None, 42, "a b", "x"]
+    assert result.name == "notes"
+    pd.testing.assert_series_equal(result, normalize_text_series(series, factorize=False))
+
+
+def test_string_mask():
+    series = pd.Series(["a", None, 1, "b"])
+    assert string_mask(series).tolist() == [True, False, False, True]
+
+
+@pytest.mark.parametrize("dtype", [object, "string", "string[pyarrow]", "category"])
+def test_string_mask_uses_column_dtype(dtype):
+    series = pd.Series(["a", None, "b", "a"], dtype=dtype)
+    assert string_mask(series).tolist() == [True, False, True, True]
+
+
+def test_string_mask_mixed_columns():
+    assert string_mask(pd.Series(["a", "b"])).tolist() == [True, True]
+    assert string_mask(pd.Series(pd.Categorical(["a", 1, None]))).tolist() == [True, False, False]
+    assert string_mask(pd.Series([1.0, None])).tolist() == [False, False]
+    assert string_mask(pd.Series([None, None], dtype=object)).tolist() == [False, False]
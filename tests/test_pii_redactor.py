@@ -0,0 +1,75 @@
+import pandas as pd
+import pytest
+import spacy
+from datacleancraft.preprocessing.pii_redactor import PIIRedactor, ner_components
+
+
+@pytest.fixture
+def ruler_nlp():
+    nlp = spacy.blank("en")
+    nlp.add_pipe("sentencizer")
+    ruler = nlp.add_pipe("entity_ruler")
+    ruler.add_patterns([{"label": "PERSON", "pattern": "John Doe"}, {"label": "GPE", "pattern": "London"}])
+    return nlp
+
+
+@pytest.fixture
+def redactor(ruler_nlp):
+    redactor = PIIRedactor()
+    redactor.nlp = ruler_nlp
+    return redactor
+
+
+def test_ner_components_keep_only_entity_pipes(ruler_nlp):
+    assert ner_components(ruler_nlp) == ["entity_ruler"]
+
+
+def test_redact_dataframe_batched_matches_redact_text(redactor):
+    df = pd.DataFrame({
+        "note": ["John Doe moved to London", "call 555-123-4567", None, "John Doe moved to London", "mail a@b.com"],
+        "count": [1, 2, 3, 4, 5],
+    })
+    expected = df["note"].apply(redactor.redact_text)
+    redactor.cache_clear()
+
+    batched = redactor.redact_dataframe(df.copy(), batch_size=2)
+    assert batched["note"].tolist() == expected.tolist()
+    assert batched["note"][0] == "[REDACTED] moved to [REDACTED]"
+    assert batched["count"].tolist() == [1, 2, 3, 4, 5]
+
+    unfactorized = redactor.redact_dataframe(df.copy(), batch_size=2, factorize=False)
+    assert unfactorized["note"].tolist() == expected.tolist()
+
+
+def test_gated_redaction_skips_ner_for_codes(ruler_nlp):
+    redactor = PIIRedactor(gate_ner=True)
+    redactor.nlp = ruler_nlp
+    df = pd.DataFrame({"note": ["John Doe moved to London", "pending", "--", "ssn 123-45-6789"]})
+
+    redacted = redactor.redact_dataframe(df)
+    assert redacted["note"].tolist() == ["[REDACTED] moved to [REDACTED]", "pending", "--", "ssn [REDACTED]"]
+    assert redactor.stats == {"values": 4, "ner_values": 2, "skipped_by_gate": 2, "skipped_by_profile": 0}
+
+
+def test_column_profile_turns_ner_off(ruler_nlp):
+    redactor = PIIRedactor(profile_sample_size=10)
+    redactor.nlp = ruler_nlp
+    df = pd.DataFrame({
+        "status": ["Open", "Closed", "Open"],
+        "note": ["John Doe moved to London", "Fine", "Fine"],
+    })
+
+    redacted = redactor.redact_dataframe(df)
+    assert redactor.column_profiles == {"status": False, "note": True}
+    assert redacted["note"][0] == "[REDACTED] moved to [REDACTED]"
+    assert redactor.stats["skipped_by_profile"] == 2
+
+
+def test_regex_only_columns_skip_ner(ruler_nlp):
+    redactor = PIIRedactor()
+    redactor.nlp = ruler_nlp
+    df = pd.DataFrame({"contact": ["John Doe, a@b.com", None, "555-123-4567"], "note": ["John Doe", "x", "y"]})
+
+    redacted = redactor.redact_dataframe(df, regex_only_columns=["contact"])
+    assert redacted["contact"].tolist() == ["John Doe, [REDACTED]", None, "[REDACTED]"]
+    assert redacted["note"][0] == "[REDACTED]"
@@ -0,0 +1,109 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+from datacleancraft.ingestion.reader import load_data
+from datacleancraft.pipeline import DataCleaningPipeline, per_file_output_paths
+from datacleancraft.utils.error_handler import PipelineError
+from datacleancraft.validation.anomaly_detector import AnomalyDetector
+
+
+def test_per_file_outputs_mirror_input_directories(tmp_path):
+    paths = [Path("in/a/part.csv"), Path("in/b/part.csv.gz"), Path("in/other.json")]
+    targets = per_file_output_paths(paths, tmp_path, "csv")
+
+    assert targets == {
+        paths[0]: tmp_path / "a" / "part.csv",
+        paths[1]: tmp_path / "b" / "part.csv",
+        paths[2]: tmp_path / "other.csv",
+    }
+
+
+def test_per_file_outputs_keep_suffix_when_stems_clash(tmp_path):
+    paths = [Path("in/data.csv"), Path("in/data.json"), Path("in/single.xml")]
+    targets = per_file_output_paths(paths, tmp_path, "json")
+
+    assert targets[paths[0]] == tmp_path / "data.csv.json"
+    assert targets[paths[1]] == tmp_path / "data.json.json"
+    assert targets[paths[2]] == tmp_path / "single.json"
+    assert len(set(targets.values())) == len(paths)
+
+
+def test_per_file_outputs_raise_on_remaining_clash(tmp_path):
+    # data.csv.gz and data.csv are the same file once decompressed
+    with pytest.raises(PipelineError, match="same output file"):
+        per_file_output_paths([Path("in/data.csv"), Path("in/data.csv.gz")], tmp_path, "csv")
+
+
+def export_chunks(tmp_path, chunks, **options):
+    output_path = tmp_path / "out.csv"
+    pipeline = DataCleaningPipeline("unused.csv", str(output_path), chunk_size=2, **options)
+    pipeline.process = lambda df: df
+    rows = pipeline._process_and_export(iter(chunks), output_path)
+    return rows, output_path
+
+
+def test_chunked_export_fails_on_new_columns(tmp_path):
+    chunks = [pd.DataFrame({"a": [1, 2]}), pd.DataFrame({"a": [3], "b": ["secret"]})]
+    with pytest.raises(PipelineError, match=r"Chunk 2 .* \['b'\]"):
+        export_chunks(tmp_path, chunks)
+
+
+def test_chunked_export_drops_new_columns_when_allowed(tmp_path):
+    chunks = [pd.DataFrame({"a": [1, 2], "c": [0, 0]}), pd.DataFrame({"a": [3], "b": ["secret"]})]
+    rows, output_path = export_chunks(tmp_path, chunks, drop_new_columns=True)
+
+    assert rows == 3
+    result = pd.read_csv(output_path)
+    assert list(result.columns) == ["a", "c"]
+    assert result["a"].tolist() == [1, 2, 3]
+    assert result["c"].isna().tolist() == [False, False, True]
+
+
+def test_chunked_multi_file_export_unifies_schema(tmp_path):
+    (tmp_path / "in").mkdir()
+    (tmp_path / "in" / "part-1.csv").write_text("a,b\n1,x\n2,y\n")
+    (tmp_path / "in" / "part-2.csv").write_text("a,c\n3,secret\n")
+    output_path = tmp_path / "out.csv"
+    pipeline = DataCleaningPipeline(str(tmp_path / "in"), str(output_path), chunk_size=2)
+    pipeline.process = lambda df: df
+
+    assert pipeline._process_and_export(load_data(tmp_path / "in", chunk_size=2), output_path) == 3
+    result = pd.read_csv(output_path)
+    assert list(result.columns) == ["a", "b", "c"]
+    assert result["c"].tolist()[2] == "secret"
+
+
+def test_chunked_run_keeps_anomaly_columns_when_first_chunk_is_not_scored(tmp_path):
+    input_path = tmp_path / "input.csv"
+    input_path.write_text("a,b,t\n,1,hello\n,2,world\n3,4,foo\n5,6,bar\n")
+    output_path = tmp_path / "out.csv"
+
+    pipeline = DataCleaningPipeline(str(input_path), str(output_path), chunk_size=2, redact_pii_enabled=False)
+    pipeline.run()
+
+    result = pd.read_csv(output_path)
+    assert list(result.columns) == ["a", "b", "t", "anomaly_score", "is_anomaly"]
+    assert len(result) == 4
+    assert result["anomaly_score"].isna().tolist() == [True, True, False, False]
+    assert result["is_anomaly"].iloc[:2].tolist() == [False, False]
+
+
+def test_chunked_training_samples_every_chunk_before_scoring(tmp_path):
+    rng = np.random.default_rng(0)
+    chunks = [pd.DataFrame(rng.normal(loc=10 * i, size=(100, 4)), columns=list("abcd")) for i in range(4)]
+    output_path = tmp_path / "out.csv"
+    pipeline = DataCleaningPipeline("unused.csv", str(output_path), chunk_size=100, train_anomaly_model=True)
+    pipeline.clean = lambda df: df
+    pipeline.near_duplicate_detector = None
+    pipeline.anomaly_detector = AnomalyDetector(
+        train_if_missing=True, registry_dir=str(tmp_path / "models"), training_options={"epochs": 2}
+    )
+
+    assert pipeline._process_and_export(iter(chunks), output_path) == 400
+    result = pd.read_csv(output_path)
+    assert list(result.columns) == ["a", "b", "c", "d", "anomaly_score", "is_anomaly"]
+    assert result["anomaly_score"].notna().all()
+    assert pipeline.anomaly_detector.metadata["rows"] == 400
+    assert pipeline.anomaly_detector.scaler.mean == pytest.approx(np.full(4, 15), abs=1)
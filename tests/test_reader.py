@@ -1,5 +1,7 @@
 import pytest
-from datacleancraft.ingestion.reader import read_file
+import gzip
+import json
+from datacleancraft.ingestion.reader import read_file, load_data, resolve_inputs, scan_columns
 import pandas as pd
 
 def test_read_csv(tmp_path):
@@ -14,3 +16,108 @@ def test_unsupported_format(tmp_path):
     p.write_text("some content")
     with pytest.raises(ValueError):
         read_file(p)
+
+def test_load_data_chunked_csv(tmp_path):
+    p = tmp_path / "test.csv"
+    p.write_text("col1,col2\n" + "".join(f"{i},{i * 2}\n" for i in range(5)))
+    chunks = list(load_data(p, chunk_size=2))
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    pd.testing.assert_frame_equal(pd.concat(chunks), load_data(p))
+
+def test_load_data_chunked_json(tmp_path):
+    p = tmp_path / "test.json"
+    p.write_text('{"a": 1}\n{"a": 2}\n{"a": 3}\n')
+    chunks = list(load_data(p, format="json", chunk_size=2))
+    assert [len(chunk) for chunk in chunks] == [2, 1]
+
+def test_load_data_invalid_chunk_size(tmp_path):
+    p = tmp_path / "test.csv"
+    p.write_text("col1\n1\n")
+    with pytest.raises(ValueError, match="chunk_size"):
+        load_data(p, chunk_size=0)
+
+def test_read_json_file(tmp_path):
+    records = [{"a": 1, "b": {"c": "x"}}, {"a": 2, "b": {"c": "y"}}]
+    p = tmp_path / "test.json"
+    p.write_text(json.dumps(records))
+    pd.testing.assert_frame_equal(read_file(p), pd.json_normalize(records))
+    assert [len(chunk) for chunk in read_file(p, chunk_size=1)] == [1, 1]
+
+def test_read_json_batches_match_json_normalize_with_all_null_batch(tmp_path, monkeypatch):
+    monkeypatch.setattr("datacleancraft.ingestion.reader.DEFAULT_BATCH_SIZE", 3)
+    # Every column is entirely missing in one of the two batches
+    records = [{"a": None, "b": 1, "c": "x", "d": True}] * 3 + [{"a": 1.5, "b": None, "c": None, "d": False, "e": 2}] * 3
+    p = tmp_path / "test.json"
+    p.write_text(json.dumps(records))
+    df = read_file(p)
+    pd.testing.assert_frame_equal(df, pd.json_normalize(records))
+    assert df["b"].dtype == "float64"
+
+def test_load_data_infers_ndjson(tmp_path):
+    p = tmp_path / "test.jsonl"
+    p.write_text('{"a": 1, "b": {"c": "x"}}\n{"a": 2, "b": {"c": "y"}}\n')
+    df = load_data(p)
+    assert list(df.columns) == ["a", "b.c"]
+    assert df.shape == (2, 2)
+
+def test_read_xml_one_row_per_record(tmp_path):
+    p = tmp_path / "test.xml"
+    p.write_text("<rows><row><a>1</a></row><row><a>2</a></row></rows>")
+    df = read_file(p)
+    assert df.shape == (2, 1)
+    assert [len(chunk) for chunk in read_file(p, chunk_size=1)] == [1, 1]
+
+def test_load_data_csv_projection(tmp_path):
+    p = tmp_path / "test.csv"
+    p.write_text("a,b,c\n1,2,3\n")
+    assert list(load_data(p, columns=["c", "a"]).columns) == ["c", "a"]
+
+def test_load_data_pyarrow_engine(tmp_path):
+    pytest.importorskip("pyarrow")
+    p = tmp_path / "test.csv"
+    p.write_text("a,b,c\n1,x,1.5\n2,y,2.5\n")
+    pd.testing.assert_frame_equal(load_data(p, engine="pyarrow"), load_data(p, engine="c"))
+    assert [len(chunk) for chunk in load_data(p, engine="pyarrow", chunk_size=1)] == [1, 1]
+
+def test_load_data_invalid_engine(tmp_path):
+    p = tmp_path / "test.csv"
+    p.write_text("a\n1\n")
+    with pytest.raises(ValueError, match="Unsupported CSV engine"):
+        load_data(p, engine="fast")
+
+def test_resolve_inputs_directory_and_glob(tmp_path):
+    (tmp_path / "part-2.csv").write_text("a\n2\n")
+    (tmp_path / "part-1.csv").write_text("a\n1\n")
+    (tmp_path / "notes.md").write_text("ignored")
+    assert [p.name for p in resolve_inputs(tmp_path)] == ["part-1.csv", "part-2.csv"]
+    assert [p.name for p in resolve_inputs(str(tmp_path / "part-*.csv"))] == ["part-1.csv", "part-2.csv"]
+    with pytest.raises(FileNotFoundError):
+        resolve_inputs(str(tmp_path / "missing-*.csv"))
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_load_data_multiple_files_unifies_schema(tmp_path, executor):
+    (tmp_path / "part-1.csv").write_text("a,b\n1,x\n")
+    (tmp_path / "part-2.json").write_text('[{"a": 2, "c": true}]')
+    df = load_data(tmp_path, workers=2, executor=executor)
+    assert list(df.columns) == ["a", "b", "c"]
+    assert df["a"].tolist() == [1, 2]
+    assert df["b"].isna().tolist() == [False, True]
+
+def test_load_data_multiple_files_chunked(tmp_path):
+    (tmp_path / "part-1.csv").write_text("a\n1\n2\n3\n")
+    (tmp_path / "part-2.csv").write_text("a\n4\n")
+    chunks = list(load_data(tmp_path, chunk_size=2))
+    assert [chunk["a"].tolist() for chunk in chunks] == [[1, 2], [3], [4]]
+
+def test_load_data_multiple_files_chunked_unifies_schema(tmp_path):
+    (tmp_path / "part-1.csv").write_text("a,b\n1,x\n2,y\n3,z\n")
+    (tmp_path / "part-2.csv.gz").write_bytes(gzip.compress(b"a,c\n4,secret\n"))
+    (tmp_path / "part-3.json").write_text('[{"a": 5, "d": true}]')
+    assert list(scan_columns(resolve_inputs(tmp_path))) == ["a", "b", "c", "d"]
+
+    chunks = list(load_data(tmp_path, chunk_size=2))
+    assert all(list(chunk.columns) == ["a", "b", "c", "d"] for chunk in chunks)
+    df = pd.concat(chunks, ignore_index=True)
+    assert df["a"].tolist() == [1, 2, 3, 4, 5]
+    assert df["c"].tolist()[3] == "secret"
+    assert chunks[-1]["d"].tolist() == [True]
@@ -0,0 +1,57 @@
+import pytest
+import spacy
+from datacleancraft.preprocessing.redaction import RedactionEngine, merge_spans
+
+
+@pytest.fixture
+def ruler_nlp():
+    nlp = spacy.blank("en")
+    ruler = nlp.add_pipe("entity_ruler")
+    ruler.add_patterns([{"label": "PERSON", "pattern": "John"}, {"label": "GPE", "pattern": "London"}])
+    return nlp
+
+
+def test_merge_spans():
+    spans = [(10, 15, "B"), (0, 4, "A"), (2, 6, "C"), (6, 8, "D")]
+    assert merge_spans(spans) == [(0, 6), (6, 8), (10, 15)]
+
+
+def test_redact_masks_only_detected_spans(ruler_nlp):
+    engine = RedactionEngine()
+    text = "John lives in London; Johnson too"
+    assert engine.redact(text, ruler_nlp(text)) == "[REDACTED] lives in [REDACTED]; Johnson too"
+
+
+def test_regex_detectors_scan_once():
+    engine = RedactionEngine(mask_token="#")
+    text = "mail john.doe@ex.com, ssn 123-45-6789"
+    assert [label for _, _, label in engine.regex_spans(text)] == ["EMAIL", "SSN"]
+    assert engine.redact(text) == "mail #, ssn #"
+
+
+def test_overlapping_entity_and_regex_spans(ruler_nlp):
+    engine = RedactionEngine()
+    text = "write to John@London.com"
+    assert engine.redact(text, ruler_nlp(text)) == "write to [REDACTED]"
+
+
+def test_add_pattern():
+    engine = RedactionEngine()
+    engine.add_pattern("IBAN", r"\bGB\d{2}[A-Z]{4}\d{14}\b")
+    assert list(engine.patterns) == ["EMAIL", "SSN", "PHONE", "IBAN"]
+    assert engine.redact("pay GB82WEST12345698765432 now") == "pay [REDACTED] now"
+    with pytest.raises(ValueError):
+        engine.add_pattern("not an identifier", "x")
+    with pytest.raises(ValueError):
+        engine.add_pattern("BROKEN", "(")
+
+
+def test_redact_array_matches_redact():
+    engine = RedactionEngine()
+    texts = ["mail john.doe@ex.com", "call 555-123-4567 or (555) 123 4567", "ssn 123-45-6789", "nothing", ""]
+    assert engine.redact_array(texts).tolist() == [engine.redact(text) for text in texts]
+
+
+def test_redact_array_falls_back_for_lookarounds():
+    engine = RedactionEngine(mask_token="\\1", patterns={"ID": r"(?<=id )\d+"})
+    assert engine.redact_array(["id 42", "no id"]).tolist() == ["id \\1", "no id"]
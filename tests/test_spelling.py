@@ -0,0 +1,75 @@
+import importlib.util
+from pathlib import Path
+
+import pytest
+from datacleancraft.preprocessing import spelling
+from datacleancraft.preprocessing.spelling import SpellingCorrector, SymSpellIndex, edit_distance, within_one_edit
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("DATACLEANCRAFT_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(spelling, "_INDEXES", {})
+    return tmp_path / "cache"
+
+
+@pytest.fixture
+def dictionary(tmp_path):
+    path = tmp_path / "words.txt"
+    path.write_text(";;; comment\nhello 50\nhelp 20\nworld 30\nword 40\nspelling 5\n")
+    return path
+
+
+def test_edit_distance():
+    assert edit_distance("hello", "hello", 2) == 0
+    assert edit_distance("hlelo", "hello", 2) == 1
+    assert edit_distance("helo", "hello", 2) == 1
+    assert edit_distance("abc", "xyz", 2) == 3
+    # A transposition followed by an insertion in the same place, as TextBlob chains edits
+    assert edit_distance("reicve", "receive", 2) == 2
+    assert edit_distance("ca", "abc", 3) == 2
+
+
+def test_within_one_edit():
+    assert within_one_edit("teh", "the")
+    assert within_one_edit("helo", "hello")
+    assert within_one_edit("hello", "jello")
+    assert within_one_edit("same", "same")
+    assert not within_one_edit("ab", "ba c")
+    assert not within_one_edit("abcd", "badc")
+
+
+def test_lookup_prefers_distance_then_frequency():
+    index = SymSpellIndex({"hello": 50, "help": 20, "world": 30, "word": 40}, max_edit_distance=2)
+    assert index.lookup("hello") == "hello"
+    assert index.lookup("helo") == "hello"
+    assert index.lookup("wrld") == "world"
+    assert index.lookup("wor") == "word"
+    assert index.lookup("xyzzy") is None
+    assert index.lookup("hepl", max_edit_distance=0) is None
+
+
+def test_corrector_persists_index_and_memoizes(cache_dir, dictionary):
+    corrector = SpellingCorrector(dictionary_path=dictionary)
+    assert corrector.correct("helo wrld Spellng 1.5 !") == "hello world Spelling 1.5 !"
+    assert list((cache_dir / "spelling").glob("*.pkl"))
+
+    corrector.correct("helo")
+    assert corrector.cache_info().hits == 1
+
+
+def test_corrector_matches_textblob(cache_dir):
+    textblob = pytest.importorskip("textblob")
+    corrector = SpellingCorrector()
+    for word in ["speling", "recieve", "teh", "wrld", "Helo", "acheive", "seperate", "xyzzy"]:
+        assert corrector.correct_word(word) == str(textblob.Word(word).correct())
+
+
+def test_corrector_matches_textblob_on_benchmark_words(cache_dir):
+    pytest.importorskip("textblob")
+    path = Path(__file__).resolve().parents[1] / "benchmarks" / "bench_spelling.py"
+    spec = importlib.util.spec_from_file_location("bench_spelling", path)
+    bench = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(bench)
+
+    assert bench.spelling_corrector_correct(bench.WORDS) == bench.textblob_correct(bench.WORDS)
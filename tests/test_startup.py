@@ -0,0 +1,45 @@
+import json
+import subprocess
+import sys
+
+import pytest
+
+# Import of the CLI must stay well below the several seconds torch and spaCy take
+IMPORT_BUDGET_SECONDS = 2.0
+HEAVY_MODULES = ["torch", "spacy", "openai", "fastapi"]
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+seconds = time.perf_counter() - start
+print(json.dumps({{"seconds": seconds, "heavy": [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+
+def import_in_subprocess(module):
+    output = subprocess.run(
+        [sys.executable, "-c", PROBE.format(module=module, heavy=HEAVY_MODULES)],
+        check=True, capture_output=True, text=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+@pytest.mark.parametrize("module", ["datacleancraft.cli", "datacleancraft.pipeline", "datacleancraft.models"])
+def test_import_does_not_load_heavy_dependencies(module):
+    assert import_in_subprocess(module)["heavy"] == []
+
+
+def test_cli_import_time_budget():
+    # Best of a few runs, so a busy machine does not fail the check
+    seconds = min(import_in_subprocess("datacleancraft.cli")["seconds"] for _ in range(3))
+    assert seconds < IMPORT_BUDGET_SECONDS
+
+
+def test_models_exports_resolve_lazily():
+    import datacleancraft.models as models
+
+    assert models.SpacyModelLoader.__name__ == "SpacyModelLoader"
+    assert "model_registry" in dir(models)
+    with pytest.raises(AttributeError):
+        models.missing_name
@@ -0,0 +1,33 @@
+import pandas as pd
+from datacleancraft.preprocessing.unique import map_unique_strings
+
+
+def test_map_unique_strings_transforms_each_value_once():
+    seen = []
+
+    def upper(texts):
+        seen.extend(texts)
+        return [text.upper() for text in texts]
+
+    series = pd.Series(["a", "b", "a", None, 3, "b"], name="col")
+    result = map_unique_strings(series, upper)
+
+    assert result.tolist() == ["A", "B", "A", None, 3, "B"]
+    assert result.name == "col"
+    assert sorted(seen) == ["a", "b"]
+
+
+def test_map_unique_strings_matches_apply():
+    series = pd.Series(["x", "y", "x", float("nan")])
+    expected = series.apply(lambda value: value * 2 if isinstance(value, str) else value)
+    result = map_unique_strings(series, lambda texts: [text * 2 for text in texts], factorize=False)
+    pd.testing.assert_series_equal(result, expected)
+
+
+def test_map_unique_strings_categorical_and_non_text():
+    categorical = pd.Series(["a", "b", "a"], dtype="category")
+    result = map_unique_strings(categorical, lambda texts: [text + "!" for text in texts])
+    assert result.tolist() == ["a!", "b!", "a!"]
+
+    numbers = pd.Series([1, 2, 3])
+    pd.testing.assert_series_equal(map_unique_strings(numbers, lambda texts: texts), numbers)
@@ -31,3 +31,19 @@ def test_unsupported_format(tmp_path, sample_dataframe):
 
     with pytest.raises(ValueError, match="Unsupported export format"):
         export_data(sample_dataframe, file_path, format="unsupported")
+
+def test_export_csv_append(tmp_path, sample_dataframe):
+    file_path = tmp_path / "test_output.csv"
+    export_data(sample_dataframe.iloc[:1], file_path, format="csv")
+    export_data(sample_dataframe.iloc[1:], file_path, format="csv", append=True)
+
+    df_read = pd.read_csv(file_path)
+    pd.testing.assert_frame_equal(df_read, sample_dataframe)
+
+def test_export_json_append(tmp_path, sample_dataframe):
+    file_path = tmp_path / "test_output.json"
+    export_data(sample_dataframe.iloc[:1], file_path, format="json")
+    export_data(sample_dataframe.iloc[1:], file_path, format="json", append=True)
+
+    df_read = pd.read_json(file_path, lines=True)
+    pd.testing.assert_frame_equal(df_read, sample_dataframe)
@@ -0,0 +1,45 @@
+import pytest
+import pandas as pd
+from datacleancraft.ingestion.xml_stream import detect_record_tag, iter_xml_records, read_xml_batches
+
+FEED = """<?xml version="1.0"?>
+<export>
+  <meta><generated>2024-01-01</generated></meta>
+  <customers>
+    <customer id="1"><name>John</name><address><city>London</city></address></customer>
+    <customer id="2"><name>Jane</name><phone>1</phone><phone>2</phone></customer>
+    <customer id="3"><name>Ann</name></customer>
+  </customers>
+</export>
+"""
+
+@pytest.fixture
+def feed_path(tmp_path):
+    p = tmp_path / "feed.xml"
+    p.write_text(FEED)
+    return p
+
+def test_detect_record_tag(feed_path):
+    assert detect_record_tag(feed_path) == "customer"
+
+def test_iter_xml_records(feed_path):
+    records = list(iter_xml_records(feed_path))
+    assert len(records) == 3
+    assert records[0] == {"@id": "1", "name": "John", "address": {"city": "London"}}
+    assert records[1]["phone"] == ["1", "2"]
+
+def test_explicit_record_tag(feed_path):
+    assert list(iter_xml_records(feed_path, record_tag="meta")) == [{"generated": "2024-01-01"}]
+
+def test_read_xml_batches(feed_path):
+    batches = list(read_xml_batches(feed_path, batch_size=2))
+    assert [len(batch) for batch in batches] == [2, 1]
+
+    df = pd.concat(batches, ignore_index=True)
+    assert list(df.columns) == ["@id", "name", "address.city", "phone"]
+    assert df["name"].tolist() == ["John", "Jane", "Ann"]
+
+def test_leaf_records(tmp_path):
+    p = tmp_path / "items.xml"
+    p.write_text("<items><item>a</item><item>b</item></items>")
+    assert list(iter_xml_records(p)) == [{"item": "a"}, {"item": "b"}]